@@ -1,7 +1,7 @@
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin
 from django.contrib.auth.models import User
-from .models import JobListing, UserProfile, EmployerProfile, JobApplication, SavedJob, RejectionReason, PricingPackage, PricingFeature, ComparisonTable, ComparisonRow, BlogPost, BlogCategory, BlogPostCategory, EmployerNotification
+from .models import JobListing, UserProfile, EmployerProfile, JobApplication, SavedJob, RejectionReason, PricingPackage, PricingFeature, ComparisonTable, ComparisonRow, BlogPost, BlogCategory, BlogPostCategory, EmployerNotification, ArchivedNotification
 from import_export.admin import ImportExportModelAdmin, ImportExportActionModelAdmin
 from import_export import resources
 from rangefilter.filters import DateRangeFilter
@@ -603,12 +603,12 @@ class EmployerNotificationResource(resources.ModelResource):
     class Meta:
         model = EmployerNotification
         fields = ('id', 'employer_profile__company_name', 'job_title', 
-                 'notification_type', 'message', 'is_read', 'created_at')
+                 'notification_type', 'message', 'event_count', 'latest_actor', 'is_read', 'created_at', 'last_event_at')
 
 @admin.register(EmployerNotification)
 class EmployerNotificationAdmin(ImportExportModelAdmin):
     resource_class = EmployerNotificationResource
-    list_display = ('get_employer', 'job_title', 'notification_type', 'is_read', 'created_at')
+    list_display = ('get_employer', 'job_title', 'notification_type', 'event_count', 'is_read', 'created_at', 'last_event_at')
     list_filter = ('notification_type', 'is_read', ('created_at', DateRangeFilter))
     search_fields = ('employer_profile__company_name', 'job_title', 'message')
     date_hierarchy = 'created_at'
@@ -616,4 +616,17 @@ class EmployerNotificationAdmin(ImportExportModelAdmin):
     def get_employer(self, obj):
         return obj.employer_profile.company_name
     get_employer.short_description = 'Employer'
-    get_employer.admin_order_field = 'employer_profile__company_name'
\ No newline at end of file
+    get_employer.admin_order_field = 'employer_profile__company_name'
+
+@admin.register(ArchivedNotification)
+class ArchivedNotificationAdmin(admin.ModelAdmin):
+    list_display = ('recipient_kind', 'recipient_id', 'notification_type', 'job_title', 'event_count', 'created_at', 'archived_at')
+    list_filter = ('recipient_kind', 'notification_type', ('created_at', DateRangeFilter))
+    search_fields = ('job_title', 'message')
+    date_hierarchy = 'created_at'
+    
+    def has_add_permission(self, request):
+        return False
+    
+    def has_change_permission(self, request, obj=None):
+        return False
\ No newline at end of file
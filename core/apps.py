@@ -5,5 +5,6 @@ class CoreConfig(AppConfig):
     name = 'core'
 
     def ready(self):
-        # Import signals
-        import core.signals
\ No newline at end of file
+        # Import signals and system checks
+        import core.signals
+        import core.checks
\ No newline at end of file
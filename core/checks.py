@@ -0,0 +1,32 @@
+from django.conf import settings
+from django.core.checks import Warning, register
+
+# Cache backends whose entries only the process that wrote them can see
+PROCESS_LOCAL_CACHE_BACKENDS = (
+    'django.core.cache.backends.locmem.LocMemCache',
+    'django.core.cache.backends.dummy.DummyCache',
+)
+
+
+@register()
+def check_shared_cache(app_configs, **kwargs):
+    """
+    Warn when the default cache isn't shared between processes
+
+    The reference data generation, the platform statistics and the expiry
+    lock are only seen by other workers and management commands through a
+    shared cache.
+    """
+    backend = settings.CACHES.get('default', {}).get('BACKEND', '')
+    if backend not in PROCESS_LOCAL_CACHE_BACKENDS:
+        return []
+    return [
+        Warning(
+            f"The default cache ({backend}) is private to each process.",
+            hint=(
+                "Reference data changes, platform statistics and the job expiry lock won't reach other "
+                "workers. Use a shared backend such as the DatabaseCache in jobsy/settings.py."
+            ),
+            id='core.W001',
+        )
+    ]
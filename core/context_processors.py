@@ -1,72 +1,39 @@
-from core.models import JobListing, RejectionReason
-from django.utils import timezone
-from core.repositories.notification_repository import NotificationRepository
+from django.utils.functional import SimpleLazyObject
+from core.services.reference_data_service import ReferenceDataService
+from core.viewer import Viewer
+
+# The values below are lazy: the profile query of the shared Viewer only runs
+# if a template actually reads one of them.
 
 def employer_premium_status(request):
     """
     Add employer premium status to the template context.
     """
-    context = {
-        'has_premium_plus_access': False
+    return {
+        'has_premium_plus_access': SimpleLazyObject(lambda: Viewer.for_request(request).has_cv_database_access)
     }
-    
-    if request.user.is_authenticated:
-        try:
-            # Check if user is an employer
-            if hasattr(request.user, 'userprofile') and request.user.userprofile.role == 'employer':
-                employer_profile = request.user.userprofile.employer_profile
-                
-                # Use has_cv_database_access flag for determining premium+ access
-                context['has_premium_plus_access'] = employer_profile.has_cv_database_access
-        except:
-            pass
-    
-    return context 
 
 def employer_notifications(request):
     """
     Add unread notification count for employer users to all templates.
     """
-    context = {
-        'unread_notification_count': 0
+    return {
+        'unread_notification_count': SimpleLazyObject(lambda: Viewer.for_request(request).employer_unread_notification_count)
     }
-    
-    if request.user.is_authenticated:
-        try:
-            # Check if user is an employer
-            if hasattr(request.user, 'userprofile') and request.user.userprofile.role == 'employer':
-                employer_profile = request.user.userprofile.employer_profile
-                
-                # Get unread notification count
-                context['unread_notification_count'] = NotificationRepository.get_unread_notification_count(employer_profile)
-        except:
-            pass
-    
-    return context
 
 def candidate_notifications(request):
     """
     Add unread notification count for candidate users to all templates.
     """
-    context = {
-        'candidate_unread_notification_count': 0
+    return {
+        'candidate_unread_notification_count': SimpleLazyObject(lambda: Viewer.for_request(request).candidate_unread_notification_count)
     }
-    
-    if request.user.is_authenticated:
-        try:
-            # Check if user is a candidate
-            if hasattr(request.user, 'userprofile') and request.user.userprofile.role == 'candidate':
-                # Get unread notification count
-                context['candidate_unread_notification_count'] = NotificationRepository.get_candidate_unread_notification_count(request.user)
-        except:
-            pass
-    
-    return context 
 
 def rejection_reasons(request):
     """
     Add rejection reasons to the context of all templates
+    (read from the reference-data cache, only by pages with the rejection modal)
     """
     return {
-        'rejection_reasons': RejectionReason.objects.all()
-    } 
\ No newline at end of file
+        'rejection_reasons': SimpleLazyObject(ReferenceDataService.rejection_reasons)
+    }
@@ -196,7 +196,7 @@ class EmployerProfileForm(forms.ModelForm):
     class Meta:
         model = EmployerProfile
         fields = ('company_name', 'company_id', 'phone_number', 'show_phone_number', 'company_website', 'company_description', 'company_logo',
-                 'company_size', 'industry', 'location')
+                 'company_size', 'industry', 'location', 'notification_digest')
         widgets = {
             'company_name': forms.TextInput(attrs={
                 'class': 'form-control',
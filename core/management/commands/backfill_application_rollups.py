@@ -0,0 +1,42 @@
+import logging
+from django.core.management.base import BaseCommand, CommandError
+from core.models import EmployerProfile, ApplicationDailyStat
+from core.services.application_stats_service import ApplicationStatsService
+
+logger = logging.getLogger(__name__)
+
+class Command(BaseCommand):
+    help = 'Rebuilds the daily application rollup used by the employer analytics charts'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--employer',
+            type=int,
+            help='Only rebuild the rollup of the employer profile with this ID',
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Only show how many rollup rows exist without rebuilding them',
+        )
+
+    def handle(self, *args, **options):
+        employer_profile = None
+        if options['employer']:
+            try:
+                employer_profile = EmployerProfile.all_objects.get(pk=options['employer'])
+            except EmployerProfile.DoesNotExist:
+                raise CommandError(f"Employer profile {options['employer']} does not exist")
+
+        existing = ApplicationDailyStat.objects.all()
+        if employer_profile:
+            existing = existing.filter(employer_profile=employer_profile)
+
+        if options['dry_run']:
+            self.stdout.write(self.style.SUCCESS(f'Would rebuild {existing.count()} existing rollup rows'))
+            return
+
+        self.stdout.write(self.style.NOTICE('Rebuilding application rollup...'))
+        written = ApplicationStatsService.backfill(employer_profile)
+        logger.info(f"Application rollup rebuilt with {written} rows")
+        self.stdout.write(self.style.SUCCESS(f'Wrote {written} rollup rows'))
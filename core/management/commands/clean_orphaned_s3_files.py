@@ -1,14 +1,13 @@
-import boto3
+from datetime import timedelta
 from django.core.management.base import BaseCommand
 from django.conf import settings
-from core.models import UserProfile
+from core.media.reconcile import MediaReconciler, RECONCILE_CONCURRENCY, RECONCILE_GRACE_PERIOD
 import logging
-import os
 
 logger = logging.getLogger(__name__)
 
 class Command(BaseCommand):
-    help = 'Find and optionally delete orphaned CV files in S3 bucket'
+    help = 'Find and optionally delete media files in the S3 bucket that no database row refers to'
 
     def add_arguments(self, parser):
         parser.add_argument(
@@ -18,8 +17,24 @@ class Command(BaseCommand):
         )
         parser.add_argument(
             '--prefix',
-            default='media/private/cvs/',
-            help='The S3 prefix to check for orphaned files',
+            action='append',
+            help='Only check this S3 prefix (repeatable, default: all media prefixes)',
+        )
+        parser.add_argument(
+            '--days',
+            type=float,
+            default=RECONCILE_GRACE_PERIOD.total_seconds() / 86400,
+            help='Only treat files older than this many days as orphaned',
+        )
+        parser.add_argument(
+            '--concurrency',
+            type=int,
+            default=RECONCILE_CONCURRENCY,
+            help=f'S3 requests in flight (default: {RECONCILE_CONCURRENCY})',
+        )
+        parser.add_argument(
+            '--report',
+            help='Write the JSON report to this file ("-" for stdout)',
         )
 
     def handle(self, *args, **options):
@@ -27,117 +42,41 @@ class Command(BaseCommand):
         if not hasattr(settings, 'USE_S3') or not settings.USE_S3:
             self.stdout.write(self.style.ERROR('S3 storage is not enabled. Aborting check.'))
             return
-        
+
         delete_mode = options['delete']
-        prefix = options['prefix']
-        
         if delete_mode:
-            self.stdout.write(self.style.WARNING(f'DELETION MODE ENABLED - orphaned files will be removed from S3!'))
+            self.stdout.write(self.style.WARNING('DELETION MODE ENABLED - orphaned files will be removed from S3!'))
         else:
-            self.stdout.write(self.style.SUCCESS(f'Scan mode - orphaned files will be listed but NOT deleted'))
-        
-        self.stdout.write(f'Checking S3 files with prefix: {prefix}')
-        
-        # Initialize S3 client
-        s3 = boto3.client(
-            's3',
-            region_name=settings.AWS_S3_REGION_NAME,
-            aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-            aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY
+            self.stdout.write(self.style.SUCCESS('Scan mode - orphaned files will be listed but NOT deleted'))
+
+        reconciler = MediaReconciler(
+            concurrency=options['concurrency'],
+            grace_period=timedelta(days=options['days']),
+            prefixes=options['prefix'],
         )
-        
-        try:
-            # List objects in bucket
-            response = s3.list_objects_v2(
-                Bucket=settings.AWS_STORAGE_BUCKET_NAME,
-                Prefix=prefix
+        report = reconciler.run(delete=delete_mode)
+
+        for prefix, stats in report['prefixes'].items():
+            self.stdout.write(
+                f"{prefix}: {stats['scanned']} files, {stats['orphaned']} orphaned "
+                f"({stats['orphaned_bytes'] / (1024 * 1024):.2f} MB), {stats['too_recent']} too recent, "
+                f"{stats['deleted']} deleted"
             )
-            
-            # Check if any files were found
-            if 'Contents' not in response:
-                self.stdout.write(self.style.WARNING(f'No files found with prefix {prefix}'))
-                return
-            
-            # Get all CV filenames from the database
-            db_cv_files = set()
-            for profile in UserProfile.objects.exclude(cv__isnull=True).exclude(cv=''):
-                if profile.cv:
-                    cv_name = profile.cv.name.strip()
-                    db_cv_files.add(cv_name)
-                    
-                    # Also add alternative path formats to handle different storage patterns
-                    if cv_name.startswith('cvs/'):
-                        db_cv_files.add(cv_name)
-                        db_cv_files.add(f"media/private/{cv_name}")
-                        db_cv_files.add(f"private/{cv_name}")
-                    elif not any(cv_name.startswith(p) for p in ['media/', 'private/']):
-                        db_cv_files.add(f"media/private/cvs/{os.path.basename(cv_name)}")
-                        db_cv_files.add(f"private/cvs/{os.path.basename(cv_name)}")
-            
-            self.stdout.write(f'Found {len(db_cv_files)} CV files in database')
-            
-            # Track orphaned files
-            orphaned_files = []
-            
-            # Check each S3 file
-            for obj in response['Contents']:
-                s3_key = obj['Key']
-                
-                # Skip the directory itself
-                if s3_key.endswith('/'):
-                    continue
-                
-                # Extract the filename for comparison
-                s3_path_components = [
-                    s3_key,  # Full path
-                    s3_key.replace(prefix, ''),  # Without prefix
-                    s3_key.split('/')[-1],  # Just filename
-                    f"cvs/{s3_key.split('/')[-1]}"  # cvs/filename
-                ]
-                
-                # Check if file is referenced in database
-                is_referenced = False
-                for path_to_check in s3_path_components:
-                    if path_to_check in db_cv_files:
-                        is_referenced = True
-                        break
-                
-                if not is_referenced:
-                    orphaned_files.append({
-                        'key': s3_key,
-                        'size': obj['Size'],
-                        'last_modified': obj['LastModified']
-                    })
-            
-            # Report findings
-            if orphaned_files:
-                self.stdout.write(self.style.WARNING(f'Found {len(orphaned_files)} orphaned files:'))
-                self.stdout.write('-' * 80)
-                self.stdout.write(f'{"Key":<60} {"Size":<10} {"Last Modified"}')
-                self.stdout.write('-' * 80)
-                
-                for file in orphaned_files:
-                    self.stdout.write(f'{file["key"]:<60} {file["size"]:<10} {file["last_modified"]}')
-                
-                # Delete if requested
-                if delete_mode:
-                    self.stdout.write(self.style.WARNING('\nDeleting orphaned files...'))
-                    
-                    for file in orphaned_files:
-                        try:
-                            s3.delete_object(
-                                Bucket=settings.AWS_STORAGE_BUCKET_NAME,
-                                Key=file['key']
-                            )
-                            self.stdout.write(f'Deleted: {file["key"]}')
-                        except Exception as e:
-                            self.stdout.write(self.style.ERROR(f'Error deleting {file["key"]}: {str(e)}'))
-                    
-                    self.stdout.write(self.style.SUCCESS(f'\nDeleted {len(orphaned_files)} orphaned files'))
-                else:
-                    self.stdout.write(self.style.WARNING('\nTo delete these files, run the command with --delete'))
-            else:
-                self.stdout.write(self.style.SUCCESS('No orphaned files found!'))
-                
-        except Exception as e:
-            self.stdout.write(self.style.ERROR(f'Error: {str(e)}')) 
\ No newline at end of file
+        for error in report['errors']:
+            self.stdout.write(self.style.ERROR(f"Error: {error.get('key') or error.get('prefix')}: {error['error']}"))
+
+        report_path = options['report']
+        if report_path == '-':
+            self.stdout.write(MediaReconciler.report_json(report))
+        elif report_path:
+            with open(report_path, 'w', encoding='utf-8') as f:
+                f.write(MediaReconciler.report_json(report) + '\n')
+            self.stdout.write(f'Report written to {report_path}')
+
+        totals = report['totals']
+        if delete_mode:
+            self.stdout.write(self.style.SUCCESS(f"Deleted {totals['deleted']} of {totals['orphaned']} orphaned files"))
+        elif totals['orphaned']:
+            self.stdout.write(self.style.WARNING(f"Found {totals['orphaned']} orphaned files. To delete them, run the command with --delete"))
+        else:
+            self.stdout.write(self.style.SUCCESS('No orphaned files found!'))
@@ -0,0 +1,39 @@
+import logging
+from django.core.management.base import BaseCommand, CommandError
+from core.services.notification_retention_service import NotificationRetentionService, NOTIFICATION_RETENTION_BATCH_SIZE
+
+logger = logging.getLogger(__name__)
+
+class Command(BaseCommand):
+    help = 'Archives or deletes old read notifications according to NOTIFICATION_RETENTION_POLICY'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Only count the notifications that would be archived or deleted',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=NOTIFICATION_RETENTION_BATCH_SIZE,
+            help=f'Rows moved per transaction (default: {NOTIFICATION_RETENTION_BATCH_SIZE})',
+        )
+
+    def handle(self, *args, **options):
+        dry_run = options['dry_run']
+
+        try:
+            report = NotificationRetentionService.apply_policy(dry_run=dry_run, batch_size=max(1, options['batch_size']))
+        except ValueError as e:
+            raise CommandError(str(e))
+
+        for entry in report:
+            verb = f"would be {entry['action']}d" if dry_run else f"{entry['action']}d"
+            self.stdout.write(f"{entry['model']} / {entry['notification_type']}: {entry['rows']} row(s) {verb}")
+
+        total = sum(entry['rows'] for entry in report)
+        if dry_run:
+            self.stdout.write(self.style.SUCCESS(f'Dry run - {total} notification row(s) would be reclaimed'))
+        else:
+            self.stdout.write(self.style.SUCCESS(f'Reclaimed {total} notification row(s)'))
@@ -0,0 +1,43 @@
+import logging
+from django.core.management.base import BaseCommand
+from core.services.similar_jobs_service import SimilarJobsService
+
+logger = logging.getLogger(__name__)
+
+class Command(BaseCommand):
+    help = 'Rebuilds the precomputed "similar jobs" index for all active job listings, or refreshes the queued ones'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Only vectorize the jobs and show the index size without writing it',
+        )
+        parser.add_argument(
+            '--pending',
+            action='store_true',
+            help='Only refresh the jobs queued since the last run instead of rebuilding everything',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help='Number of jobs written per transaction (default: 500)',
+        )
+
+    def handle(self, *args, **options):
+        if options['dry_run']:
+            index = SimilarJobsService.build_index()
+            self.stdout.write(self.style.SUCCESS(
+                f'Would index {len(index)} active jobs ({len(index.postings)} distinct terms)'
+            ))
+            return
+
+        if options['pending']:
+            refreshed = SimilarJobsService.refresh_pending()
+            self.stdout.write(self.style.SUCCESS(f'Refreshed similar jobs of {refreshed} queued jobs'))
+            return
+
+        self.stdout.write(self.style.NOTICE('Rebuilding similar jobs index...'))
+        jobs, entries = SimilarJobsService.rebuild(batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f'Indexed {jobs} jobs with {entries} similar job entries'))
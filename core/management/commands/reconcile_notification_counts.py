@@ -0,0 +1,34 @@
+import logging
+from django.core.management.base import BaseCommand
+from core.repositories.notification_repository import NotificationRepository
+
+logger = logging.getLogger(__name__)
+
+class Command(BaseCommand):
+    help = 'Recounts the unread notification counters of employer and candidate profiles'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Only show the profiles whose counter is off without fixing them',
+        )
+
+    def handle(self, *args, **options):
+        dry_run = options['dry_run']
+
+        drift = NotificationRepository.reconcile_unread_notification_counts(dry_run=dry_run)
+
+        for employer_id, stored, actual in drift['employers']:
+            self.stdout.write(self.style.WARNING(f'Employer profile {employer_id}: stored {stored}, actual {actual}'))
+        for user_id, stored, actual in drift['candidates']:
+            self.stdout.write(self.style.WARNING(f'Candidate (user {user_id}): stored {stored}, actual {actual}'))
+
+        total = len(drift['employers']) + len(drift['candidates'])
+        if total:
+            logger.warning(f"Unread notification counters drifted on {total} profile(s)")
+
+        if dry_run:
+            self.stdout.write(self.style.SUCCESS(f'Dry run - {total} counter(s) would be fixed'))
+        else:
+            self.stdout.write(self.style.SUCCESS(f'Fixed {total} unread notification counter(s)'))
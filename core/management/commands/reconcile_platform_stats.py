@@ -0,0 +1,40 @@
+import logging
+from django.core.management.base import BaseCommand
+from core.services.stats_service import PlatformStatsService
+
+logger = logging.getLogger(__name__)
+
+class Command(BaseCommand):
+    help = 'Recounts the cached platform statistics (jobs, companies, candidates) from the database'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Only show the cached and the actual values without updating the cache',
+        )
+
+    def handle(self, *args, **options):
+        dry_run = options['dry_run']
+
+        cached = PlatformStatsService.get_cached_stats()
+        actual = PlatformStatsService.compute_stats() if dry_run else PlatformStatsService.reconcile()
+
+        drifted = 0
+        for name, value in actual.items():
+            cached_value = cached.get(name)
+            if cached_value is None:
+                self.stdout.write(f'{name}: {value} (not cached)')
+            elif cached_value != value:
+                drifted += 1
+                self.stdout.write(self.style.WARNING(f'{name}: cached {cached_value}, actual {value}'))
+            else:
+                self.stdout.write(f'{name}: {value}')
+
+        if drifted:
+            logger.warning(f"Platform stats drifted on {drifted} counter(s)")
+
+        if dry_run:
+            self.stdout.write(self.style.SUCCESS('Dry run - cache not updated'))
+        else:
+            self.stdout.write(self.style.SUCCESS('Platform statistics reconciled'))
@@ -0,0 +1,34 @@
+import logging
+from django.core.management.base import BaseCommand
+from core.services.notification_digest_service import NotificationDigestService, NOTIFICATION_DIGEST_BATCH_SIZE
+
+logger = logging.getLogger(__name__)
+
+class Command(BaseCommand):
+    help = 'Emails employers who enabled it a digest of their new unread notifications'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Only count the digests that would be sent',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=NOTIFICATION_DIGEST_BATCH_SIZE,
+            help=f'Digests sent per batch over the mail connection (default: {NOTIFICATION_DIGEST_BATCH_SIZE})',
+        )
+
+    def handle(self, *args, **options):
+        dry_run = options['dry_run']
+
+        stats = NotificationDigestService.send_digests(dry_run=dry_run, batch_size=max(1, options['batch_size']))
+
+        if stats['failed']:
+            self.stdout.write(self.style.ERROR(f"{stats['failed']} digest(s) failed and will be retried on the next run"))
+
+        if dry_run:
+            self.stdout.write(self.style.SUCCESS(f"Dry run - {stats['sent']} digest(s) would be sent"))
+        else:
+            self.stdout.write(self.style.SUCCESS(f"Sent {stats['sent']} notification digest(s), {stats['skipped']} employer(s) had nothing new"))
@@ -1,13 +1,11 @@
 import logging
-from django.core.management.base import BaseCommand
-from django.utils import timezone
-from django.db.models import Count, Q
-from core.models import JobListing, EmployerProfile
+from django.core.management.base import BaseCommand, CommandError
+from core.services.job_expiry_service import JobExpiryService, JobExpiryLocked, EXPIRY_BATCH_SIZE
 
 logger = logging.getLogger(__name__)
 
 class Command(BaseCommand):
-    help = 'Updates job statuses for expired jobs and logs employers who lose Premium+ access'
+    help = 'Updates job statuses from their expiration dates and logs employers who lose Premium+ access'
 
     def add_arguments(self, parser):
         parser.add_argument(
@@ -15,72 +13,47 @@ class Command(BaseCommand):
             action='store_true',
             help='Only show what would be changed without actually updating the database',
         )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=EXPIRY_BATCH_SIZE,
+            help=f'Number of jobs updated per statement (default: {EXPIRY_BATCH_SIZE})',
+        )
 
     def handle(self, *args, **options):
         dry_run = options['dry_run']
-        now = timezone.now()
-        
+
         self.stdout.write(self.style.NOTICE('Checking for expired jobs...'))
-        
-        # Find all jobs that have expired but don't have 'expired' status
-        expired_jobs = JobListing.objects.filter(
-            ~Q(status='expired'),  # Any status except 'expired'
-            expires_at__lt=now,
-            deleted_at__isnull=True
-        )
-        
-        expired_count = expired_jobs.count()
-        
-        if expired_count == 0:
-            self.stdout.write(self.style.SUCCESS('No expired jobs found!'))
-            return
-            
-        self.stdout.write(self.style.WARNING(f'Found {expired_count} expired jobs'))
-        
-        # Update job statuses
-        if not dry_run:
-            expired_jobs.update(status='expired')
-            self.stdout.write(self.style.SUCCESS(f'Updated {expired_count} jobs to expired status'))
+
+        try:
+            report = JobExpiryService.run(dry_run=dry_run, batch_size=options['batch_size'])
+        except JobExpiryLocked as e:
+            raise CommandError(str(e))
+
+        prefix = 'Would update' if dry_run else 'Updated'
+        if report['expired']:
+            self.stdout.write(self.style.SUCCESS(f"{prefix} {len(report['expired'])} jobs to expired status"))
         else:
-            self.stdout.write(self.style.SUCCESS(f'Would update {expired_count} jobs to expired status'))
-        
-        # Now check for employers who will lose Premium+ access
+            self.stdout.write(self.style.SUCCESS('No expired jobs found!'))
+
+        if report['reactivated']:
+            self.stdout.write(self.style.SUCCESS(
+                f"{prefix} {len(report['reactivated'])} jobs back to approved status (expiration date in the future)"
+            ))
+
+        if report['initialized_last_extended_at']:
+            self.stdout.write(self.style.SUCCESS(
+                f"{prefix} last_extended_at of {report['initialized_last_extended_at']} jobs"
+            ))
+
         self.stdout.write(self.style.NOTICE('Checking for employers losing Premium+ access...'))
-        
-        # Get all employers who have Premium+ jobs that just expired
-        employers_with_expired_premium_plus = set(expired_jobs.filter(
-            premium_level='premium_plus'
-        ).values_list('employer_id', flat=True))
-        
-        # For these employers, check if they still have any active Premium+ jobs
-        employers_losing_access = []
-        
-        for employer_id in employers_with_expired_premium_plus:
-            active_premium_plus_count = JobListing.objects.filter(
-                employer_id=employer_id,
-                premium_level='premium_plus',
-                status='approved',
-                expires_at__gt=now,
-                deleted_at__isnull=True
-            ).count()
-            
-            if active_premium_plus_count == 0:
-                try:
-                    employer = EmployerProfile.objects.get(id=employer_id)
-                    employers_losing_access.append(employer)
-                    
-                    # Log the event
-                    self.stdout.write(self.style.WARNING(
-                        f'Employer {employer.company_name} (ID: {employer.id}) is losing Premium+ access'
-                    ))
-                    logger.info(f'Employer {employer.company_name} (ID: {employer.id}) has lost Premium+ access due to job expiration')
-                except EmployerProfile.DoesNotExist:
-                    continue
-        
-        # Summary output
-        if employers_losing_access:
+        employers = report['employers_losing_premium_plus']
+        for employer in employers:
             self.stdout.write(self.style.WARNING(
-                f'{len(employers_losing_access)} employers will lose Premium+ access'
+                f'Employer {employer.company_name} (ID: {employer.id}) is losing Premium+ access'
             ))
+
+        if employers:
+            self.stdout.write(self.style.WARNING(f'{len(employers)} employers will lose Premium+ access'))
         else:
-            self.stdout.write(self.style.SUCCESS('No employers will lose Premium+ access')) 
\ No newline at end of file
+            self.stdout.write(self.style.SUCCESS('No employers will lose Premium+ access'))
@@ -0,0 +1,12 @@
+from core.media.presign import PresignedUrlCache, presigned_urls
+from core.media.s3 import get_s3_client, storage_key_for, candidate_keys, private_key, signed_url
+
+__all__ = [
+    'PresignedUrlCache',
+    'presigned_urls',
+    'get_s3_client',
+    'storage_key_for',
+    'candidate_keys',
+    'private_key',
+    'signed_url',
+]
@@ -0,0 +1,320 @@
+import hashlib
+import json
+import logging
+import mimetypes
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from boto3.s3.transfer import TransferConfig
+from botocore.exceptions import ClientError
+from django.conf import settings
+from core.media.reconcile import media_sources
+from core.media.s3 import get_s3_client, get_bucket_name
+
+logger = logging.getLogger(__name__)
+
+# Files above this size are uploaded in parts of this size, several parts at a time
+MULTIPART_CHUNK_SIZE = 8 * 1024 * 1024
+
+# Files uploaded at once
+MEDIA_MIGRATION_WORKERS = getattr(settings, 'MEDIA_MIGRATION_WORKERS', 8)
+
+# Rows written per bulk_update in the path rewrite
+PATH_REWRITE_BATCH_SIZE = 500
+
+MANIFEST_NAME = '.s3_migration_manifest.jsonl'
+
+STATUS_UPLOADED = 'uploaded'
+STATUS_SKIPPED = 'skipped'
+STATUS_FAILED = 'failed'
+
+
+def file_etag(path, chunk_size=MULTIPART_CHUNK_SIZE):
+    """
+    Compute the ETag S3 gives a file uploaded with this chunk size
+
+    Single-part uploads get the MD5 of the content, multipart uploads the
+    MD5 of the part MD5s followed by the number of parts.
+
+    Args:
+        path (str): Local file
+        chunk_size (int): Multipart threshold and part size of the upload
+
+    Returns:
+        str: The ETag, without quotes
+    """
+    part_digests = []
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            part_digests.append(hashlib.md5(chunk).digest())
+    if len(part_digests) <= 1:
+        return (part_digests[0] if part_digests else hashlib.md5(b'').digest()).hex()
+    return f'{hashlib.md5(b"".join(part_digests)).hexdigest()}-{len(part_digests)}'
+
+
+class MediaManifest:
+    """
+    Append-only JSON lines checkpoint of a media migration
+
+    One line is written (and flushed) per finished file, so a run that dies
+    half way loses nothing; the next run skips every file whose size and
+    modification time still match an uploaded or skipped entry.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.entries = {}
+        self._lock = threading.Lock()
+        if os.path.exists(path):
+            with open(path, encoding='utf-8') as f:
+                for line in f:
+                    line = line.strip()
+                    if line:
+                        entry = json.loads(line)
+                        self.entries[entry['name']] = entry
+
+    def is_done(self, name, size, mtime):
+        entry = self.entries.get(name)
+        return bool(
+            entry and entry['status'] in (STATUS_UPLOADED, STATUS_SKIPPED)
+            and entry['size'] == size and entry['mtime'] == mtime
+        )
+
+    def record(self, entry):
+        with self._lock:
+            self.entries[entry['name']] = entry
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+                f.flush()
+                os.fsync(f.fileno())
+
+
+class MediaMigration:
+    """
+    Moves the local media directory into the S3 bucket
+
+    Files are found by walking the upload directories of every media source.
+    Each file is uploaded on a thread pool; s3transfer splits large files
+    into concurrent multipart uploads. Objects that already exist with the
+    same ETag are skipped without uploading, so re-running after a partial
+    or manual copy costs a HEAD per file. The manifest (see MediaManifest)
+    makes a failed run resumable. Database names are rewritten in one
+    bulk pass at the end, not with a lookup per file.
+    """
+
+    def __init__(self, media_root=None, manifest_path=None, client=None, bucket=None,
+                 workers=MEDIA_MIGRATION_WORKERS, chunk_size=MULTIPART_CHUNK_SIZE):
+        self.media_root = str(media_root or settings.MEDIA_ROOT)
+        self.manifest = MediaManifest(manifest_path or os.path.join(self.media_root, MANIFEST_NAME))
+        self.client = client or get_s3_client()
+        self.bucket = bucket or get_bucket_name()
+        self.workers = max(1, workers)
+        self.chunk_size = chunk_size
+        self.transfer_config = TransferConfig(
+            multipart_threshold=chunk_size,
+            multipart_chunksize=chunk_size,
+            max_concurrency=4,
+        )
+
+    def local_files(self):
+        """
+        Find the local media files that belong in the bucket
+
+        Returns:
+            list: (name relative to MEDIA_ROOT, bucket key, absolute path) tuples
+        """
+        files = []
+        for prefix, location, model, file_field, key_field in media_sources():
+            upload_dir = prefix[len(location) + 1:].strip('/')
+            root = os.path.join(self.media_root, upload_dir)
+            for dirpath, dirnames, filenames in os.walk(root):
+                dirnames[:] = sorted(d for d in dirnames if not d.startswith('.'))
+                for filename in sorted(filenames):
+                    if filename.startswith('.'):
+                        continue
+                    path = os.path.join(dirpath, filename)
+                    name = os.path.relpath(path, self.media_root).replace(os.sep, '/')
+                    files.append((name, f'{location}/{name}', path))
+        return files
+
+    def remote_etag(self, key):
+        """
+        Get the ETag and size of an object
+
+        Returns:
+            tuple: (etag without quotes, size), or (None, None) if it doesn't exist
+        """
+        try:
+            response = self.client.head_object(Bucket=self.bucket, Key=key)
+        except ClientError as e:
+            if e.response['Error']['Code'] in ('404', 'NoSuchKey', 'NotFound'):
+                return None, None
+            raise
+        return response['ETag'].strip('"'), response['ContentLength']
+
+    def migrate_file(self, name, key, path, dry_run=False):
+        """
+        Upload one file unless the bucket already has the same content
+
+        Returns:
+            dict: The manifest entry (not recorded for a dry run)
+        """
+        stat = os.stat(path)
+        entry = {'name': name, 'key': key, 'size': stat.st_size, 'mtime': int(stat.st_mtime)}
+        try:
+            etag = file_etag(path, self.chunk_size)
+            entry['etag'] = etag
+            remote_etag, remote_size = self.remote_etag(key)
+            if remote_etag == etag and remote_size == stat.st_size:
+                entry['status'] = STATUS_SKIPPED
+            elif dry_run:
+                entry['status'] = STATUS_UPLOADED
+            else:
+                extra_args = {}
+                content_type = mimetypes.guess_type(name)[0]
+                if content_type:
+                    extra_args['ContentType'] = content_type
+                self.client.upload_file(path, self.bucket, key, ExtraArgs=extra_args, Config=self.transfer_config)
+                entry['status'] = STATUS_UPLOADED
+        except Exception as e:
+            logger.error(f"Error migrating {name} to S3: {str(e)}")
+            entry.update(status=STATUS_FAILED, error=str(e))
+
+        if not dry_run:
+            self.manifest.record(entry)
+        return entry
+
+    def upload(self, dry_run=False, progress=None):
+        """
+        Upload every local media file that isn't in the bucket yet
+
+        Args:
+            dry_run (bool): Only find out what would be uploaded
+            progress (callable): Called with each finished manifest entry (optional)
+
+        Returns:
+            dict: Counts per status, plus 'resumed' for files done by an earlier run
+        """
+        stats = {STATUS_UPLOADED: 0, STATUS_SKIPPED: 0, STATUS_FAILED: 0, 'resumed': 0}
+        pending = []
+        for name, key, path in self.local_files():
+            stat = os.stat(path)
+            if self.manifest.is_done(name, stat.st_size, int(stat.st_mtime)):
+                stats['resumed'] += 1
+            else:
+                pending.append((name, key, path))
+
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            for entry in pool.map(lambda item: self.migrate_file(*item, dry_run=dry_run), pending):
+                stats[entry['status']] += 1
+                if progress:
+                    progress(entry)
+        return stats
+
+    def rewrite_paths(self, dry_run=False):
+        """
+        Point the file fields at the migrated names, in one bulk pass
+
+        Rows whose name already is a migrated name only get their storage
+        key filled in. Legacy names (a media/ prefix, an absolute path, a
+        file outside its upload directory) are matched by their path
+        relative to MEDIA_ROOT, then by file name within the upload directory.
+        The content store's StoredFile rows get their bucket keys in the same
+        pass, so a later upload of the same content points at the object.
+
+        Args:
+            dry_run (bool): Only count the rows that would change
+
+        Returns:
+            int: Rows updated
+        """
+        migrated = {
+            name: entry['key'] for name, entry in self.manifest.entries.items()
+            if entry['status'] in (STATUS_UPLOADED, STATUS_SKIPPED)
+        }
+        media_root = self.media_root.rstrip('/') + '/'
+        updated = 0
+
+        fields = {}
+        for prefix, location, model, file_field, key_field in media_sources():
+            fields[(model, file_field, key_field)] = prefix[len(location) + 1:].strip('/')
+
+        for (model, file_field, key_field), upload_dir in fields.items():
+            manager = getattr(model, 'all_objects', model._default_manager)
+            columns = ['id', file_field] + ([key_field] if key_field else [])
+            rows = (
+                manager.exclude(**{f'{file_field}__isnull': True})
+                .exclude(**{file_field: ''})
+                .values_list(*columns)
+                .iterator(chunk_size=PATH_REWRITE_BATCH_SIZE)
+            )
+
+            changed = []
+            for row in rows:
+                pk, name = row[0], row[1]
+                relative = name[len(media_root):] if name.startswith(media_root) else name.lstrip('/')
+                if relative.startswith('media/'):
+                    relative = relative[len('media/'):]
+                if relative not in migrated:
+                    relative = f'{upload_dir}/{os.path.basename(relative)}'
+                    if relative not in migrated:
+                        continue
+
+                key = migrated[relative]
+                if relative == name and (not key_field or row[2] == key):
+                    continue
+                instance = model(id=pk, **{file_field: relative})
+                if key_field:
+                    setattr(instance, key_field, key)
+                changed.append(instance)
+
+            updated += len(changed)
+            if changed and not dry_run:
+                update_fields = [file_field] + ([key_field] if key_field else [])
+                manager.bulk_update(changed, update_fields, batch_size=PATH_REWRITE_BATCH_SIZE)
+
+        from core.models import StoredFile
+        changed = [
+            StoredFile(id=pk, storage_key=migrated[name])
+            for pk, name, storage_key in (
+                StoredFile.objects.values_list('id', 'name', 'storage_key').iterator(chunk_size=PATH_REWRITE_BATCH_SIZE)
+            )
+            if name in migrated and migrated[name] != storage_key
+        ]
+        updated += len(changed)
+        if changed and not dry_run:
+            StoredFile.objects.bulk_update(changed, ['storage_key'], batch_size=PATH_REWRITE_BATCH_SIZE)
+        return updated
+
+    def verify(self, progress=None):
+        """
+        Compare every local media file with its object in the bucket
+
+        Args:
+            progress (callable): Called with each mismatch (optional)
+
+        Returns:
+            dict: {'ok': int, 'missing': int, 'size_mismatch': int, 'etag_mismatch': int, 'errors': int}
+        """
+        stats = {'ok': 0, 'missing': 0, 'size_mismatch': 0, 'etag_mismatch': 0, 'errors': 0}
+
+        def check(item):
+            name, key, path = item
+            try:
+                remote_etag, remote_size = self.remote_etag(key)
+            except Exception as e:
+                return name, key, 'errors', str(e)
+            if remote_etag is None:
+                return name, key, 'missing', ''
+            if remote_size != os.path.getsize(path):
+                return name, key, 'size_mismatch', f'{os.path.getsize(path)} != {remote_size}'
+            if remote_etag != file_etag(path, self.chunk_size):
+                return name, key, 'etag_mismatch', remote_etag
+            return name, key, 'ok', ''
+
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            for name, key, result, detail in pool.map(check, self.local_files()):
+                stats[result] += 1
+                if result != 'ok' and progress:
+                    progress({'name': name, 'key': key, 'result': result, 'detail': detail})
+        return stats
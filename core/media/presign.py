@@ -0,0 +1,73 @@
+import logging
+import threading
+import time
+from collections import OrderedDict
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+# A cached URL is handed out until this many seconds before it expires, so
+# whoever gets it still has at least that long to use it
+PRESIGNED_URL_SAFETY_MARGIN = getattr(settings, 'PRESIGNED_URL_SAFETY_MARGIN', 10 * 60)
+
+# Signed URLs kept per process (least recently used are dropped first)
+PRESIGNED_URL_CACHE_SIZE = getattr(settings, 'PRESIGNED_URL_CACHE_SIZE', 10000)
+
+
+class PresignedUrlCache:
+    """
+    Process-local LRU cache of presigned GET URLs
+
+    Entries are keyed by (bucket, key, Content-Disposition, viewer class) and
+    reused until PRESIGNED_URL_SAFETY_MARGIN before they expire. Signing
+    costs an HMAC chain and a client lookup per URL; recruiters paging
+    through the CV database ask for the same objects over and over. The
+    viewer class keeps URLs handed to different audiences (the owner, an
+    employer, a template) apart.
+    """
+
+    def __init__(self, max_size=PRESIGNED_URL_CACHE_SIZE, safety_margin=PRESIGNED_URL_SAFETY_MARGIN):
+        self.max_size = max_size
+        self.safety_margin = safety_margin
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, bucket, key, disposition, viewer, expires, sign):
+        """
+        Get a signed URL, signing a new one if there is no usable cached one
+
+        Args:
+            bucket (str): The bucket
+            key (str): The bucket key
+            disposition (str): ResponseContentDisposition, or None
+            viewer (str): Viewer class the URL is handed to
+            expires (int): Lifetime of a new URL in seconds
+            sign (callable): Signs a new URL (no arguments)
+
+        Returns:
+            str: The signed URL
+        """
+        cache_key = (bucket, key, disposition, viewer)
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(cache_key)
+            if entry is not None and entry[1] - self.safety_margin > now:
+                self._entries.move_to_end(cache_key)
+                return entry[0]
+
+        url = sign()
+        # A URL that wouldn't outlive the margin is never reused
+        if expires > self.safety_margin:
+            with self._lock:
+                self._entries[cache_key] = (url, now + expires)
+                self._entries.move_to_end(cache_key)
+                while len(self._entries) > self.max_size:
+                    self._entries.popitem(last=False)
+        return url
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+presigned_urls = PresignedUrlCache()
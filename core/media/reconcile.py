@@ -0,0 +1,253 @@
+import json
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from django.conf import settings
+from django.utils import timezone
+from core.media.s3 import PRIVATE_MEDIA_LOCATION, candidate_keys, get_s3_client, get_bucket_name
+
+logger = logging.getLogger(__name__)
+
+PUBLIC_MEDIA_LOCATION = 'media/public'
+
+# Most keys a single DeleteObjects request accepts
+DELETE_BATCH_SIZE = 1000
+
+# S3 requests (listings and deletes) in flight at once
+RECONCILE_CONCURRENCY = getattr(settings, 'MEDIA_RECONCILE_CONCURRENCY', 4)
+
+# Objects younger than this are never orphans: their row may not be committed yet
+RECONCILE_GRACE_PERIOD = timedelta(hours=getattr(settings, 'MEDIA_RECONCILE_GRACE_HOURS', 24))
+
+# Rows fetched per round trip while building the reference set
+REFERENCE_CHUNK_SIZE = 2000
+
+
+def media_sources():
+    """
+    The media prefixes of the bucket and the fields whose files live under them
+
+    Returns:
+        list: (prefix, location, model, file field, verified key field or None)
+    """
+    from core.models import UserProfile, JobApplication, EmployerProfile, BlogPost
+    return [
+        (f'{PRIVATE_MEDIA_LOCATION}/cvs/', PRIVATE_MEDIA_LOCATION, UserProfile, 'cv', 'cv_storage_key'),
+        (f'{PRIVATE_MEDIA_LOCATION}/resumes/', PRIVATE_MEDIA_LOCATION, JobApplication, 'resume', 'resume_storage_key'),
+        (f'{PUBLIC_MEDIA_LOCATION}/company_logos/', PUBLIC_MEDIA_LOCATION, EmployerProfile, 'company_logo', None),
+        (f'{PUBLIC_MEDIA_LOCATION}/profile_pictures/', PUBLIC_MEDIA_LOCATION, UserProfile, 'profile_picture', None),
+        (f'{PUBLIC_MEDIA_LOCATION}/blog_images/', PUBLIC_MEDIA_LOCATION, BlogPost, 'featured_image', None),
+    ]
+
+
+class MediaReconciler:
+    """
+    Finds (and optionally deletes) bucket objects no database row refers to
+
+    Every media prefix is listed completely with the list_objects_v2
+    paginator, and the listings run concurrently. The reference set is
+    built once from the database by streaming values_list() rows, and it
+    holds every key a stored name could map to. A CV referenced from a
+    resume (applying with the profile CV) or a legacy name therefore never
+    counts as an orphan. Content-addressed CVs and resumes are shared by
+    every row with the same content: they stay referenced while their
+    StoredFile counts a reference, and are only deleted after
+    ContentStoreService.collect confirmed (under a row lock) that nothing
+    took a new reference since the scan. Orphans are deleted with
+    DeleteObjects, up to 1000 keys per request. At most `concurrency` S3
+    requests are in flight.
+    """
+
+    def __init__(self, client=None, bucket=None, concurrency=RECONCILE_CONCURRENCY,
+                 grace_period=RECONCILE_GRACE_PERIOD, prefixes=None):
+        self.client = client or get_s3_client()
+        self.bucket = bucket or get_bucket_name()
+        self.concurrency = max(1, concurrency)
+        self.grace_period = grace_period
+        self.sources = media_sources()
+        # Only these prefixes are listed; the reference set always covers every source
+        self.prefixes = list(prefixes) if prefixes else list(dict.fromkeys(source[0] for source in self.sources))
+
+    def referenced_keys(self):
+        """
+        Build the set of bucket keys the database refers to
+
+        Returns:
+            set: Referenced keys
+        """
+        from core.services.content_store_service import ContentStoreService
+
+        referenced = ContentStoreService.referenced_keys()
+        fields = {}
+        for prefix, location, model, file_field, key_field in self.sources:
+            fields.setdefault((model, file_field, key_field), location)
+
+        upload_dirs = {
+            (model, file_field): model._meta.get_field(file_field).upload_to.strip('/')
+            for model, file_field, key_field in fields
+        }
+        for (model, file_field, key_field), location in fields.items():
+            manager = getattr(model, 'all_objects', model._default_manager)
+            columns = [file_field] + ([key_field] if key_field else [])
+            rows = (
+                manager.exclude(**{f'{file_field}__isnull': True})
+                .exclude(**{file_field: ''})
+                .values_list(*columns)
+                .iterator(chunk_size=REFERENCE_CHUNK_SIZE)
+            )
+            for row in rows:
+                name = row[0]
+                if key_field and row[1]:
+                    referenced.add(row[1])
+                if location == PRIVATE_MEDIA_LOCATION:
+                    referenced.update(candidate_keys(name, upload_dirs[(model, file_field)]))
+                else:
+                    referenced.add(f'{location}/{name.lstrip("/")}')
+                    referenced.add(name)
+        return referenced
+
+    def list_objects(self, prefix):
+        """
+        List every object under a prefix, page by page
+
+        Args:
+            prefix (str): The key prefix
+
+        Yields:
+            dict: The listing entries (Key, Size, LastModified, ...)
+        """
+        paginator = self.client.get_paginator('list_objects_v2')
+        for page in paginator.paginate(Bucket=self.bucket, Prefix=prefix):
+            for obj in page.get('Contents', []):
+                if not obj['Key'].endswith('/'):
+                    yield obj
+
+    def delete_batch(self, keys):
+        """
+        Delete up to 1000 keys with one DeleteObjects request
+
+        Args:
+            keys (list): The keys
+
+        Returns:
+            tuple: (deleted count, list of {'key', 'error'})
+        """
+        try:
+            response = self.client.delete_objects(
+                Bucket=self.bucket,
+                Delete={'Objects': [{'Key': key} for key in keys], 'Quiet': True},
+            )
+        except Exception as e:
+            logger.error(f"Error deleting {len(keys)} orphaned media files: {str(e)}")
+            return 0, [{'key': key, 'error': str(e)} for key in keys]
+
+        errors = [{'key': error['Key'], 'error': error.get('Message') or error.get('Code', '')} for error in response.get('Errors', [])]
+        return len(keys) - len(errors), errors
+
+    def run(self, delete=False, now=None):
+        """
+        Reconcile the bucket with the database
+
+        Args:
+            delete (bool): Delete the orphans (default only reports them)
+            now (datetime): Reference time for the grace period (defaults to now)
+
+        Returns:
+            dict: JSON-serializable report
+        """
+        now = now or timezone.now()
+        cutoff = now - self.grace_period
+        report = {
+            'bucket': self.bucket,
+            'started_at': now.isoformat(),
+            'delete': delete,
+            'grace_period_seconds': int(self.grace_period.total_seconds()),
+            'prefixes': {},
+            'orphans': [],
+            'errors': [],
+        }
+
+        referenced = self.referenced_keys()
+        report['referenced_keys'] = len(referenced)
+
+        def scan(prefix):
+            stats = {'scanned': 0, 'scanned_bytes': 0, 'too_recent': 0, 'orphaned': 0, 'orphaned_bytes': 0, 'deleted': 0}
+            orphans = []
+            try:
+                for obj in self.list_objects(prefix):
+                    stats['scanned'] += 1
+                    stats['scanned_bytes'] += obj['Size']
+                    if obj['Key'] in referenced:
+                        continue
+                    if obj['LastModified'] > cutoff:
+                        stats['too_recent'] += 1
+                        continue
+                    stats['orphaned'] += 1
+                    stats['orphaned_bytes'] += obj['Size']
+                    orphans.append({
+                        'key': obj['Key'],
+                        'prefix': prefix,
+                        'size': obj['Size'],
+                        'last_modified': obj['LastModified'].isoformat(),
+                    })
+            except Exception as e:
+                # A listing that fails half way deletes nothing from its prefix
+                logger.error(f"Error listing {prefix} in {self.bucket}: {str(e)}")
+                return prefix, stats, [], {'prefix': prefix, 'error': str(e)}
+            return prefix, stats, orphans, None
+
+        with ThreadPoolExecutor(max_workers=self.concurrency) as pool:
+            for prefix, stats, orphans, error in pool.map(scan, self.prefixes):
+                report['prefixes'][prefix] = stats
+                report['orphans'].extend(orphans)
+                if error:
+                    report['errors'].append(error)
+
+            if delete and report['orphans']:
+                self.collect_shared(report)
+            if delete and report['orphans']:
+                batches = [
+                    report['orphans'][i:i + DELETE_BATCH_SIZE]
+                    for i in range(0, len(report['orphans']), DELETE_BATCH_SIZE)
+                ]
+                results = pool.map(self.delete_batch, [[orphan['key'] for orphan in batch] for batch in batches])
+                for batch, (deleted_count, errors) in zip(batches, results):
+                    failed = {error['key'] for error in errors}
+                    for orphan in batch:
+                        if orphan['key'] not in failed:
+                            report['prefixes'][orphan['prefix']]['deleted'] += 1
+                    report['errors'].extend(errors)
+
+        report['finished_at'] = timezone.now().isoformat()
+        report['totals'] = {
+            name: sum(stats[name] for stats in report['prefixes'].values())
+            for name in ('scanned', 'orphaned', 'orphaned_bytes', 'deleted')
+        }
+        logger.info(f"Media reconciliation of {self.bucket}: {report['totals']}, {len(report['errors'])} errors")
+        return report
+
+    @staticmethod
+    def collect_shared(report):
+        """
+        Drop the orphans whose stored file was referenced again since the scan
+
+        Args:
+            report (dict): The report of the running reconciliation, updated in place
+        """
+        from core.services.content_store_service import ContentStoreService
+
+        deletable = ContentStoreService.collect(orphan['key'] for orphan in report['orphans'])
+        orphans = []
+        for orphan in report['orphans']:
+            if orphan['key'] in deletable:
+                orphans.append(orphan)
+            else:
+                stats = report['prefixes'][orphan['prefix']]
+                stats['orphaned'] -= 1
+                stats['orphaned_bytes'] -= orphan['size']
+        report['orphans'] = orphans
+
+    @staticmethod
+    def report_json(report):
+        """Render a report as indented JSON"""
+        return json.dumps(report, indent=2, ensure_ascii=False)
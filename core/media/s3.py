@@ -0,0 +1,146 @@
+import logging
+import os
+import threading
+import boto3
+from botocore.config import Config
+from django.conf import settings
+from storages.utils import clean_name
+from core.media.presign import presigned_urls
+
+logger = logging.getLogger(__name__)
+
+PRIVATE_MEDIA_LOCATION = getattr(settings, 'PRIVATE_MEDIA_LOCATION', 'media/private')
+
+# Connections kept open by the shared client (one per concurrent request or worker thread)
+S3_MAX_POOL_CONNECTIONS = getattr(settings, 'S3_MAX_POOL_CONNECTIONS', 50)
+
+# Lifetime of the signed CV and resume URLs, same as PrivateMediaStorage.querystring_expire
+SIGNED_URL_EXPIRES = getattr(settings, 'AWS_QUERYSTRING_EXPIRE', 3600)
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_s3_client():
+    """
+    Get the process-wide S3 client
+
+    boto3 clients are thread safe and keep a connection pool, so one client
+    is shared by every request and worker thread instead of building a new
+    one (credentials, endpoint resolution, TLS handshake) per call.
+
+    Returns:
+        botocore.client.S3: The shared client
+    """
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = boto3.session.Session().client(
+                    's3',
+                    region_name=getattr(settings, 'AWS_S3_REGION_NAME', None),
+                    aws_access_key_id=getattr(settings, 'AWS_ACCESS_KEY_ID', None),
+                    aws_secret_access_key=getattr(settings, 'AWS_SECRET_ACCESS_KEY', None),
+                    endpoint_url=getattr(settings, 'AWS_S3_ENDPOINT_URL', None),
+                    config=Config(
+                        signature_version='s3v4',
+                        max_pool_connections=S3_MAX_POOL_CONNECTIONS,
+                        retries={'max_attempts': 3, 'mode': 'standard'},
+                    ),
+                )
+    return _client
+
+
+def get_bucket_name():
+    return getattr(settings, 'AWS_STORAGE_BUCKET_NAME', '')
+
+
+def storage_key_for(field_file):
+    """
+    Get the key a stored file has in its storage backend
+
+    For S3 storages that is the bucket key (location prefix included), for
+    the local file system the name relative to MEDIA_ROOT.
+
+    Args:
+        field_file (FieldFile): A committed file of a FileField
+
+    Returns:
+        str: The key, or '' for an empty field
+    """
+    if not field_file:
+        return ''
+    storage = field_file.storage
+    if hasattr(storage, 'bucket_name'):
+        return storage._normalize_name(clean_name(field_file.name))
+    return field_file.name
+
+
+def candidate_keys(name, upload_dir='cvs'):
+    """
+    Bucket keys a legacy private file name may be stored under, most likely first
+
+    Older rows hold names with the location already in them, doubled
+    media/ prefixes, a name uploaded without the location, or a path whose
+    file actually sits directly in the upload directory.
+
+    Args:
+        name (str): The name stored in the FileField
+        upload_dir (str): upload_to of the field ('cvs' or 'resumes')
+
+    Returns:
+        list: Candidate keys without duplicates
+    """
+    name = clean_name(name).lstrip('/')
+    while name.startswith('media/media/'):
+        name = name[len('media/'):]
+    if name.startswith(f'{PRIVATE_MEDIA_LOCATION}/'):
+        name = name[len(PRIVATE_MEDIA_LOCATION) + 1:]
+
+    keys = [
+        f'{PRIVATE_MEDIA_LOCATION}/{name}',
+        name,
+        f'{PRIVATE_MEDIA_LOCATION}/{upload_dir.strip("/")}/{os.path.basename(name)}',
+    ]
+    return list(dict.fromkeys(keys))
+
+
+def private_key(field_file, storage_key=''):
+    """
+    Get the bucket key to sign for a private file
+
+    Args:
+        field_file (FieldFile): The CV or resume
+        storage_key (str): The verified key stored with the row, if any
+
+    Returns:
+        str: The verified key, or the key the storage would use for the name
+    """
+    return storage_key or candidate_keys(field_file.name)[0]
+
+
+def signed_url(key, file_name=None, download=False, viewer='owner', client=None, expires=SIGNED_URL_EXPIRES):
+    """
+    Get a signed GET URL for a private object, without checking that it exists
+
+    URLs come from the presigned URL cache while they have enough lifetime left.
+
+    Args:
+        key (str): The bucket key
+        file_name (str): File name for the Content-Disposition header
+        download (bool): Ask the browser to download instead of display
+        viewer (str): Who the URL is for ('owner', 'employer', 'cv_database', ...)
+        client: S3 client (defaults to the shared one)
+        expires (int): Lifetime of a new URL in seconds
+
+    Returns:
+        str: The signed URL
+    """
+    params = {'Bucket': get_bucket_name(), 'Key': key}
+    if download:
+        params['ResponseContentDisposition'] = f'attachment; filename="{file_name or os.path.basename(key)}"'
+
+    def sign():
+        return (client or get_s3_client()).generate_presigned_url('get_object', Params=params, ExpiresIn=expires)
+
+    return presigned_urls.get(params['Bucket'], key, params.get('ResponseContentDisposition'), viewer, expires, sign)
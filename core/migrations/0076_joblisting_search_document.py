@@ -0,0 +1,60 @@
+from django.db import migrations, models
+from core.search.normalization import build_job_search_document
+
+
+def add_search_vector(apps, schema_editor):
+    """
+    Add the generated tsvector column and its GIN index (PostgreSQL only).
+    Other databases fall back to matching against search_document.
+    """
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+
+    schema_editor.execute(
+        "ALTER TABLE core_joblisting ADD COLUMN IF NOT EXISTS search_vector tsvector "
+        "GENERATED ALWAYS AS (to_tsvector('simple', coalesce(search_document, ''))) STORED"
+    )
+    schema_editor.execute(
+        "CREATE INDEX IF NOT EXISTS core_joblisting_search_vector_gin "
+        "ON core_joblisting USING GIN (search_vector)"
+    )
+
+
+def remove_search_vector(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+
+    schema_editor.execute("DROP INDEX IF EXISTS core_joblisting_search_vector_gin")
+    schema_editor.execute("ALTER TABLE core_joblisting DROP COLUMN IF EXISTS search_vector")
+
+
+def backfill_search_document(apps, schema_editor):
+    JobListing = apps.get_model('core', 'JobListing')
+
+    batch = []
+    for job in JobListing.objects.all().iterator(chunk_size=500):
+        job.search_document = build_job_search_document(job)
+        batch.append(job)
+        if len(batch) >= 500:
+            JobListing.objects.bulk_update(batch, ['search_document'])
+            batch = []
+
+    if batch:
+        JobListing.objects.bulk_update(batch, ['search_document'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0075_remove_russian_translations'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='joblisting',
+            name='search_document',
+            field=models.TextField(blank=True, default='', editable=False, verbose_name='საძიებო ტექსტი'),
+        ),
+        migrations.RunPython(backfill_search_document, migrations.RunPython.noop),
+        migrations.RunPython(add_search_vector, remove_search_vector),
+    ]
@@ -0,0 +1,15 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0076_joblisting_search_document'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='joblisting',
+            index=models.Index(fields=['-premium_level', '-posted_at', '-id'], name='job_board_keyset_idx'),
+        ),
+    ]
@@ -0,0 +1,31 @@
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0077_joblisting_job_board_keyset_idx'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SimilarJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('rank', models.PositiveSmallIntegerField(verbose_name='რიგი')),
+                ('score', models.FloatField(verbose_name='მსგავსება')),
+                ('job', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='similar_jobs', to='core.joblisting', verbose_name='ვაკანსია')),
+                ('similar_job', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='similar_to', to='core.joblisting', verbose_name='მსგავსი ვაკანსია')),
+            ],
+            options={
+                'verbose_name': 'მსგავსი ვაკანსია',
+                'verbose_name_plural': 'მსგავსი ვაკანსიები',
+                'unique_together': {('job', 'similar_job')},
+            },
+        ),
+        migrations.AddIndex(
+            model_name='similarjob',
+            index=models.Index(fields=['job', 'rank'], name='core_simila_job_id_47cd69_idx'),
+        ),
+    ]
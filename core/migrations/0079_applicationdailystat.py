@@ -0,0 +1,63 @@
+from django.db import migrations, models
+from django.db.models import Count, Case, When, Value, CharField
+from django.db.models.functions import TruncDate, Coalesce
+import django.db.models.deletion
+
+
+def backfill_application_rollup(apps, schema_editor):
+    JobApplication = apps.get_model('core', 'JobApplication')
+    ApplicationDailyStat = apps.get_model('core', 'ApplicationDailyStat')
+
+    rows = JobApplication.objects.filter(job__employer__isnull=False).order_by().annotate(
+        day=TruncDate('applied_at'),
+        source=Case(
+            When(user__isnull=False, then=Value('registered')),
+            default=Value('guest'),
+            output_field=CharField(),
+        ),
+        job_category=Coalesce('job__category', Value('')),
+    ).values('job__employer_id', 'day', 'status', 'job_category', 'source').annotate(total=Count('id'))
+
+    ApplicationDailyStat.objects.bulk_create([
+        ApplicationDailyStat(
+            employer_profile_id=row['job__employer_id'],
+            date=row['day'],
+            status=row['status'],
+            category=row['job_category'],
+            source=row['source'],
+            count=row['total'],
+        )
+        for row in rows
+    ], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0078_similarjob'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ApplicationDailyStat',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField(verbose_name='თარიღი')),
+                ('status', models.CharField(max_length=30, verbose_name='სტატუსი')),
+                ('category', models.CharField(blank=True, default='', max_length=100, verbose_name='კატეგორია')),
+                ('source', models.CharField(choices=[('registered', 'რეგისტრირებული მომხმარებელი'), ('guest', 'სტუმარი')], max_length=20, verbose_name='წყარო')),
+                ('count', models.IntegerField(default=0, verbose_name='რაოდენობა')),
+                ('employer_profile', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='application_daily_stats', to='core.employerprofile', verbose_name='დამსაქმებელი')),
+            ],
+            options={
+                'verbose_name': 'აპლიკაციების დღიური სტატისტიკა',
+                'verbose_name_plural': 'აპლიკაციების დღიური სტატისტიკა',
+                'unique_together': {('employer_profile', 'date', 'status', 'category', 'source')},
+            },
+        ),
+        migrations.AddIndex(
+            model_name='applicationdailystat',
+            index=models.Index(fields=['employer_profile', 'date'], name='core_applic_employe_1111d7_idx'),
+        ),
+        migrations.RunPython(backfill_application_rollup, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,65 @@
+from django.db import migrations, models
+from core.search.normalization import build_applicant_search_document
+
+
+def add_trigram_index(apps, schema_editor):
+    """
+    Add a trigram GIN index on applicant_search (PostgreSQL only), so the
+    substring matches of the applicant search can use an index.
+    Other databases scan the job's applications, which the job index keeps small.
+    """
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    schema_editor.execute(
+        "CREATE INDEX IF NOT EXISTS core_jobapplication_applicant_search_trgm "
+        "ON core_jobapplication USING GIN (applicant_search gin_trgm_ops)"
+    )
+
+
+def remove_trigram_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+
+    schema_editor.execute("DROP INDEX IF EXISTS core_jobapplication_applicant_search_trgm")
+
+
+def backfill_applicant_search(apps, schema_editor):
+    JobApplication = apps.get_model('core', 'JobApplication')
+
+    batch = []
+    for application in JobApplication.objects.select_related('user').iterator(chunk_size=500):
+        application.applicant_search = build_applicant_search_document(application)
+        batch.append(application)
+        if len(batch) >= 500:
+            JobApplication.objects.bulk_update(batch, ['applicant_search'])
+            batch = []
+
+    if batch:
+        JobApplication.objects.bulk_update(batch, ['applicant_search'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0079_applicationdailystat'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='jobapplication',
+            name='applicant_search',
+            field=models.TextField(blank=True, default='', editable=False, verbose_name='აპლიკანტის საძიებო ტექსტი'),
+        ),
+        migrations.AddIndex(
+            model_name='jobapplication',
+            index=models.Index(fields=['job', '-applied_at', '-id'], name='application_job_keyset_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='jobapplication',
+            index=models.Index(fields=['job', 'status', '-applied_at', '-id'], name='application_status_keyset_idx'),
+        ),
+        migrations.RunPython(backfill_applicant_search, migrations.RunPython.noop),
+        migrations.RunPython(add_trigram_index, remove_trigram_index),
+    ]
@@ -0,0 +1,42 @@
+from django.db import migrations, models
+from django.db.models import Count, IntegerField, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_unread_counts(apps, schema_editor):
+    EmployerProfile = apps.get_model('core', 'EmployerProfile')
+    UserProfile = apps.get_model('core', 'UserProfile')
+    EmployerNotification = apps.get_model('core', 'EmployerNotification')
+    CandidateNotification = apps.get_model('core', 'CandidateNotification')
+
+    EmployerProfile.objects.update(unread_notification_count=Coalesce(Subquery(
+        EmployerNotification.objects.filter(employer_profile_id=OuterRef('pk'), is_read=False)
+        .order_by().values('employer_profile_id').annotate(count=Count('id')).values('count'),
+        output_field=IntegerField()
+    ), 0))
+    UserProfile.objects.update(unread_notification_count=Coalesce(Subquery(
+        CandidateNotification.objects.filter(user_id=OuterRef('user_id'), is_read=False)
+        .order_by().values('user_id').annotate(count=Count('id')).values('count'),
+        output_field=IntegerField()
+    ), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0080_jobapplication_applicant_search'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='employerprofile',
+            name='unread_notification_count',
+            field=models.IntegerField(default=0, editable=False, verbose_name='წაუკითხავი შეტყობინებები'),
+        ),
+        migrations.AddField(
+            model_name='userprofile',
+            name='unread_notification_count',
+            field=models.IntegerField(default=0, editable=False, verbose_name='წაუკითხავი შეტყობინებები'),
+        ),
+        migrations.RunPython(backfill_unread_counts, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,44 @@
+from django.db import migrations, models
+from django.db.models import F
+import django.utils.timezone
+
+
+def backfill_last_event_at(apps, schema_editor):
+    EmployerNotification = apps.get_model('core', 'EmployerNotification')
+    EmployerNotification.objects.update(last_event_at=F('created_at'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0081_unread_notification_counts'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='employernotification',
+            name='event_count',
+            field=models.PositiveIntegerField(default=1, verbose_name='მოვლენების რაოდენობა'),
+        ),
+        migrations.AddField(
+            model_name='employernotification',
+            name='last_event_at',
+            field=models.DateTimeField(default=django.utils.timezone.now, verbose_name='ბოლო მოვლენის თარიღი'),
+        ),
+        migrations.AddField(
+            model_name='employernotification',
+            name='latest_actor',
+            field=models.CharField(blank=True, default='', max_length=255, verbose_name='ბოლო ინიციატორი'),
+        ),
+        migrations.AddField(
+            model_name='employerprofile',
+            name='notification_digest',
+            field=models.BooleanField(default=False, verbose_name='შეტყობინებების დაიჯესტი ელფოსტაზე'),
+        ),
+        migrations.AddField(
+            model_name='employerprofile',
+            name='notification_digest_sent_at',
+            field=models.DateTimeField(blank=True, editable=False, null=True, verbose_name='ბოლო დაიჯესტის თარიღი'),
+        ),
+        migrations.RunPython(backfill_last_event_at, migrations.RunPython.noop),
+    ]
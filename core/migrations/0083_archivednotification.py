@@ -0,0 +1,34 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0082_notification_coalescing'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArchivedNotification',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('recipient_kind', models.CharField(choices=[('employer', 'Employer'), ('candidate', 'Candidate')], max_length=10, verbose_name='მიმღების ტიპი')),
+                ('recipient_id', models.PositiveIntegerField(verbose_name='მიმღები')),
+                ('notification_type', models.CharField(max_length=50, verbose_name='შეტყობინების ტიპი')),
+                ('job_title', models.CharField(blank=True, default='', max_length=255, verbose_name='ვაკანსიის სათაური')),
+                ('message', models.TextField(verbose_name='შეტყობინება')),
+                ('event_count', models.PositiveIntegerField(default=1, verbose_name='მოვლენების რაოდენობა')),
+                ('created_at', models.DateTimeField(verbose_name='შექმნის თარიღი')),
+                ('archived_at', models.DateTimeField(auto_now_add=True, verbose_name='დაარქივების თარიღი')),
+            ],
+            options={
+                'verbose_name': 'დაარქივებული შეტყობინება',
+                'verbose_name_plural': 'დაარქივებული შეტყობინებები',
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.AddIndex(
+            model_name='archivednotification',
+            index=models.Index(fields=['recipient_kind', 'recipient_id', '-created_at'], name='archived_notif_recipient_idx'),
+        ),
+    ]
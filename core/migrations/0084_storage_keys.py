@@ -0,0 +1,22 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0083_archivednotification'),
+    ]
+
+    operations = [
+        # Filled for existing rows by `manage.py fix_cv_paths`
+        migrations.AddField(
+            model_name='jobapplication',
+            name='resume_storage_key',
+            field=models.CharField(blank=True, default='', editable=False, max_length=500, verbose_name='რეზიუმეს საცავის გასაღები'),
+        ),
+        migrations.AddField(
+            model_name='userprofile',
+            name='cv_storage_key',
+            field=models.CharField(blank=True, default='', editable=False, max_length=500, verbose_name='CV-ის საცავის გასაღები'),
+        ),
+    ]
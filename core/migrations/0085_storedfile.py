@@ -0,0 +1,27 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0084_storage_keys'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StoredFile',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('sha256', models.CharField(max_length=64, unique=True, verbose_name='SHA-256')),
+                ('name', models.CharField(max_length=500, verbose_name='ფაილის სახელი')),
+                ('storage_key', models.CharField(max_length=500, unique=True, verbose_name='საცავის გასაღები')),
+                ('size', models.BigIntegerField(default=0, verbose_name='ზომა')),
+                ('ref_count', models.IntegerField(default=0, verbose_name='მითითებების რაოდენობა')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='შექმნის თარიღი')),
+            ],
+            options={
+                'verbose_name': 'შენახული ფაილი',
+                'verbose_name_plural': 'შენახული ფაილები',
+            },
+        ),
+    ]
@@ -0,0 +1,32 @@
+from django.db import migrations, models
+
+
+def backfill_premium_rank(apps, schema_editor):
+    JobListing = apps.get_model('core', 'JobListing')
+    JobListing.objects.filter(premium_level='premium_plus').update(premium_rank=2)
+    JobListing.objects.filter(premium_level='premium').update(premium_rank=1)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0085_storedfile'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='joblisting',
+            name='premium_rank',
+            field=models.PositiveSmallIntegerField(default=0, editable=False, verbose_name='პრემიუმ რანგი'),
+        ),
+        migrations.RunPython(backfill_premium_rank, migrations.RunPython.noop),
+        # premium_level sorts alphabetically ('standard' first); order the board by rank
+        migrations.RemoveIndex(
+            model_name='joblisting',
+            name='job_board_keyset_idx',
+        ),
+        migrations.AddIndex(
+            model_name='joblisting',
+            index=models.Index(fields=['-premium_rank', '-posted_at', '-id'], name='job_board_keyset_idx'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0086_joblisting_premium_rank'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SimilarJobRefresh',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('job_id', models.BigIntegerField(unique=True, verbose_name='ვაკანსია')),
+                ('queued_at', models.DateTimeField(auto_now_add=True, verbose_name='რიგში ჩაყენების თარიღი')),
+            ],
+            options={
+                'verbose_name': 'მსგავსი ვაკანსიების განახლება',
+                'verbose_name_plural': 'მსგავსი ვაკანსიების განახლებები',
+            },
+        ),
+    ]
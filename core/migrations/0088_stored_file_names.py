@@ -0,0 +1,22 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0087_similarjobrefresh'),
+    ]
+
+    operations = [
+        # Existing rows fall back to the base name of the stored file
+        migrations.AddField(
+            model_name='jobapplication',
+            name='resume_file_name',
+            field=models.CharField(blank=True, default='', editable=False, max_length=255, verbose_name='რეზიუმეს ფაილის სახელი'),
+        ),
+        migrations.AddField(
+            model_name='userprofile',
+            name='cv_file_name',
+            field=models.CharField(blank=True, default='', editable=False, max_length=255, verbose_name='CV-ის ფაილის სახელი'),
+        ),
+    ]
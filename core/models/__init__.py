@@ -1,5 +1,5 @@
 from core.models.base import SoftDeletionModel, SoftDeletionQuerySet, SoftDeletionManager
-from core.models.job import JobListing, RejectionReason
+from core.models.job import JobListing, RejectionReason, SimilarJob, SimilarJobRefresh
 from core.models.user import UserProfile
 from core.models.employer import EmployerProfile
 from core.models.application import JobApplication, SavedJob, CVAccess
@@ -11,7 +11,9 @@ from core.models.pricing import (
 )
 from core.models.auth import EmailVerificationToken
 from core.models.static_pages import StaticPage
-from core.models.notification import EmployerNotification, CandidateNotification
+from core.models.notification import EmployerNotification, CandidateNotification, ArchivedNotification
+from core.models.analytics import ApplicationDailyStat
+from core.models.media import StoredFile
 
 # For backward compatibility, expose all models at the module level
 __all__ = [
@@ -20,6 +22,8 @@ __all__ = [
     'SoftDeletionManager',
     'JobListing',
     'RejectionReason',
+    'SimilarJob',
+    'SimilarJobRefresh',
     'UserProfile',
     'EmployerProfile',
     'JobApplication',
@@ -40,4 +44,7 @@ __all__ = [
     'StaticPage',
     'EmployerNotification',
     'CandidateNotification',
+    'ArchivedNotification',
+    'ApplicationDailyStat',
+    'StoredFile',
 ] 
\ No newline at end of file
@@ -0,0 +1,32 @@
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+
+class ApplicationDailyStat(models.Model):
+    """
+    Daily rollup of job applications per employer, status, job category and source
+    Maintained incrementally by ApplicationStatsService and rebuilt by the
+    backfill_application_rollups command.
+    """
+    SOURCE_CHOICES = [
+        ('registered', _('რეგისტრირებული მომხმარებელი')),
+        ('guest', _('სტუმარი')),
+    ]
+
+    employer_profile = models.ForeignKey('EmployerProfile', on_delete=models.CASCADE, related_name='application_daily_stats', verbose_name=_("დამსაქმებელი"))
+    date = models.DateField(verbose_name=_("თარიღი"))
+    status = models.CharField(max_length=30, verbose_name=_("სტატუსი"))
+    category = models.CharField(max_length=100, blank=True, default='', verbose_name=_("კატეგორია"))
+    source = models.CharField(max_length=20, choices=SOURCE_CHOICES, verbose_name=_("წყარო"))
+    count = models.IntegerField(default=0, verbose_name=_("რაოდენობა"))
+
+    def __str__(self):
+        return f"{self.employer_profile_id} {self.date} {self.status} {self.category} {self.source}: {self.count}"
+
+    class Meta:
+        unique_together = ('employer_profile', 'date', 'status', 'category', 'source')
+        indexes = [
+            models.Index(fields=['employer_profile', 'date']),
+        ]
+        verbose_name = _("აპლიკაციების დღიური სტატისტიკა")
+        verbose_name_plural = _("აპლიკაციების დღიური სტატისტიკა")
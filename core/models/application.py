@@ -1,6 +1,9 @@
-from django.db import models
+import os
+from django.db import models, transaction
 from django.conf import settings
 from django.utils.translation import gettext_lazy as _
+from core.search.normalization import build_applicant_search_document
+from core.models.base import sync_storage_key
 
 # Import storage backends if S3 is enabled
 if hasattr(settings, 'USE_S3') and settings.USE_S3:
@@ -36,6 +39,10 @@ class JobApplication(models.Model):
             upload_to='resumes/', 
             verbose_name=_("რეზიუმე")
         )
+    # Verified bucket key of the resume, signed as is when serving it
+    resume_storage_key = models.CharField(max_length=500, blank=True, default='', editable=False, verbose_name=_("რეზიუმეს საცავის გასაღები"))
+    # Name of the uploaded file; the stored object is named after its content
+    resume_file_name = models.CharField(max_length=255, blank=True, default='', editable=False, verbose_name=_("რეზიუმეს ფაილის სახელი"))
     
     status = models.CharField(max_length=30, choices=STATUS_CHOICES, default='განხილვის_პროცესში', db_index=True, verbose_name=_("სტატუსი"))
     applied_at = models.DateTimeField(auto_now_add=True, db_index=True, verbose_name=_("აპლიკაციის თარიღი"))
@@ -44,6 +51,12 @@ class JobApplication(models.Model):
     is_viewed = models.BooleanField(default=False, db_index=True, verbose_name=_("ნანახია"))
     rejection_reasons = models.ManyToManyField('RejectionReason', blank=True, related_name='applications', verbose_name=_("უარის მიზეზები"))
     feedback = models.TextField(blank=True, verbose_name=_("უკუკავშირი"))
+    # Normalized applicant name and email for the employer's applicant search.
+    # On PostgreSQL it has a trigram GIN index, so substring matches use an index.
+    applicant_search = models.TextField(blank=True, default='', editable=False, verbose_name=_("აპლიკანტის საძიებო ტექსტი"))
+    
+    # Fields that feed the applicant search document
+    SEARCH_FIELDS = ('user', 'guest_name', 'guest_email')
     
     def save(self, *args, **kwargs):
         # Store job details for historical record if job exists
@@ -51,13 +64,32 @@ class JobApplication(models.Model):
             self.job_title = self.job.title
             self.job_company = self.job.company
         
-        super().save(*args, **kwargs)
+        # Keep the applicant search document in sync
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None:
+            self.applicant_search = build_applicant_search_document(self)
+        elif set(update_fields) & set(self.SEARCH_FIELDS):
+            self.applicant_search = build_applicant_search_document(self)
+            kwargs['update_fields'] = set(update_fields) | {'applicant_search'}
+        
+        sync_storage_key(self, 'resume', 'resume_storage_key', 'resume_file_name', kwargs)
+        # The stored file reference counts change with the row (see core.signals)
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+    
+    @property
+    def resume_display_name(self):
+        """File name to show and download the resume as"""
+        return self.resume_file_name or os.path.basename(self.resume.name or '')
     
     class Meta:
         ordering = ['-applied_at']
         indexes = [
             models.Index(fields=['job', 'status']),
             models.Index(fields=['user', 'status']),
+            # Keyset pagination of a job's applicant list, with and without a status tab
+            models.Index(fields=['job', '-applied_at', '-id'], name='application_job_keyset_idx'),
+            models.Index(fields=['job', 'status', '-applied_at', '-id'], name='application_status_keyset_idx'),
         ]
         verbose_name = _("აპლიკაცია")
         verbose_name_plural = _("აპლიკაციები")
@@ -1,10 +1,67 @@
 from django.db import models
+from django.dispatch import Signal
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
+# Sent after a bulk soft delete (QuerySet.delete), which bypasses post_save
+# Arguments: sender (the model class), count (number of rows soft deleted)
+bulk_soft_deleted = Signal()
+
+class SaveExcludedFieldsMixin:
+    """
+    Keep a plain save() of a loaded instance from writing back columns that
+    are only maintained with queryset updates (F() counters, bookkeeping
+    timestamps), since the in-memory values may be stale.
+
+    Only the UPDATE of a save() without update_fields leaves the columns out,
+    so the save keeps its usual semantics: update_fields stays None for
+    receivers, and a row deleted in the meantime is inserted again (with the
+    in-memory values). An explicit update_fields naming a column writes it.
+    Subclasses list the columns in SAVE_EXCLUDED_FIELDS.
+    """
+    SAVE_EXCLUDED_FIELDS = ()
+
+    def _do_update(self, base_qs, using, pk_val, values, update_fields, forced_update):
+        if update_fields is None:
+            values = [value for value in values if value[0].name not in self.SAVE_EXCLUDED_FIELDS]
+        return super()._do_update(base_qs, using, pk_val, values, update_fields, forced_update)
+
+def sync_storage_key(instance, file_field, key_field, name_field, kwargs):
+    """
+    Keep the storage key and display name columns in step with a file field
+
+    A newly assigned file is stored (and its key and display name set) by
+    the content store's pre_save receiver; a cleared field clears both
+    columns here. Either way a save limited to the file field writes the
+    two columns too. A file that was already stored keeps the key it has,
+    which the fix_cv_paths backfill verified.
+
+    Args:
+        instance (Model): The instance being saved
+        file_field (str): Name of the FileField
+        key_field (str): Name of the column holding the storage key
+        name_field (str): Name of the column holding the uploaded file name
+        kwargs (dict): The keyword arguments of save(), updated in place
+    """
+    update_fields = kwargs.get('update_fields')
+    if update_fields is not None and file_field not in update_fields:
+        return
+
+    field_file = getattr(instance, file_field)
+    if not field_file:
+        setattr(instance, key_field, '')
+        setattr(instance, name_field, '')
+    elif field_file._committed:
+        return
+
+    if update_fields is not None:
+        kwargs['update_fields'] = set(update_fields) | {key_field, name_field}
+
 class SoftDeletionQuerySet(models.QuerySet):
     def delete(self):
-        return super().update(deleted_at=timezone.now())
+        count = super().update(deleted_at=timezone.now())
+        bulk_soft_deleted.send(sender=self.model, count=count)
+        return count
         
     def hard_delete(self):
         return super().delete()
@@ -41,6 +98,8 @@ class SoftDeletionModel(models.Model):
         abstract = True
         
     def delete(self, using=None, keep_parents=False):
+        # Goes through save() on purpose so post_save listeners
+        # (e.g. the platform stats counters) see the soft delete
         self.deleted_at = timezone.now()
         self.save()
         
@@ -101,8 +101,9 @@ class BlogPost(SoftDeletionModel):
         return reverse('blog_post_detail', kwargs={'slug': self.slug})
     
     def increment_view_count(self):
-        self.view_count += 1
-        self.save(update_fields=['view_count'])
+        # Buffered and written out in batches, see ViewCounterService
+        from core.services.view_counter_service import ViewCounterService
+        ViewCounterService.record_view(self)
 
 
 class BlogCategory(models.Model):
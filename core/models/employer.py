@@ -4,7 +4,7 @@ from django.utils.translation import gettext_lazy as _
 from django.db.models.signals import post_save
 from django.dispatch import receiver
 from ckeditor.fields import RichTextField
-from core.models.base import SoftDeletionModel
+from core.models.base import SaveExcludedFieldsMixin, SoftDeletionModel
 
 # Import storage backends if S3 is enabled
 if hasattr(settings, 'USE_S3') and settings.USE_S3:
@@ -13,7 +13,7 @@ else:
     PublicMediaStorage = None
     PrivateMediaStorage = None
 
-class EmployerProfile(SoftDeletionModel):
+class EmployerProfile(SaveExcludedFieldsMixin, SoftDeletionModel):
     COMPANY_SIZE_CHOICES = [
         ('1-10', _('1-10 employees')),
         ('11-50', _('11-50 employees')),
@@ -52,9 +52,17 @@ class EmployerProfile(SoftDeletionModel):
     industry = models.CharField(max_length=100, blank=True, db_index=True, verbose_name=_("ინდუსტრია"))
     location = models.CharField(max_length=100, blank=True, db_index=True, verbose_name=_("მდებარეობა"))
     has_cv_database_access = models.BooleanField(default=False, verbose_name=_("წვდომა სივების ბაზაზე"))
+    # Unread employer notifications, maintained by NotificationRepository with F() updates
+    unread_notification_count = models.IntegerField(default=0, editable=False, verbose_name=_("წაუკითხავი შეტყობინებები"))
+    notification_digest = models.BooleanField(default=False, verbose_name=_("შეტყობინებების დაიჯესტი ელფოსტაზე"))
+    notification_digest_sent_at = models.DateTimeField(null=True, blank=True, editable=False, verbose_name=_("ბოლო დაიჯესტის თარიღი"))
     created_at = models.DateTimeField(auto_now_add=True, verbose_name=_("შექმნის თარიღი"))
     updated_at = models.DateTimeField(auto_now=True, verbose_name=_("განახლების თარიღი"))
     
+    # Columns that a plain save() must not overwrite: the unread counter
+    # (F() updates) and the digest timestamp (set by the digest service)
+    SAVE_EXCLUDED_FIELDS = ('unread_notification_count', 'notification_digest_sent_at')
+    
     def __str__(self):
         return f"{self.company_name} ({self.user_profile.user.username})"
     
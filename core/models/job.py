@@ -4,6 +4,7 @@ from django.utils import timezone
 from ckeditor.fields import RichTextField
 from datetime import timedelta
 from core.models.base import SoftDeletionModel
+from core.search.normalization import build_job_search_document
 
 class JobListing(SoftDeletionModel):
     CATEGORY_CHOICES = [
@@ -93,6 +94,9 @@ class JobListing(SoftDeletionModel):
         ('premium_plus', _('Premium +')),
     ]
     premium_level = models.CharField(max_length=20, choices=PREMIUM_LEVEL_CHOICES, default='standard', db_index=True, verbose_name=_("პრემიუმ დონე"))
+    # Numeric sort key of premium_level (the level names don't sort in board order)
+    PREMIUM_RANKS = {'premium_plus': 2, 'premium': 1}
+    premium_rank = models.PositiveSmallIntegerField(default=0, editable=False, verbose_name=_("პრემიუმ რანგი"))
     georgian_language_only = models.BooleanField(choices=[(True, 'კი'), (False, 'არა')], default=False, verbose_name=_("პოზიციაზე მოთხოვნილია მხოლოდ ქართული ენის ცოდნა"))
     view_count = models.PositiveIntegerField(default=0, verbose_name=_("ნახვების რაოდენობა"))
     use_external_link = models.BooleanField(default=False, verbose_name=_('ატვირთულია გარე ლინკით'))
@@ -108,9 +112,30 @@ class JobListing(SoftDeletionModel):
     ]
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='pending_review', db_index=True, verbose_name=_("სტატუსი"))
     admin_feedback = models.TextField(blank=True, verbose_name=_("ადმინის უკუკავშირი"))
+    # Normalized text behind the full-text search. On PostgreSQL the search_vector
+    # column (tsvector, GIN indexed) is generated from it by the database.
+    search_document = models.TextField(blank=True, default='', editable=False, verbose_name=_("საძიებო ტექსტი"))
+
+    # Fields that feed the search document
+    SEARCH_FIELDS = ('title', 'company', 'category', 'location', 'experience', 'job_preferences', 'description')
+
     def __str__(self):
         return f"{self.title} at {self.company}"
 
+    def save(self, *args, **kwargs):
+        # Keep the search document in sync with the searchable fields
+        update_fields = kwargs.get('update_fields')
+        self.premium_rank = self.PREMIUM_RANKS.get(self.premium_level, 0)
+        if update_fields is not None and 'premium_level' in update_fields:
+            kwargs['update_fields'] = update_fields = set(update_fields) | {'premium_rank'}
+        if update_fields is None:
+            self.search_document = build_job_search_document(self)
+        elif set(update_fields) & set(self.SEARCH_FIELDS):
+            self.search_document = build_job_search_document(self)
+            kwargs['update_fields'] = set(update_fields) | {'search_document'}
+
+        super().save(*args, **kwargs)
+
     def is_expired(self):
         """Check if the job posting has expired"""
         # If status is explicitly set to 'expired', return True
@@ -199,6 +224,8 @@ class JobListing(SoftDeletionModel):
             models.Index(fields=['employer', 'status']),
             models.Index(fields=['expires_at']),
             models.Index(fields=['last_extended_at']),
+            # Job board keyset pagination order
+            models.Index(fields=['-premium_rank', '-posted_at', '-id'], name='job_board_keyset_idx'),
         ]
         verbose_name = _("ვაკანსია")
         verbose_name_plural = _("ვაკანსიები")
@@ -213,4 +240,42 @@ class RejectionReason(models.Model):
     
     class Meta:
         verbose_name = _("უარის მიზეზი")
-        verbose_name_plural = _("უარის მიზეზები") 
\ No newline at end of file
+        verbose_name_plural = _("უარის მიზეზები") 
+
+
+class SimilarJob(models.Model):
+    """
+    Precomputed nearest neighbours of a job listing, maintained by SimilarJobsService
+    """
+    job = models.ForeignKey(JobListing, on_delete=models.CASCADE, related_name='similar_jobs', verbose_name=_("ვაკანსია"))
+    similar_job = models.ForeignKey(JobListing, on_delete=models.CASCADE, related_name='similar_to', verbose_name=_("მსგავსი ვაკანსია"))
+    rank = models.PositiveSmallIntegerField(verbose_name=_("რიგი"))
+    score = models.FloatField(verbose_name=_("მსგავსება"))
+
+    def __str__(self):
+        return f"{self.job_id} -> {self.similar_job_id} ({self.score:.2f})"
+
+    class Meta:
+        unique_together = ('job', 'similar_job')
+        indexes = [
+            models.Index(fields=['job', 'rank']),
+        ]
+        verbose_name = _("მსგავსი ვაკანსია")
+        verbose_name_plural = _("მსგავსი ვაკანსიები")
+
+
+class SimilarJobRefresh(models.Model):
+    """
+    A job whose similar jobs have to be recomputed
+    Queued when a job's similarity fields change and drained by
+    `rebuild_similar_jobs --pending`, so saving a job never builds the index.
+    """
+    job_id = models.BigIntegerField(unique=True, verbose_name=_("ვაკანსია"))
+    queued_at = models.DateTimeField(auto_now_add=True, verbose_name=_("რიგში ჩაყენების თარიღი"))
+
+    def __str__(self):
+        return f"{self.job_id} ({self.queued_at})"
+
+    class Meta:
+        verbose_name = _("მსგავსი ვაკანსიების განახლება")
+        verbose_name_plural = _("მსგავსი ვაკანსიების განახლებები")
@@ -0,0 +1,24 @@
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+
+class StoredFile(models.Model):
+    """
+    One stored copy of a CV or resume, shared by every row with the same content
+    Rows point at it through their file name and storage key; ref_count is
+    maintained by ContentStoreService and the object is only deleted by the
+    orphan cleaner once nothing refers to it.
+    """
+    sha256 = models.CharField(max_length=64, unique=True, verbose_name=_("SHA-256"))
+    name = models.CharField(max_length=500, verbose_name=_("ფაილის სახელი"))
+    storage_key = models.CharField(max_length=500, unique=True, verbose_name=_("საცავის გასაღები"))
+    size = models.BigIntegerField(default=0, verbose_name=_("ზომა"))
+    ref_count = models.IntegerField(default=0, verbose_name=_("მითითებების რაოდენობა"))
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name=_("შექმნის თარიღი"))
+
+    def __str__(self):
+        return f"{self.storage_key} ({self.ref_count})"
+
+    class Meta:
+        verbose_name = _("შენახული ფაილი")
+        verbose_name_plural = _("შენახული ფაილები")
@@ -1,5 +1,6 @@
 from django.db import models
 from django.conf import settings
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
 class EmployerNotification(models.Model):
@@ -18,6 +19,10 @@ class EmployerNotification(models.Model):
     message = models.TextField(verbose_name=_("შეტყობინება"))
     is_read = models.BooleanField(default=False, db_index=True, verbose_name=_("წაკითხულია"))
     created_at = models.DateTimeField(auto_now_add=True, db_index=True, verbose_name=_("შექმნის თარიღი"))
+    # Coalesced notifications: how many events the row stands for, who caused the latest one and when
+    event_count = models.PositiveIntegerField(default=1, verbose_name=_("მოვლენების რაოდენობა"))
+    latest_actor = models.CharField(max_length=255, blank=True, default='', verbose_name=_("ბოლო ინიციატორი"))
+    last_event_at = models.DateTimeField(default=timezone.now, verbose_name=_("ბოლო მოვლენის თარიღი"))
     
     def save(self, *args, **kwargs):
         # Store job title for historical record if job exists
@@ -73,4 +78,34 @@ class CandidateNotification(models.Model):
             models.Index(fields=['application', 'notification_type']),
         ]
         verbose_name = _("კანდიდატის შეტყობინება")
-        verbose_name_plural = _("კანდიდატის შეტყობინებები") 
\ No newline at end of file
+        verbose_name_plural = _("კანდიდატის შეტყობინებები") 
+
+class ArchivedNotification(models.Model):
+    """
+    Compact copy of an old read notification, moved out of the live tables by
+    NotificationRetentionService so their indexes only cover the recent set
+    """
+    RECIPIENT_EMPLOYER = 'employer'
+    RECIPIENT_CANDIDATE = 'candidate'
+    RECIPIENT_KINDS = [
+        (RECIPIENT_EMPLOYER, _('Employer')),
+        (RECIPIENT_CANDIDATE, _('Candidate')),
+    ]
+    
+    # EmployerProfile id or User id, without a foreign key so archiving never blocks deletes
+    recipient_kind = models.CharField(max_length=10, choices=RECIPIENT_KINDS, verbose_name=_("მიმღების ტიპი"))
+    recipient_id = models.PositiveIntegerField(verbose_name=_("მიმღები"))
+    notification_type = models.CharField(max_length=50, verbose_name=_("შეტყობინების ტიპი"))
+    job_title = models.CharField(max_length=255, blank=True, default='', verbose_name=_("ვაკანსიის სათაური"))
+    message = models.TextField(verbose_name=_("შეტყობინება"))
+    event_count = models.PositiveIntegerField(default=1, verbose_name=_("მოვლენების რაოდენობა"))
+    created_at = models.DateTimeField(verbose_name=_("შექმნის თარიღი"))
+    archived_at = models.DateTimeField(auto_now_add=True, verbose_name=_("დაარქივების თარიღი"))
+    
+    class Meta:
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['recipient_kind', 'recipient_id', '-created_at'], name='archived_notif_recipient_idx'),
+        ]
+        verbose_name = _("დაარქივებული შეტყობინება")
+        verbose_name_plural = _("დაარქივებული შეტყობინებები")
@@ -2,6 +2,13 @@ from django.db import models
 from django.utils.translation import gettext_lazy as _
 from django.urls import reverse
 
+
+def _translated(instance, field, language_code):
+    """Read a translated field from the compiled pricing translation catalog"""
+    from core.services.reference_data_service import ReferenceDataService
+    return ReferenceDataService.pricing_translations().translate(instance, field, language_code)
+
+
 class PricingPackage(models.Model):
     PACKAGE_TYPE_CHOICES = [
         ('standard', _('Standard')),
@@ -36,19 +43,11 @@ class PricingPackage(models.Model):
     
     def get_translated_name(self, language_code='ka'):
         """Get translated name for the package"""
-        try:
-            translation = self.translations.get(language_code=language_code)
-            return translation.name if translation.name else self.name
-        except PricingPackageTranslation.DoesNotExist:
-            return self.name
+        return _translated(self, 'name', language_code)
     
     def get_translated_description(self, language_code='ka'):
         """Get translated description for the package"""
-        try:
-            translation = self.translations.get(language_code=language_code)
-            return translation.description if translation.description else self.description
-        except PricingPackageTranslation.DoesNotExist:
-            return self.description
+        return _translated(self, 'description', language_code)
 
 
 class PricingPackageTranslation(models.Model):
@@ -89,11 +88,7 @@ class PricingFeature(models.Model):
     
     def get_translated_text(self, language_code='ka'):
         """Get translated text for the feature"""
-        try:
-            translation = self.translations.get(language_code=language_code)
-            return translation.text if translation.text else self.text
-        except PricingFeatureTranslation.DoesNotExist:
-            return self.text
+        return _translated(self, 'text', language_code)
 
 
 class PricingFeatureTranslation(models.Model):
@@ -133,19 +128,11 @@ class ComparisonTable(models.Model):
     
     def get_translated_title(self, language_code='ka'):
         """Get translated title for the comparison table"""
-        try:
-            translation = self.translations.get(language_code=language_code)
-            return translation.title if translation.title else self.title
-        except ComparisonTableTranslation.DoesNotExist:
-            return self.title
+        return _translated(self, 'title', language_code)
     
     def get_translated_subtitle(self, language_code='ka'):
         """Get translated subtitle for the comparison table"""
-        try:
-            translation = self.translations.get(language_code=language_code)
-            return translation.subtitle if translation.subtitle else self.subtitle
-        except ComparisonTableTranslation.DoesNotExist:
-            return self.subtitle
+        return _translated(self, 'subtitle', language_code)
 
 
 class ComparisonTableTranslation(models.Model):
@@ -205,35 +192,19 @@ class ComparisonRow(models.Model):
     
     def get_translated_feature_name(self, language_code='ka'):
         """Get translated feature name"""
-        try:
-            translation = self.translations.get(language_code=language_code)
-            return translation.feature_name if translation.feature_name else self.feature_name
-        except ComparisonRowTranslation.DoesNotExist:
-            return self.feature_name
+        return _translated(self, 'feature_name', language_code)
     
     def get_translated_standard_value(self, language_code='ka'):
         """Get translated standard value"""
-        try:
-            translation = self.translations.get(language_code=language_code)
-            return translation.standard_value if translation.standard_value else self.standard_value
-        except ComparisonRowTranslation.DoesNotExist:
-            return self.standard_value
+        return _translated(self, 'standard_value', language_code)
     
     def get_translated_premium_value(self, language_code='ka'):
         """Get translated premium value"""
-        try:
-            translation = self.translations.get(language_code=language_code)
-            return translation.premium_value if translation.premium_value else self.premium_value
-        except ComparisonRowTranslation.DoesNotExist:
-            return self.premium_value
+        return _translated(self, 'premium_value', language_code)
     
     def get_translated_premium_plus_value(self, language_code='ka'):
         """Get translated premium plus value"""
-        try:
-            translation = self.translations.get(language_code=language_code)
-            return translation.premium_plus_value if translation.premium_plus_value else self.premium_plus_value
-        except ComparisonRowTranslation.DoesNotExist:
-            return self.premium_plus_value
+        return _translated(self, 'premium_plus_value', language_code)
 
 
 class ComparisonRowTranslation(models.Model):
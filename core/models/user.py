@@ -1,10 +1,12 @@
-from django.db import models
+import os
+from django.db import models, transaction
 from django.conf import settings
 from django.utils.translation import gettext_lazy as _
 from django.contrib.auth.models import User
 from django.db.models.signals import post_save
 from django.dispatch import receiver
 from django_ckeditor_5.fields import CKEditor5Field
+from core.models.base import SaveExcludedFieldsMixin, sync_storage_key
 
 # Import storage backends if S3 is enabled
 if hasattr(settings, 'USE_S3') and settings.USE_S3:
@@ -13,7 +15,7 @@ else:
     PublicMediaStorage = None
     PrivateMediaStorage = None
 
-class UserProfile(models.Model):
+class UserProfile(SaveExcludedFieldsMixin, models.Model):
     ROLE_CHOICES = [
         ('candidate', _('Candidate')),
         ('employer', _('Employer')),
@@ -65,6 +67,10 @@ class UserProfile(models.Model):
             null=True,
             verbose_name=_("CV")
         )
+    # Verified bucket key of the CV, signed as is when serving it
+    cv_storage_key = models.CharField(max_length=500, blank=True, default='', editable=False, verbose_name=_("CV-ის საცავის გასაღები"))
+    # Name of the uploaded file; the stored object is named after its content
+    cv_file_name = models.CharField(max_length=255, blank=True, default='', editable=False, verbose_name=_("CV-ის ფაილის სახელი"))
     
     # New fields for CV database functionality
     desired_field = models.CharField(
@@ -85,6 +91,11 @@ class UserProfile(models.Model):
         default=False,
         verbose_name=_("ხილვადია დამსაქმებლებისთვის")
     )
+    # Unread candidate notifications, maintained by NotificationRepository with F() updates
+    unread_notification_count = models.IntegerField(default=0, editable=False, verbose_name=_("წაუკითხავი შეტყობინებები"))
+    
+    # Columns that a plain save() must not overwrite
+    SAVE_EXCLUDED_FIELDS = ('unread_notification_count',)
     
     def __str__(self):
         return f"{self.user.username} - {self.get_role_display()}"
@@ -105,8 +116,16 @@ class UserProfile(models.Model):
         # If user is superuser, ensure they have admin role
         if self.user.is_superuser and self.role != 'admin':
             self.role = 'admin'
-            
-        super().save(*args, **kwargs)
+        
+        sync_storage_key(self, 'cv', 'cv_storage_key', 'cv_file_name', kwargs)
+        # The stored file reference counts change with the row (see core.signals)
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+    
+    @property
+    def cv_display_name(self):
+        """File name to show and download the CV as"""
+        return self.cv_file_name or os.path.basename(self.cv.name or '')
     
     class Meta:
         verbose_name = _("მომხმარებლის პროფილი")
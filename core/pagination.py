@@ -0,0 +1,151 @@
+import base64
+import binascii
+import datetime
+import decimal
+import json
+from django.db.models import Q
+
+
+def _cursor_value(value):
+    """
+    Serialize an ordering value for a cursor
+    DjangoJSONEncoder is not used on purpose: it truncates datetimes to
+    milliseconds, which would make the keyset comparison skip or repeat rows.
+    """
+    if isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
+        return value.isoformat()
+    if isinstance(value, decimal.Decimal):
+        return str(value)
+    return value
+
+
+class InvalidCursor(Exception):
+    """Raised when a pagination cursor can't be decoded for the current ordering"""
+    pass
+
+
+class KeysetPage:
+    """
+    One page of a keyset-paginated queryset
+
+    Attributes:
+        object_list (list): The rows of this page
+        next_cursor (str): Opaque cursor for the following page, None on the last page
+    """
+
+    def __init__(self, object_list, next_cursor):
+        self.object_list = object_list
+        self.next_cursor = next_cursor
+
+    @property
+    def has_next(self):
+        return self.next_cursor is not None
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+
+class KeysetPaginator:
+    """
+    Paginate a queryset by the values of its ordering columns instead of OFFSET
+
+    Every page is a "WHERE (ordering columns) come after the last row LIMIT n"
+    query, so its cost doesn't grow with the page number and rows inserted
+    while a user scrolls don't shift later pages. The ordering has to end with
+    a unique column (usually -id) to make it a total order.
+
+    Ordering entries may be model fields or annotations, e.g.
+    ('-premium_rank', '-search_rank', '-posted_at', '-id').
+    """
+
+    def __init__(self, queryset, ordering, per_page):
+        self.queryset = queryset.order_by(*ordering)
+        self.ordering = [(name.lstrip('-'), name.startswith('-')) for name in ordering]
+        self.per_page = per_page
+
+    def _output_field(self, name):
+        query = self.queryset.query
+        if name in query.annotations:
+            return query.annotations[name].output_field
+        return self.queryset.model._meta.get_field(name)
+
+    def encode_cursor(self, obj):
+        """
+        Build the cursor pointing right after the given row
+
+        Args:
+            obj: A model instance from the paginated queryset
+
+        Returns:
+            str: URL-safe cursor
+        """
+        values = [_cursor_value(getattr(obj, name)) for name, _ in self.ordering]
+        payload = json.dumps(values, separators=(',', ':'))
+        return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii').rstrip('=')
+
+    def decode_cursor(self, cursor):
+        """
+        Turn a cursor back into the ordering values of the last row seen
+
+        Raises:
+            InvalidCursor: If the cursor is malformed or doesn't fit the ordering
+        """
+        try:
+            padded = cursor + '=' * (-len(cursor) % 4)
+            values = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')).decode('utf-8'))
+        except (ValueError, TypeError, binascii.Error, UnicodeError):
+            raise InvalidCursor('Malformed cursor')
+
+        if not isinstance(values, list) or len(values) != len(self.ordering):
+            raise InvalidCursor('Cursor does not match the ordering')
+
+        decoded = []
+        for (name, _), value in zip(self.ordering, values):
+            try:
+                decoded.append(self._output_field(name).to_python(value))
+            except Exception:
+                raise InvalidCursor(f'Invalid cursor value for {name}')
+        return decoded
+
+    def _after(self, values):
+        """
+        Build the row-comparison filter "ordering columns come after values"
+
+        Expanded to (a < x) OR (a = x AND b < y) OR ... so it works with mixed
+        sort directions and on every database backend.
+        """
+        condition = Q()
+        equal_so_far = Q()
+        for (name, descending), value in zip(self.ordering, values):
+            lookup = 'lt' if descending else 'gt'
+            condition |= equal_so_far & Q(**{f'{name}__{lookup}': value})
+            equal_so_far &= Q(**{name: value})
+        return condition
+
+    def get_page(self, cursor=None):
+        """
+        Fetch the page that starts after the given cursor
+
+        Args:
+            cursor (str): Cursor from a previous page, None for the first page
+
+        Returns:
+            KeysetPage: The rows and the cursor for the next page
+
+        Raises:
+            InvalidCursor: If the cursor can't be decoded
+        """
+        queryset = self.queryset
+        if cursor:
+            queryset = queryset.filter(self._after(self.decode_cursor(cursor)))
+
+        # Fetch one extra row to find out whether there is a next page
+        rows = list(queryset[:self.per_page + 1])
+        has_next = len(rows) > self.per_page
+        rows = rows[:self.per_page]
+
+        next_cursor = self.encode_cursor(rows[-1]) if has_next else None
+        return KeysetPage(rows, next_cursor)
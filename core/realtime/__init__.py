@@ -0,0 +1,15 @@
+from core.realtime.pubsub import (
+    NotificationBroker, InMemoryBroker, PostgresBroker, get_broker, publish, employer_channel, candidate_channel,
+)
+from core.realtime.sse import NotificationStream
+
+__all__ = [
+    'NotificationBroker',
+    'InMemoryBroker',
+    'PostgresBroker',
+    'get_broker',
+    'publish',
+    'employer_channel',
+    'candidate_channel',
+    'NotificationStream',
+]
@@ -0,0 +1,235 @@
+import asyncio
+import json
+import logging
+import select
+import threading
+import time
+from collections import defaultdict
+from django.conf import settings
+from django.db import connection
+from django.utils.module_loading import import_string
+
+logger = logging.getLogger(__name__)
+
+# Postgres channel all notification events are sent on
+NOTIFICATION_CHANNEL = 'jobsight_notifications'
+
+# Events buffered per connected browser; a slow client drops events past this
+# (the next unread_count snapshot on reconnect corrects its badge)
+SUBSCRIBER_QUEUE_SIZE = 100
+
+# Dotted path of the broker class, or None to pick one from the database vendor
+NOTIFICATION_BROKER = getattr(settings, 'NOTIFICATION_BROKER', None)
+
+
+def employer_channel(employer_profile_id):
+    return f'employer:{employer_profile_id}'
+
+
+def candidate_channel(user_id):
+    return f'user:{user_id}'
+
+
+class Subscription:
+    """
+    One connected stream: an asyncio queue fed from any thread
+    """
+
+    def __init__(self, broker, channel, loop, maxsize=SUBSCRIBER_QUEUE_SIZE):
+        self.broker = broker
+        self.channel = channel
+        self.loop = loop
+        self.queue = asyncio.Queue(maxsize=maxsize)
+
+    def put(self, event):
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            logger.warning(f"Dropping notification event for slow subscriber on {self.channel}")
+
+    async def get(self):
+        return await self.queue.get()
+
+    def close(self):
+        self.broker.unsubscribe(self)
+
+
+class NotificationBroker:
+    """
+    Fans notification events out to the streams of this process
+
+    Subscribers register per channel ("employer:<id>" or "user:<id>"). publish()
+    is implemented by the backends; whatever reaches this process is handed to
+    dispatch(), which queues the event on each subscriber's event loop.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscribers = defaultdict(set)
+
+    def subscribe(self, channel, loop=None):
+        """
+        Start receiving the events of a channel
+
+        Args:
+            channel (str): Channel name (see employer_channel / candidate_channel)
+            loop (AbstractEventLoop): Loop of the consumer (defaults to the running loop)
+
+        Returns:
+            Subscription: Call close() on it when the stream ends
+        """
+        subscription = Subscription(self, channel, loop or asyncio.get_running_loop())
+        with self._lock:
+            self._subscribers[channel].add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            subscribers = self._subscribers.get(subscription.channel)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._subscribers[subscription.channel]
+
+    def subscriber_count(self, channel):
+        with self._lock:
+            return len(self._subscribers.get(channel, ()))
+
+    def dispatch(self, channel, event):
+        """
+        Hand an event to the local subscribers of a channel (thread safe)
+        """
+        with self._lock:
+            subscribers = list(self._subscribers.get(channel, ()))
+        for subscription in subscribers:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription.put, event)
+            except RuntimeError:
+                # The subscriber's loop is gone; its stream cleans up on its own
+                pass
+
+    def publish(self, events):
+        """
+        Send events to every process
+
+        Args:
+            events (list): (channel, event dict) pairs
+        """
+        raise NotImplementedError
+
+
+class InMemoryBroker(NotificationBroker):
+    """
+    Broker for a single process (development and tests)
+    """
+
+    def publish(self, events):
+        for channel, event in events:
+            self.dispatch(channel, event)
+
+
+class PostgresBroker(NotificationBroker):
+    """
+    Broker that goes through Postgres LISTEN/NOTIFY, so events reach the
+    streams of every worker process
+
+    Publishing is one SELECT pg_notify() over all events, sent on the
+    request's own connection. Each process opens a single extra connection,
+    on first subscribe, that LISTENs in a daemon thread and dispatches what
+    arrives to the local subscribers.
+    """
+
+    # Seconds between reconnect attempts of the listener
+    RECONNECT_DELAY = 5
+
+    def __init__(self):
+        super().__init__()
+        self._listener = None
+        self._listener_lock = threading.Lock()
+
+    def publish(self, events):
+        payloads = [json.dumps({'channel': channel, 'event': event}) for channel, event in events]
+        if not payloads:
+            return
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT pg_notify(%s, payload) FROM unnest(%s::text[]) AS payload",
+                [NOTIFICATION_CHANNEL, payloads],
+            )
+
+    def subscribe(self, channel, loop=None):
+        subscription = super().subscribe(channel, loop)
+        with self._listener_lock:
+            if self._listener is None:
+                self._listener = threading.Thread(target=self._listen, name='notification-listener', daemon=True)
+                self._listener.start()
+        return subscription
+
+    def _listen(self):
+        while True:
+            try:
+                listen_connection = connection.get_new_connection(connection.get_connection_params())
+                listen_connection.autocommit = True
+                try:
+                    with listen_connection.cursor() as cursor:
+                        cursor.execute(f'LISTEN {NOTIFICATION_CHANNEL}')
+                    self._receive(listen_connection)
+                finally:
+                    listen_connection.close()
+            except Exception as e:
+                logger.error(f"Notification listener lost its connection: {str(e)}")
+            time.sleep(self.RECONNECT_DELAY)
+
+    def _receive(self, listen_connection):
+        while True:
+            if select.select([listen_connection], [], [], 60) == ([], [], []):
+                continue
+            listen_connection.poll()
+            while listen_connection.notifies:
+                notify = listen_connection.notifies.pop(0)
+                try:
+                    message = json.loads(notify.payload)
+                    self.dispatch(message['channel'], message['event'])
+                except (ValueError, KeyError):
+                    logger.warning(f"Ignoring malformed notification payload: {notify.payload[:200]}")
+
+
+_broker = None
+_broker_lock = threading.Lock()
+
+
+def get_broker():
+    """
+    Get the process-wide notification broker
+
+    NOTIFICATION_BROKER picks the class; by default Postgres databases use
+    LISTEN/NOTIFY and anything else (SQLite in development and tests) the
+    in-memory broker.
+    """
+    global _broker
+    if _broker is None:
+        with _broker_lock:
+            if _broker is None:
+                if NOTIFICATION_BROKER:
+                    broker_class = import_string(NOTIFICATION_BROKER)
+                elif connection.vendor == 'postgresql':
+                    broker_class = PostgresBroker
+                else:
+                    broker_class = InMemoryBroker
+                _broker = broker_class()
+    return _broker
+
+
+def publish(events):
+    """
+    Publish notification events through the process broker, never failing the caller
+
+    Args:
+        events (list): (channel, event dict) pairs
+    """
+    if not events:
+        return
+    try:
+        get_broker().publish(events)
+    except Exception as e:
+        logger.error(f"Failed to publish notification events: {str(e)}")
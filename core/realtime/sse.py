@@ -0,0 +1,150 @@
+import asyncio
+import json
+import logging
+from http.cookies import SimpleCookie
+from types import SimpleNamespace
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.auth import get_user
+from django.utils.module_loading import import_string
+from core.models import UserProfile
+from core.realtime.pubsub import get_broker, employer_channel, candidate_channel
+
+logger = logging.getLogger(__name__)
+
+# Seconds between keep-alive comments, below the idle timeout of most proxies
+SSE_KEEPALIVE_INTERVAL = getattr(settings, 'SSE_KEEPALIVE_INTERVAL', 25)
+
+# Milliseconds the browser waits before reconnecting a dropped stream
+SSE_RETRY_MS = 10000
+
+
+def format_event(event_type, data):
+    """
+    Encode one Server-Sent Event
+
+    Args:
+        event_type (str): Event name the browser listens for
+        data (dict): JSON payload
+
+    Returns:
+        bytes: The event, terminated by a blank line
+    """
+    return f"event: {event_type}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n".encode('utf-8')
+
+
+def _session_key(scope):
+    for name, value in scope.get('headers', ()):
+        if name == b'cookie':
+            cookie = SimpleCookie()
+            cookie.load(value.decode('latin-1'))
+            morsel = cookie.get(settings.SESSION_COOKIE_NAME)
+            return morsel.value if morsel else None
+    return None
+
+
+def resolve_stream(session_key):
+    """
+    Find the channel and current unread count of the user behind a session
+
+    Args:
+        session_key (str): Session cookie value
+
+    Returns:
+        tuple: (channel, unread count), or None when the session has no
+        employer or candidate behind it
+    """
+    if not session_key:
+        return None
+    session = import_string(settings.SESSION_ENGINE).SessionStore(session_key)
+    user = get_user(SimpleNamespace(session=session))
+    if not user.is_authenticated:
+        return None
+
+    try:
+        profile = UserProfile.objects.select_related('employer_profile').get(user=user)
+    except UserProfile.DoesNotExist:
+        return None
+
+    if profile.role == 'employer' and profile.employer_profile:
+        return employer_channel(profile.employer_profile.id), max(profile.employer_profile.unread_notification_count, 0)
+    if profile.role == 'candidate':
+        return candidate_channel(user.id), max(profile.unread_notification_count, 0)
+    return None
+
+
+class NotificationStream:
+    """
+    ASGI app streaming a user's notification events as Server-Sent Events
+
+    The stream opens with an unread_count event carrying the profile's
+    counter, then relays what the broker publishes for the user's channel:
+    "notification" events for new notifications and "read" events when
+    notifications are marked read, both with an unread_delta for the badge.
+    Only the opening lookup touches the database; an idle stream costs a
+    keep-alive comment every SSE_KEEPALIVE_INTERVAL seconds.
+
+    It is a plain ASGI app rather than a Django view because Django 3.2
+    consumes streaming responses synchronously, which would hold a worker
+    thread for the lifetime of every open stream.
+    """
+
+    def __init__(self, broker=None, keepalive_interval=SSE_KEEPALIVE_INTERVAL):
+        self.broker = broker
+        self.keepalive_interval = keepalive_interval
+
+    async def __call__(self, scope, receive, send):
+        stream = await sync_to_async(resolve_stream)(_session_key(scope))
+        if stream is None:
+            await send({'type': 'http.response.start', 'status': 403, 'headers': [(b'content-type', b'text/plain')]})
+            await send({'type': 'http.response.body', 'body': b'Forbidden'})
+            return
+
+        channel, unread_count = stream
+        subscription = (self.broker or get_broker()).subscribe(channel)
+        disconnected = asyncio.ensure_future(self._wait_for_disconnect(receive))
+        try:
+            await send({
+                'type': 'http.response.start',
+                'status': 200,
+                'headers': [
+                    (b'content-type', b'text/event-stream; charset=utf-8'),
+                    (b'cache-control', b'no-cache'),
+                    # Stop nginx-style proxies from buffering the stream
+                    (b'x-accel-buffering', b'no'),
+                ],
+            })
+            await send({
+                'type': 'http.response.body',
+                'body': f"retry: {SSE_RETRY_MS}\n\n".encode() + format_event('unread_count', {'count': unread_count}),
+                'more_body': True,
+            })
+
+            while not disconnected.done():
+                next_event = asyncio.ensure_future(subscription.get())
+                done, _ = await asyncio.wait(
+                    {next_event, disconnected},
+                    timeout=self.keepalive_interval,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                if next_event in done:
+                    event = next_event.result()
+                    body = format_event(event['type'], event)
+                else:
+                    next_event.cancel()
+                    if disconnected in done:
+                        break
+                    body = b': keepalive\n\n'
+                await send({'type': 'http.response.body', 'body': body, 'more_body': True})
+        finally:
+            subscription.close()
+            disconnected.cancel()
+
+        await send({'type': 'http.response.body', 'body': b''})
+
+    @staticmethod
+    async def _wait_for_disconnect(receive):
+        while True:
+            message = await receive()
+            if message['type'] == 'http.disconnect':
+                return
@@ -1,5 +1,6 @@
 from django.db.models import Count, Q
 from core.models import JobApplication
+from core.search.normalization import tokenize_query
 
 class ApplicationRepository:
     """
@@ -8,13 +9,15 @@ class ApplicationRepository:
     """
     
     @staticmethod
-    def get_applications_by_job(job_id, status_filter=None):
+    def get_applications_by_job(job_id, status_filter=None, search_query=None):
         """
         Get all applications for a specific job
         
         Args:
             job_id (int): ID of the job
             status_filter (str): Optional status filter
+            search_query (str): Optional applicant name/email search; every
+                term has to appear in the normalized applicant_search column
             
         Returns:
             QuerySet: Filtered job applications
@@ -23,8 +26,11 @@ class ApplicationRepository:
         
         if status_filter:
             query = query.filter(status=status_filter)
+        
+        for term in tokenize_query(search_query):
+            query = query.filter(applicant_search__contains=term)
             
-        return query.order_by('-applied_at')
+        return query.order_by('-applied_at', '-id')
     
     @staticmethod
     def get_applications_by_employer(employer_profile, unread_only=False):
@@ -71,19 +77,19 @@ class ApplicationRepository:
             employer_profile (EmployerProfile): Optional employer profile to filter by
             
         Returns:
-            dict: Dictionary of status counts
+            dict: Dictionary of status counts (every status is present)
         """
-        query = JobApplication.objects
+        query = JobApplication.objects.all()
         
         if job_id:
             query = query.filter(job_id=job_id)
         elif employer_profile:
             query = query.filter(job__employer=employer_profile)
         
-        status_counts = {}
-        for status_choice in JobApplication.STATUS_CHOICES:
-            status_code = status_choice[0]
-            status_counts[status_code] = query.filter(status=status_code).count()
+        # One GROUP BY query instead of a count per status
+        status_counts = {status_code: 0 for status_code, _ in JobApplication.STATUS_CHOICES}
+        for row in query.order_by().values('status').annotate(total=Count('id')):
+            status_counts[row['status']] = row['total']
             
         return status_counts
     
@@ -139,4 +145,37 @@ class ApplicationRepository:
             application.save(update_fields=['is_viewed'])
             return True
         except JobApplication.DoesNotExist:
-            return False 
\ No newline at end of file
+            return False
+    
+    @staticmethod
+    def mark_applications_as_read(application_ids):
+        """
+        Mark several applications as read with a single UPDATE
+        
+        Args:
+            application_ids (list): IDs of the applications (e.g. the visible page)
+            
+        Returns:
+            int: Number of applications that were unread and are now marked as read
+        """
+        if not application_ids:
+            return 0
+        return JobApplication.objects.filter(id__in=application_ids, is_read=False).update(is_read=True)
+    
+    @staticmethod
+    def mark_candidate_applications_as_viewed(user_id, employer_profile):
+        """
+        Mark all applications of a candidate to an employer's jobs as viewed with a single UPDATE
+        
+        Args:
+            user_id (int): ID of the candidate user
+            employer_profile (EmployerProfile): The employer viewing the CV
+            
+        Returns:
+            int: Number of applications newly marked as viewed
+        """
+        return JobApplication.objects.filter(
+            user_id=user_id,
+            job__employer=employer_profile,
+            is_viewed=False
+        ).update(is_viewed=True)
@@ -1,5 +1,6 @@
 from django.db.models import Q
 from core.models import JobListing
+from core.search import search_jobs
 from django.utils import timezone
 
 class JobRepository:
@@ -29,7 +30,12 @@ class JobRepository:
         if filters:
             query = JobRepository._apply_job_filters(query, filters)
         
-        return query.order_by('-premium_level', '-posted_at')
+        # premium_rank orders the levels (premium_level sorts alphabetically)
+        if filters and filters.get('search'):
+            # Keep premium jobs on top, rank search hits within each premium level
+            return query.order_by('-premium_rank', '-search_rank', '-posted_at')
+        
+        return query.order_by('-premium_rank', '-posted_at')
     
     @staticmethod
     def get_job_by_id(job_id):
@@ -70,26 +76,21 @@ class JobRepository:
     @staticmethod
     def search_jobs(query_string, employer_profile=None):
         """
-        Search for jobs by title, company, location, or category
+        Full-text search for jobs by title, company, location, category or description
         
         Args:
             query_string (str): Search query
             employer_profile (EmployerProfile): Optional employer profile to filter by
             
         Returns:
-            QuerySet: Filtered job listings
+            QuerySet: Filtered job listings annotated with search_rank
         """
-        search_filter = (
-            Q(title__icontains=query_string) |
-            Q(company__icontains=query_string) |
-            Q(location__icontains=query_string) |
-            Q(category__icontains=query_string)
-        )
-        
         if employer_profile:
-            return JobListing.objects.filter(search_filter, employer=employer_profile)
+            query = JobListing.objects.filter(employer=employer_profile)
         else:
-            return JobListing.objects.filter(search_filter, status='approved')
+            query = JobListing.objects.filter(status='approved')
+        
+        return search_jobs(query, query_string)
     
     @staticmethod
     def _apply_job_filters(query, filters):
@@ -119,10 +120,6 @@ class JobRepository:
             query = query.filter(considers_students=filters['considers_students'])
             
         if 'search' in filters and filters['search']:
-            search_term = filters['search']
-            query = query.filter(
-                Q(title__icontains=search_term) | 
-                Q(company__icontains=search_term)
-            )
+            query = search_jobs(query, filters['search'])
             
         return query 
\ No newline at end of file
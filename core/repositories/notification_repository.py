@@ -1,5 +1,71 @@
-from django.db.models import Count
-from core.models import EmployerNotification, CandidateNotification
+from collections import Counter, defaultdict
+from datetime import timedelta
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, F, OuterRef, Subquery, Sum, IntegerField
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+from core.models import EmployerNotification, CandidateNotification, EmployerProfile, UserProfile
+from core.realtime.pubsub import publish, employer_channel, candidate_channel
+
+# New applications and status updates of a job collapse into its unread
+# notification of the same type while the previous event is at most this old
+NOTIFICATION_COALESCE_WINDOW = timedelta(hours=getattr(settings, 'NOTIFICATION_COALESCE_WINDOW_HOURS', 12))
+
+
+def _adjust_counter(queryset_by_id, counts):
+    """
+    Add per-row deltas to unread_notification_count with one UPDATE per distinct delta
+
+    Args:
+        queryset_by_id (callable): ids -> QuerySet of the rows to update
+        counts (dict): row id -> delta
+    """
+    ids_by_delta = defaultdict(list)
+    for row_id, delta in counts.items():
+        if row_id and delta:
+            ids_by_delta[delta].append(row_id)
+    for delta, ids in ids_by_delta.items():
+        queryset_by_id(ids).update(unread_notification_count=F('unread_notification_count') + delta)
+
+
+def _publish_on_commit(events):
+    """
+    Push events to the notification streams once the transaction commits,
+    so browsers never hear about rows that get rolled back
+
+    Args:
+        events (list): (channel, event dict) pairs
+    """
+    if events:
+        transaction.on_commit(lambda: publish(events))
+
+
+def _employer_event(notification, unread_delta=1):
+    return employer_channel(notification.employer_profile_id), {
+        'type': 'notification',
+        'id': notification.id,
+        'notification_type': notification.notification_type,
+        'message': notification.message,
+        'job_id': notification.job_id,
+        'event_count': notification.event_count,
+        'unread_delta': unread_delta,
+    }
+
+
+def _candidate_event(notification):
+    return candidate_channel(notification.user_id), {
+        'type': 'notification',
+        'id': notification.id,
+        'notification_type': notification.notification_type,
+        'message': notification.message,
+        'application_id': notification.application_id,
+        'unread_delta': 1,
+    }
+
+
+def _read_events(channel_for, counts):
+    return [(channel_for(row_id), {'type': 'read', 'unread_delta': -count}) for row_id, count in counts.items() if count]
 
 class NotificationRepository:
     """
@@ -10,7 +76,10 @@ class NotificationRepository:
     @staticmethod
     def create_job_status_notification(employer_profile, job, message):
         """
-        Create a job status update notification
+        Create a job status update notification, or fold it into the job's unread one
+        
+        A status update within NOTIFICATION_COALESCE_WINDOW of the job's unread
+        status update bumps its event_count and replaces its message.
         
         Args:
             employer_profile (EmployerProfile): The employer profile
@@ -18,39 +87,176 @@ class NotificationRepository:
             message (str): The notification message
             
         Returns:
-            EmployerNotification: The created notification
+            EmployerNotification: The created or updated notification
+        """
+        now = timezone.now()
+        with transaction.atomic():
+            notification = NotificationRepository._coalescable_notification(
+                employer_profile, job, 'job_status_update', now
+            )
+            if notification is not None:
+                notification.event_count += 1
+                notification.message = message
+                notification.last_event_at = now
+                notification.save(update_fields=['event_count', 'message', 'last_event_at'])
+                _publish_on_commit([_employer_event(notification, unread_delta=0)])
+                return notification
+            
+            notification = EmployerNotification(
+                employer_profile=employer_profile,
+                job=job,
+                notification_type='job_status_update',
+                message=message,
+                last_event_at=now,
+            )
+            notification.save()
+            NotificationRepository.adjust_employer_unread_counts({employer_profile.id: 1})
+        _publish_on_commit([_employer_event(notification)])
+        return notification
+    
+    @staticmethod
+    def _coalescable_notification(employer_profile, job, notification_type, now):
         """
-        notification = EmployerNotification(
+        Lock and return the job's unread notification of a type that new events
+        may still be folded into, or None
+        """
+        if job is None:
+            return None
+        # The row lock makes concurrent events queue up on the same row
+        return EmployerNotification.objects.select_for_update().filter(
             employer_profile=employer_profile,
             job=job,
-            notification_type='job_status_update',
-            message=message
-        )
-        notification.save()
-        return notification
+            notification_type=notification_type,
+            is_read=False,
+            last_event_at__gte=now - NOTIFICATION_COALESCE_WINDOW,
+        ).order_by('-last_event_at').first()
     
     @staticmethod
-    def create_new_application_notification(employer_profile, job, message):
+    def create_new_application_notification(employer_profile, job, message, actor=''):
         """
-        Create a new application notification
+        Create a new application notification, or fold it into the job's unread one
+        
+        Applications arriving within NOTIFICATION_COALESCE_WINDOW of the previous
+        one while it is still unread bump its event_count and summary instead of
+        adding a row, so a popular posting doesn't produce hundreds of rows a day.
         
         Args:
             employer_profile (EmployerProfile): The employer profile
             job (JobListing): The job listing
-            message (str): The notification message
+            message (str): The notification message (used when a new row is created)
+            actor (str): Name of the applicant, kept as the latest actor
             
         Returns:
-            EmployerNotification: The created notification
+            EmployerNotification: The created or updated notification
         """
-        notification = EmployerNotification(
-            employer_profile=employer_profile,
-            job=job,
-            notification_type='new_application',
-            message=message
-        )
-        notification.save()
+        now = timezone.now()
+        with transaction.atomic():
+            notification = NotificationRepository._coalescable_notification(
+                employer_profile, job, 'new_application', now
+            )
+            
+            if notification is not None:
+                notification.event_count += 1
+                notification.latest_actor = actor
+                notification.last_event_at = now
+                notification.message = NotificationRepository.coalesced_application_message(
+                    notification.event_count, job.title, actor
+                )
+                notification.save(update_fields=['event_count', 'latest_actor', 'last_event_at', 'message'])
+                _publish_on_commit([_employer_event(notification, unread_delta=0)])
+                return notification
+            
+            notification = EmployerNotification(
+                employer_profile=employer_profile,
+                job=job,
+                notification_type='new_application',
+                message=message,
+                latest_actor=actor,
+                last_event_at=now,
+            )
+            notification.save()
+            NotificationRepository.adjust_employer_unread_counts({employer_profile.id: 1})
+        _publish_on_commit([_employer_event(notification)])
         return notification
     
+    @staticmethod
+    def coalesced_application_message(event_count, job_title, actor):
+        """
+        Build the summary of a coalesced new application notification
+        
+        Args:
+            event_count (int): Number of applications the row stands for
+            job_title (str): Title of the job
+            actor (str): Name of the latest applicant
+            
+        Returns:
+            str: The notification message
+        """
+        message = f"{event_count} new applications for your job '{job_title}'."
+        if actor:
+            message += f" Latest from {actor}."
+        return message
+    
+    @staticmethod
+    def create_job_status_notifications(entries):
+        """
+        Create job status update notifications for many jobs at once
+        
+        Like new applications, a status update arriving within
+        NOTIFICATION_COALESCE_WINDOW of the job's unread status update is
+        folded into it: the row's event_count is bumped and it shows the
+        latest message. The unread rows are locked with one query, then new
+        rows are inserted and folded ones updated in bulk.
+        
+        Args:
+            entries (list): Dicts with employer_profile_id, job_id, job_title and message
+            
+        Returns:
+            list: The created or updated notification of each entry
+                (created ones only carry their id where bulk_create returns it)
+        """
+        now = timezone.now()
+        job_ids = {entry['job_id'] for entry in entries if entry['job_id']}
+        with transaction.atomic():
+            unread = {}
+            if job_ids:
+                # Oldest first, so the latest row of a job wins
+                for notification in EmployerNotification.objects.select_for_update().filter(
+                    job_id__in=job_ids,
+                    notification_type='job_status_update',
+                    is_read=False,
+                    last_event_at__gte=now - NOTIFICATION_COALESCE_WINDOW,
+                ).order_by('last_event_at', 'id'):
+                    unread[(notification.employer_profile_id, notification.job_id)] = notification
+            
+            notifications, created, folded = [], [], {}
+            for entry in entries:
+                key = (entry['employer_profile_id'], entry['job_id'])
+                notification = unread.get(key) if entry['job_id'] else None
+                if notification is None:
+                    notification = EmployerNotification(notification_type='job_status_update', last_event_at=now, **entry)
+                    created.append(notification)
+                    if entry['job_id']:
+                        unread[key] = notification
+                else:
+                    notification.event_count += 1
+                    notification.message = entry['message']
+                    notification.last_event_at = now
+                    if notification.pk:
+                        folded[notification.pk] = notification
+                notifications.append(notification)
+            
+            EmployerNotification.objects.bulk_create(created)
+            EmployerNotification.objects.bulk_update(list(folded.values()), ['event_count', 'message', 'last_event_at'])
+            NotificationRepository.adjust_employer_unread_counts(
+                Counter(notification.employer_profile_id for notification in created)
+            )
+        _publish_on_commit(
+            [_employer_event(notification) for notification in created] +
+            [_employer_event(notification, unread_delta=0) for notification in folded.values()]
+        )
+        return notifications
+    
     @staticmethod
     def get_employer_notifications(employer_profile, unread_only=False):
         """
@@ -68,7 +274,7 @@ class NotificationRepository:
         if unread_only:
             query = query.filter(is_read=False)
             
-        return query.order_by('-created_at')
+        return query.order_by('-last_event_at')
     
     @staticmethod
     def get_unread_notification_count(employer_profile):
@@ -89,20 +295,41 @@ class NotificationRepository:
     @staticmethod
     def get_unread_notification_count_by_job(employer_profile, job_id):
         """
-        Get count of unread notifications for a specific job
+        Get count of unread notification events for a specific job
         
         Args:
             employer_profile (EmployerProfile): The employer profile
             job_id (int): ID of the job
             
         Returns:
-            int: Count of unread notifications
+            int: Count of unread events (a coalesced notification counts each of its events)
         """
         return EmployerNotification.objects.filter(
             employer_profile=employer_profile,
             job_id=job_id,
             is_read=False
-        ).count()
+        ).aggregate(count=Coalesce(Sum('event_count'), 0))['count']
+    
+    @staticmethod
+    def unread_notification_count_subquery(employer_profile):
+        """
+        Build an expression counting a job's unread notification events (summing
+        event_count of coalesced rows), for annotating a JobListing queryset
+        without joining (and multiplying) other counts
+        
+        Args:
+            employer_profile (EmployerProfile): The employer profile
+            
+        Returns:
+            Coalesce: Integer expression, 0 when the job has no unread notifications
+        """
+        counts = EmployerNotification.objects.filter(
+            employer_profile=employer_profile,
+            job_id=OuterRef('pk'),
+            is_read=False
+        ).order_by().values('job_id').annotate(count=Sum('event_count')).values('count')
+        
+        return Coalesce(Subquery(counts, output_field=IntegerField()), 0)
     
     @staticmethod
     def mark_notification_as_read(notification_id):
@@ -117,11 +344,14 @@ class NotificationRepository:
         """
         try:
             notification = EmployerNotification.objects.get(id=notification_id)
-            notification.is_read = True
-            notification.save(update_fields=['is_read'])
-            return True
         except EmployerNotification.DoesNotExist:
             return False
+        
+        # Only the request that actually flips the flag moves the counter
+        if EmployerNotification.objects.filter(id=notification_id, is_read=False).update(is_read=True):
+            NotificationRepository.adjust_employer_unread_counts({notification.employer_profile_id: -1})
+            _publish_on_commit(_read_events(employer_channel, {notification.employer_profile_id: 1}))
+        return True
     
     @staticmethod
     def mark_all_notifications_as_read(employer_profile):
@@ -134,10 +364,13 @@ class NotificationRepository:
         Returns:
             int: Number of notifications marked as read
         """
-        return EmployerNotification.objects.filter(
+        count = EmployerNotification.objects.filter(
             employer_profile=employer_profile,
             is_read=False
         ).update(is_read=True)
+        NotificationRepository.adjust_employer_unread_counts({employer_profile.id: -count})
+        _publish_on_commit(_read_events(employer_channel, {employer_profile.id: count}))
+        return count
     
     @staticmethod
     def mark_job_notifications_as_read(employer_profile, job_id):
@@ -151,11 +384,14 @@ class NotificationRepository:
         Returns:
             int: Number of notifications marked as read
         """
-        return EmployerNotification.objects.filter(
+        count = EmployerNotification.objects.filter(
             employer_profile=employer_profile,
             job_id=job_id,
             is_read=False
         ).update(is_read=True)
+        NotificationRepository.adjust_employer_unread_counts({employer_profile.id: -count})
+        _publish_on_commit(_read_events(employer_channel, {employer_profile.id: count}))
+        return count
         
     @staticmethod
     def create_application_status_notification(user, application, message):
@@ -177,8 +413,32 @@ class NotificationRepository:
             message=message
         )
         notification.save()
+        NotificationRepository.adjust_candidate_unread_counts({user.id: 1})
+        _publish_on_commit([_candidate_event(notification)])
         return notification
     
+    @staticmethod
+    def create_application_status_notifications(entries):
+        """
+        Create application status update notifications for many candidates at once
+        
+        bulk_create skips CandidateNotification.save(), so the job title and
+        company are passed in rather than looked up per application.
+        
+        Args:
+            entries (list): Dicts with user_id, application_id, job_title, company_name and message
+            
+        Returns:
+            list: The created notifications
+        """
+        notifications = CandidateNotification.objects.bulk_create([
+            CandidateNotification(notification_type='application_status_update', **entry)
+            for entry in entries
+        ])
+        NotificationRepository.adjust_candidate_unread_counts(Counter(entry['user_id'] for entry in entries))
+        _publish_on_commit([_candidate_event(notification) for notification in notifications])
+        return notifications
+    
     @staticmethod
     def create_interview_invitation_notification(user, application, message):
         """
@@ -199,6 +459,8 @@ class NotificationRepository:
             message=message
         )
         notification.save()
+        NotificationRepository.adjust_candidate_unread_counts({user.id: 1})
+        _publish_on_commit([_candidate_event(notification)])
         return notification
     
     @staticmethod
@@ -249,11 +511,13 @@ class NotificationRepository:
         """
         try:
             notification = CandidateNotification.objects.get(id=notification_id)
-            notification.is_read = True
-            notification.save(update_fields=['is_read'])
-            return True
         except CandidateNotification.DoesNotExist:
             return False
+        
+        if CandidateNotification.objects.filter(id=notification_id, is_read=False).update(is_read=True):
+            NotificationRepository.adjust_candidate_unread_counts({notification.user_id: -1})
+            _publish_on_commit(_read_events(candidate_channel, {notification.user_id: 1}))
+        return True
     
     @staticmethod
     def mark_all_candidate_notifications_as_read(user):
@@ -266,7 +530,86 @@ class NotificationRepository:
         Returns:
             int: Number of notifications marked as read
         """
-        return CandidateNotification.objects.filter(
+        count = CandidateNotification.objects.filter(
             user=user,
             is_read=False
-        ).update(is_read=True) 
\ No newline at end of file
+        ).update(is_read=True)
+        NotificationRepository.adjust_candidate_unread_counts({user.id: -count})
+        _publish_on_commit(_read_events(candidate_channel, {user.id: count}))
+        return count
+    
+    @staticmethod
+    def adjust_employer_unread_counts(counts):
+        """
+        Move the unread notification counters of employers
+        
+        Args:
+            counts (dict): EmployerProfile id -> delta
+        """
+        _adjust_counter(lambda ids: EmployerProfile.all_objects.filter(id__in=ids), counts)
+    
+    @staticmethod
+    def adjust_candidate_unread_counts(counts):
+        """
+        Move the unread notification counters of candidates
+        
+        Args:
+            counts (dict): User id -> delta
+        """
+        _adjust_counter(lambda ids: UserProfile.objects.filter(user_id__in=ids), counts)
+    
+    @staticmethod
+    def reconcile_unread_notification_counts(dry_run=False):
+        """
+        Recount the unread notification counters of every employer and candidate
+        
+        Catches drift from changes that bypass the repository (admin edits,
+        deletes, raw SQL).
+        
+        Args:
+            dry_run (bool): Only report the profiles whose counter is off
+            
+        Returns:
+            dict: {'employers': [(id, stored, actual)], 'candidates': [(user id, stored, actual)]}
+        """
+        employer_actual = Coalesce(Subquery(
+            EmployerNotification.objects.filter(employer_profile_id=OuterRef('pk'), is_read=False)
+            .order_by().values('employer_profile_id').annotate(count=Count('id')).values('count'),
+            output_field=IntegerField()
+        ), 0)
+        candidate_actual = Coalesce(Subquery(
+            CandidateNotification.objects.filter(user_id=OuterRef('user_id'), is_read=False)
+            .order_by().values('user_id').annotate(count=Count('id')).values('count'),
+            output_field=IntegerField()
+        ), 0)
+        
+        drift = {
+            'employers': list(
+                EmployerProfile.all_objects.annotate(actual=employer_actual)
+                .exclude(unread_notification_count=F('actual'))
+                .values_list('id', 'unread_notification_count', 'actual')
+            ),
+            'candidates': list(
+                UserProfile.objects.annotate(actual=candidate_actual)
+                .exclude(unread_notification_count=F('actual'))
+                .values_list('user_id', 'unread_notification_count', 'actual')
+            ),
+        }
+        
+        if not dry_run:
+            # Recount in the UPDATE itself, so notifications created since the check are included
+            if drift['employers']:
+                EmployerProfile.all_objects.filter(id__in=[row[0] for row in drift['employers']]).update(
+                    unread_notification_count=employer_actual
+                )
+            if drift['candidates']:
+                UserProfile.objects.filter(user_id__in=[row[0] for row in drift['candidates']]).update(
+                    unread_notification_count=candidate_actual
+                )
+            # Open streams applied deltas to the wrong base, send them the corrected count
+            _publish_on_commit(
+                [(employer_channel(row[0]), {'type': 'unread_count', 'count': row[2]}) for row in drift['employers']]
+                + [(candidate_channel(row[0]), {'type': 'unread_count', 'count': row[2]}) for row in drift['candidates']]
+            )
+
+        return drift
@@ -0,0 +1,17 @@
+from core.search.normalization import (
+    normalize_search_text, tokenize_query, build_search_document, build_job_search_document,
+    build_applicant_search_document,
+)
+from core.search.backends import search_jobs, uses_full_text_search
+from core.search.facets import count_job_facets
+
+__all__ = [
+    'normalize_search_text',
+    'tokenize_query',
+    'build_search_document',
+    'build_job_search_document',
+    'build_applicant_search_document',
+    'search_jobs',
+    'uses_full_text_search',
+    'count_job_facets',
+]
@@ -0,0 +1,90 @@
+import logging
+from django.db import connections
+from django.db.models import Case, When, Value, FloatField, Q
+from django.db.models.expressions import RawSQL
+from core.search.normalization import tokenize_query
+
+logger = logging.getLogger(__name__)
+
+# Text search configuration used for the generated search_vector column.
+# 'simple' only lowercases, which is what we want for mixed Georgian/Latin text
+# (Postgres ships no Georgian stemmer).
+SEARCH_CONFIG = 'simple'
+
+
+def uses_full_text_search(using='default'):
+    """
+    Check whether the database behind the queryset supports the
+    search_vector column (only created on PostgreSQL)
+    """
+    return connections[using].vendor == 'postgresql'
+
+
+def _build_tsquery(terms):
+    """
+    Build a prefix-matching tsquery string ("term1:* & term2:*")
+    Terms are already normalized, so they contain only letters and digits.
+    """
+    return ' & '.join(f'{term}:*' for term in terms)
+
+
+def _postgres_search(queryset, terms):
+    table = connections[queryset.db].ops.quote_name(queryset.model._meta.db_table)
+    tsquery = _build_tsquery(terms)
+
+    return queryset.annotate(
+        search_rank=RawSQL(
+            # Cast to double precision so the value survives a round trip through
+            # a pagination cursor and still compares equal to the column value
+            f"ts_rank({table}.search_vector, to_tsquery('{SEARCH_CONFIG}', %s))::double precision",
+            (tsquery,),
+            output_field=FloatField(),
+        )
+    ).extra(
+        where=[f"{table}.search_vector @@ to_tsquery('{SEARCH_CONFIG}', %s)"],
+        params=[tsquery],
+    )
+
+
+def _fallback_search(queryset, terms):
+    """
+    Portable search for SQLite (dev and tests): every term has to appear in the
+    normalized search document. Title matches rank above body matches.
+    """
+    match_filter = Q()
+    title_match = Q()
+    for term in terms:
+        match_filter &= Q(search_document__contains=term)
+        title_match &= Q(title__icontains=term)
+
+    return queryset.filter(match_filter).annotate(
+        search_rank=Case(
+            When(title_match, then=Value(1.0)),
+            default=Value(0.5),
+            output_field=FloatField(),
+        )
+    )
+
+
+def search_jobs(queryset, query_string):
+    """
+    Filter a JobListing queryset by a free text query and annotate each
+    row with a ``search_rank`` (higher is more relevant)
+
+    Uses the GIN-indexed search_vector on PostgreSQL and a normalized
+    substring match elsewhere.
+
+    Args:
+        queryset (QuerySet): JobListing queryset to filter
+        query_string (str): Raw user query
+
+    Returns:
+        QuerySet: Filtered queryset annotated with search_rank
+    """
+    terms = tokenize_query(query_string)
+    if not terms:
+        return queryset.annotate(search_rank=Value(0.0, output_field=FloatField()))
+
+    if uses_full_text_search(queryset.db):
+        return _postgres_search(queryset, terms)
+    return _fallback_search(queryset, terms)
@@ -0,0 +1,49 @@
+from collections import defaultdict
+from django.db.models import Count
+
+# Choice fields counted per value
+JOB_FACET_FIELDS = ('premium_level', 'category', 'location', 'experience', 'job_preferences')
+
+# Boolean fields counted as "number of jobs where the flag is set"
+JOB_FACET_FLAGS = ('considers_students', 'georgian_language_only')
+
+
+def count_job_facets(queryset):
+    """
+    Count a filtered JobListing queryset per filter option in a single query
+
+    The queryset is grouped once by every facet column together; the per-facet
+    counts are then summed up in Python. The number of distinct combinations
+    is bounded by the choice lists, so the result set stays small.
+
+    Args:
+        queryset (QuerySet): The already filtered JobListing queryset
+
+    Returns:
+        dict: {
+            'total': int,
+            'premium_level': {value: count}, 'category': {...}, 'location': {...},
+            'experience': {...}, 'job_preferences': {...},
+            'considers_students': int, 'georgian_language_only': int,
+        }
+    """
+    facets = {field: defaultdict(int) for field in JOB_FACET_FIELDS}
+    flags = {flag: 0 for flag in JOB_FACET_FLAGS}
+    total = 0
+
+    # order_by() drops the default ordering so it doesn't leak into GROUP BY
+    rows = queryset.order_by().values(*JOB_FACET_FIELDS, *JOB_FACET_FLAGS).annotate(facet_count=Count('pk'))
+
+    for row in rows:
+        count = row['facet_count']
+        total += count
+        for field in JOB_FACET_FIELDS:
+            facets[field][row[field]] += count
+        for flag in JOB_FACET_FLAGS:
+            if row[flag]:
+                flags[flag] += count
+
+    result = {field: dict(counts) for field, counts in facets.items()}
+    result.update(flags)
+    result['total'] = total
+    return result
@@ -0,0 +1,150 @@
+import html
+import re
+import unicodedata
+from django.utils.html import strip_tags
+
+# National system of romanization of Georgian (2002), used so that a query
+# typed on a Latin keyboard ("tbilisi") still matches Georgian text ("თბილისი")
+GEORGIAN_TO_LATIN = {
+    'ა': 'a', 'ბ': 'b', 'გ': 'g', 'დ': 'd', 'ე': 'e', 'ვ': 'v', 'ზ': 'z',
+    'თ': 't', 'ი': 'i', 'კ': 'k', 'ლ': 'l', 'მ': 'm', 'ნ': 'n', 'ო': 'o',
+    'პ': 'p', 'ჟ': 'zh', 'რ': 'r', 'ს': 's', 'ტ': 't', 'უ': 'u', 'ფ': 'p',
+    'ქ': 'k', 'ღ': 'gh', 'ყ': 'q', 'შ': 'sh', 'ჩ': 'ch', 'ც': 'ts', 'ძ': 'dz',
+    'წ': 'ts', 'ჭ': 'ch', 'ხ': 'kh', 'ჯ': 'j', 'ჰ': 'h',
+}
+
+# Anything that is not a letter or a digit separates tokens
+TOKEN_SEPARATOR_RE = re.compile(r'[\W_]+', re.UNICODE)
+
+# Hard cap on the number of query terms, so a pasted paragraph can't build a huge tsquery
+MAX_QUERY_TERMS = 8
+
+
+def _fold_character(char):
+    """
+    Fold a single character to its search form.
+    Latin letters lose their diacritics, Georgian letters are kept as they are.
+    """
+    decomposed = unicodedata.normalize('NFKD', char)
+    return ''.join(c for c in decomposed if not unicodedata.combining(c))
+
+
+def normalize_search_text(text):
+    """
+    Normalize free text (or CKEditor HTML) for indexing and querying
+
+    - HTML tags are removed and entities unescaped
+    - Text is case-folded; Georgian Mtavruli capitals fold to Mkhedruli
+    - Latin diacritics are stripped (é -> e)
+    - Punctuation collapses to single spaces
+
+    Args:
+        text (str): Raw text or HTML
+
+    Returns:
+        str: Space separated, normalized tokens
+    """
+    if not text:
+        return ''
+
+    text = html.unescape(strip_tags(str(text)))
+    text = unicodedata.normalize('NFKC', text).casefold()
+    text = ''.join(_fold_character(char) for char in text)
+    return ' '.join(TOKEN_SEPARATOR_RE.sub(' ', text).split())
+
+
+def transliterate_georgian(text):
+    """
+    Romanize the Georgian letters of already normalized text
+
+    Args:
+        text (str): Normalized text
+
+    Returns:
+        str: Text with Georgian letters replaced by their Latin equivalents
+    """
+    return ''.join(GEORGIAN_TO_LATIN.get(char, char) for char in text)
+
+
+def _contains_georgian(token):
+    return any(char in GEORGIAN_TO_LATIN for char in token)
+
+
+def tokenize_query(query_string):
+    """
+    Split a user query into normalized search terms
+
+    Args:
+        query_string (str): The raw query from the search box
+
+    Returns:
+        list: Unique normalized terms, in their original order
+    """
+    terms = []
+    for term in normalize_search_text(query_string).split():
+        if term not in terms:
+            terms.append(term)
+    return terms[:MAX_QUERY_TERMS]
+
+
+def build_search_document(*values):
+    """
+    Build the normalized search document for a set of field values
+
+    Georgian tokens are indexed twice: as written and romanized, so both
+    Georgian and Latin queries match them.
+
+    Args:
+        *values: Field values (plain text or HTML); empty values are skipped
+
+    Returns:
+        str: The search document
+    """
+    tokens = normalize_search_text(' '.join(str(value) for value in values if value)).split()
+
+    romanized = []
+    for token in tokens:
+        if _contains_georgian(token):
+            romanized.append(transliterate_georgian(token))
+
+    return ' '.join(tokens + romanized)
+
+
+def build_job_search_document(job):
+    """
+    Build the search document for a job listing
+
+    Args:
+        job (JobListing): The job listing (a historical model instance works too)
+
+    Returns:
+        str: The search document
+    """
+    return build_search_document(
+        job.title,
+        job.company,
+        job.category,
+        job.location,
+        job.experience,
+        job.job_preferences,
+        job.description,
+    )
+
+
+def build_applicant_search_document(application):
+    """
+    Build the search document for a job application's applicant
+
+    Registered applicants are found by their name and email, guests by the
+    name and email they entered.
+
+    Args:
+        application (JobApplication): The application (a historical model instance works too)
+
+    Returns:
+        str: The search document
+    """
+    user = application.user
+    if user is not None:
+        return build_search_document(user.first_name, user.last_name, user.email)
+    return build_search_document(application.guest_name, application.guest_email)
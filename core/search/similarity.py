@@ -0,0 +1,108 @@
+import math
+from collections import Counter, defaultdict
+from core.search.normalization import normalize_search_text
+
+# How much one occurrence of a feature counts towards the term frequency
+TITLE_WEIGHT = 3.0
+CATEGORY_WEIGHT = 2.0
+ATTRIBUTE_WEIGHT = 1.0
+
+# Pairs scoring below this are not considered similar at all
+MIN_SIMILARITY = 0.05
+
+
+def job_features(title, document, category, experience, location):
+    """
+    Turn the fields of a job into weighted term counts
+
+    Text terms come from the normalized search document (description,
+    company, romanized Georgian, ...) with title words counted extra.
+    Category, experience and location become single prefixed features so
+    they only match the exact same value.
+
+    Returns:
+        Counter: feature -> weighted count
+    """
+    features = Counter((document or '').split())
+    for term in normalize_search_text(title).split():
+        features[term] += TITLE_WEIGHT
+    if category:
+        features[f'category:{category}'] += CATEGORY_WEIGHT
+    if experience:
+        features[f'experience:{experience}'] += ATTRIBUTE_WEIGHT
+    if location:
+        features[f'location:{location}'] += ATTRIBUTE_WEIGHT
+    return features
+
+
+class SimilarityIndex:
+    """
+    TF-IDF vectors of a set of jobs with an inverted index for cosine scoring
+
+    Vectors are sparse dicts normalized to unit length, so the cosine
+    similarity of two jobs is the dot product of their vectors. Scoring one
+    job only visits the postings of its own terms.
+    """
+
+    def __init__(self, features_by_id):
+        """
+        Args:
+            features_by_id (dict): job id -> Counter from job_features()
+        """
+        total = len(features_by_id)
+        document_frequency = Counter()
+        for features in features_by_id.values():
+            document_frequency.update(features.keys())
+
+        # Smoothed idf that is 0 for terms present in every job, those can't tell jobs apart
+        idf = {term: math.log((1 + total) / (1 + count)) for term, count in document_frequency.items()}
+
+        self.vectors = {}
+        self.postings = defaultdict(list)
+        for job_id, features in features_by_id.items():
+            vector = {}
+            for term, count in features.items():
+                weight = (1 + math.log(count)) * idf[term] if count > 0 else 0
+                if weight > 0:
+                    vector[term] = weight
+            norm = math.sqrt(sum(weight * weight for weight in vector.values()))
+            if norm:
+                vector = {term: weight / norm for term, weight in vector.items()}
+            self.vectors[job_id] = vector
+            for term, weight in vector.items():
+                self.postings[term].append((job_id, weight))
+
+    def __contains__(self, job_id):
+        return job_id in self.vectors
+
+    def __iter__(self):
+        return iter(self.vectors)
+
+    def __len__(self):
+        return len(self.vectors)
+
+    def scores(self, job_id):
+        """
+        Cosine similarity of one job to every other job sharing a term with it
+
+        Returns:
+            dict: other job id -> score
+        """
+        scores = defaultdict(float)
+        for term, weight in self.vectors.get(job_id, {}).items():
+            for other_id, other_weight in self.postings[term]:
+                if other_id != job_id:
+                    scores[other_id] += weight * other_weight
+        return scores
+
+    def top_k(self, job_id, k):
+        """
+        The k most similar jobs, best first
+
+        Returns:
+            list: (other job id, score) tuples
+        """
+        candidates = [(other_id, score) for other_id, score in self.scores(job_id).items() if score >= MIN_SIMILARITY]
+        # Ties go to the newer job (higher id)
+        candidates.sort(key=lambda item: (-item[1], -item[0]))
+        return candidates[:k]
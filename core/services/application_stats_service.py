@@ -0,0 +1,214 @@
+import calendar
+import logging
+from collections import defaultdict
+from datetime import timedelta
+from django.db import transaction, IntegrityError
+from django.db.models import F, Count, Case, When, Value, CharField
+from django.db.models.functions import TruncDate, Coalesce
+from django.utils import timezone
+from core.models import ApplicationDailyStat, JobApplication, JobListing
+
+logger = logging.getLogger(__name__)
+
+# Number of categories shown in the "top categories" chart
+TOP_CATEGORIES = 5
+
+
+def _source_for(user_id):
+    return 'registered' if user_id else 'guest'
+
+
+class ApplicationStatsService:
+    """
+    Service class for the application analytics shown on employer_home
+
+    Applications are rolled up per employer, day, status, job category and
+    source (registered or guest) in ApplicationDailyStat. The rollup is kept
+    up to date by JobApplication signals and can be rebuilt from scratch with
+    the backfill_application_rollups command.
+    """
+
+    @staticmethod
+    def get_bucket(job_id, applied_at, status, user_id, job=None):
+        """
+        Find the rollup bucket an application falls into
+
+        Args:
+            job_id (int): ID of the job applied to
+            applied_at (datetime): When the application was made
+            status (str): Application status
+            user_id (int): Applicant user ID, None for guests
+            job (dict): Optional preloaded {'employer_id', 'category'} of the job
+
+        Returns:
+            dict: Bucket lookup for ApplicationDailyStat, or None if the
+            application isn't attached to an employer's job
+        """
+        if not job_id or not applied_at:
+            return None
+
+        if job is None:
+            job = JobListing.all_objects.filter(pk=job_id).values('employer_id', 'category').first()
+        if not job or not job['employer_id']:
+            return None
+
+        return {
+            'employer_profile_id': job['employer_id'],
+            'date': timezone.localdate(applied_at),
+            'status': status,
+            'category': job['category'] or '',
+            'source': _source_for(user_id),
+        }
+
+    @staticmethod
+    def adjust(bucket, delta):
+        """
+        Add a delta to one rollup bucket, creating the row if needed
+
+        Args:
+            bucket (dict): Bucket from get_bucket()
+            delta (int): Amount to add (may be negative)
+        """
+        if not bucket or not delta:
+            return
+
+        updated = ApplicationDailyStat.objects.filter(**bucket).update(count=F('count') + delta)
+        if updated:
+            return
+
+        try:
+            with transaction.atomic():
+                ApplicationDailyStat.objects.create(count=delta, **bucket)
+        except IntegrityError:
+            # Another request created the row in the meantime
+            ApplicationDailyStat.objects.filter(**bucket).update(count=F('count') + delta)
+
+    @staticmethod
+    def move_status(applications, new_status):
+        """
+        Move applications changed by a bulk UPDATE to their new status bucket
+
+        Bulk updates don't send post_save, so the rollup is adjusted here, with
+        one update per affected bucket.
+
+        Args:
+            applications (iterable): (job_id, applied_at, old status, user_id) tuples
+            new_status (str): The status the applications were moved to
+        """
+        applications = [row for row in applications if row[2] != new_status]
+        jobs = {
+            job['id']: job
+            for job in JobListing.all_objects.filter(pk__in={row[0] for row in applications})
+            .values('id', 'employer_id', 'category')
+        }
+
+        deltas = defaultdict(int)
+        for job_id, applied_at, status, user_id in applications:
+            job = jobs.get(job_id)
+            if not job:
+                continue
+            for bucket_status, delta in ((status, -1), (new_status, 1)):
+                bucket = ApplicationStatsService.get_bucket(job_id, applied_at, bucket_status, user_id, job=job)
+                if bucket:
+                    deltas[tuple(sorted(bucket.items()))] += delta
+
+        for bucket, delta in deltas.items():
+            ApplicationStatsService.adjust(dict(bucket), delta)
+
+    @staticmethod
+    def backfill(employer_profile=None):
+        """
+        Rebuild the rollup from the applications table
+
+        Args:
+            employer_profile (EmployerProfile): Optional, rebuild only this employer
+
+        Returns:
+            int: Number of rollup rows written
+        """
+        applications = JobApplication.objects.filter(job__employer__isnull=False)
+        if employer_profile:
+            applications = applications.filter(job__employer=employer_profile)
+
+        rows = applications.order_by().annotate(
+            day=TruncDate('applied_at'),
+            source=Case(
+                When(user__isnull=False, then=Value('registered')),
+                default=Value('guest'),
+                output_field=CharField(),
+            ),
+            job_category=Coalesce('job__category', Value('')),
+        ).values('job__employer_id', 'day', 'status', 'job_category', 'source').annotate(total=Count('id'))
+
+        entries = [
+            ApplicationDailyStat(
+                employer_profile_id=row['job__employer_id'],
+                date=row['day'],
+                status=row['status'],
+                category=row['job_category'],
+                source=row['source'],
+                count=row['total'],
+            )
+            for row in rows
+        ]
+
+        with transaction.atomic():
+            existing = ApplicationDailyStat.objects.all()
+            if employer_profile:
+                existing = existing.filter(employer_profile=employer_profile)
+            existing.delete()
+            ApplicationDailyStat.objects.bulk_create(entries, batch_size=1000)
+
+        return len(entries)
+
+    @staticmethod
+    def get_employer_charts(employer_profile, now=None):
+        """
+        Build the employer_home chart data from the rollup in a single query
+
+        Args:
+            employer_profile (EmployerProfile): The employer profile
+            now (datetime): Optional reference time (defaults to now)
+
+        Returns:
+            dict: {
+                'months': [(label, count), ...] for the last 6 months,
+                'status_counts': {status: count},
+                'top_categories': [(category, count), ...],
+                'source_counts': {'registered': int, 'guest': int},
+            }
+        """
+        now = now or timezone.now()
+        six_months_ago = timezone.localdate(now - timedelta(days=180))
+
+        months = defaultdict(int)
+        status_counts = defaultdict(int)
+        category_counts = defaultdict(int)
+        source_counts = {'registered': 0, 'guest': 0}
+
+        rows = ApplicationDailyStat.objects.filter(
+            employer_profile=employer_profile,
+            count__gt=0
+        ).values_list('date', 'status', 'category', 'source', 'count')
+
+        for date, status, category, source, count in rows:
+            if date >= six_months_ago:
+                months[f"{calendar.month_abbr[date.month]} {date.year}"] += count
+            status_counts[status] += count
+            category_counts[category] += count
+            source_counts[source] = source_counts.get(source, 0) + count
+
+        # The last 6 months in chronological order
+        month_labels = []
+        for i in range(5, -1, -1):
+            month_date = now - timedelta(days=30 * i)
+            month_labels.append(f"{calendar.month_abbr[month_date.month]} {month_date.year}")
+
+        top_categories = sorted(category_counts.items(), key=lambda item: -item[1])[:TOP_CATEGORIES]
+
+        return {
+            'months': [(label, months.get(label, 0)) for label in month_labels],
+            'status_counts': dict(status_counts),
+            'top_categories': top_categories,
+            'source_counts': source_counts,
+        }
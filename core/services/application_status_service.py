@@ -0,0 +1,129 @@
+import logging
+from django.db import transaction
+from django.utils import timezone
+from core.models import JobApplication
+from core.repositories.notification_repository import NotificationRepository
+from core.services.application_stats_service import ApplicationStatsService
+from core.services.reference_data_service import ReferenceDataService
+
+logger = logging.getLogger(__name__)
+
+# Largest number of applications one bulk request may change
+BULK_STATUS_UPDATE_LIMIT = 500
+
+# Status that takes rejection reasons and feedback
+RESERVE_STATUS = 'რეზერვი'
+
+# Candidate notification text per new status (statuses without one don't notify)
+STATUS_NOTIFICATION_MESSAGES = {
+    'გასაუბრება': "თქვენი განაცხადი ვაკანსიაზე '{job_title}' გადავიდა გასაუბრების ეტაპზე",
+    'რეზერვი': "თქვენი განაცხადი ვაკანსიაზე '{job_title}' გადავიდა რეზერვში",
+}
+
+
+class ApplicationStatusService:
+    """
+    Service class for moving job applications between statuses
+    """
+
+    @staticmethod
+    def status_notification_message(status, job_title):
+        """
+        Get the candidate notification text for a status change
+
+        Args:
+            status (str): The new status
+            job_title (str): Title of the job applied to
+
+        Returns:
+            str: The message, or '' if the status doesn't notify the candidate
+        """
+        template = STATUS_NOTIFICATION_MESSAGES.get(status)
+        return template.format(job_title=job_title) if template else ''
+
+    @staticmethod
+    def bulk_update_status(employer_profile, application_ids, new_status, rejection_reason_ids=None, feedback=''):
+        """
+        Move many applications of an employer to one status in a single transaction
+
+        Runs one UPDATE for the status, replaces the rejection reasons with a
+        delete and a bulk_create on the through table, and creates the
+        candidate notifications with one bulk_create.
+
+        Args:
+            employer_profile (EmployerProfile): The employer owning the applications
+            application_ids (list): IDs of the applications to change
+            new_status (str): Target status (one of JobApplication.STATUS_CHOICES)
+            rejection_reason_ids (list): Optional rejection reasons, only used for the reserve
+                status; None leaves the existing reasons alone
+            feedback (str): Optional feedback, only used for the reserve status
+
+        Returns:
+            dict: application id -> {'success': True, 'status': str, 'changed': bool}
+            or {'success': False, 'error': str}
+
+        Raises:
+            ValueError: If the status is invalid or too many applications are given
+        """
+        if new_status not in dict(JobApplication.STATUS_CHOICES):
+            raise ValueError('Invalid status')
+        if len(application_ids) > BULK_STATUS_UPDATE_LIMIT:
+            raise ValueError(f'At most {BULK_STATUS_UPDATE_LIMIT} applications can be updated at once')
+
+        with transaction.atomic():
+            rows = list(
+                JobApplication.objects.filter(id__in=application_ids, job__employer=employer_profile)
+                .select_for_update(of=('self',))
+                .values_list('id', 'job_id', 'applied_at', 'status', 'user_id', 'job__title', 'job__company')
+            )
+            found_ids = [row[0] for row in rows]
+
+            results = {
+                application_id: {'success': False, 'error': 'Application not found'}
+                for application_id in application_ids
+            }
+            if not rows:
+                return results
+
+            update = {'status': new_status, 'is_read': True, 'updated_at': timezone.now()}
+            if new_status == RESERVE_STATUS and feedback:
+                update['feedback'] = feedback
+            JobApplication.objects.filter(id__in=found_ids).update(**update)
+
+            if new_status == RESERVE_STATUS and rejection_reason_ids is not None:
+                known_reasons = ReferenceDataService.rejection_reasons_by_id()
+                reason_ids = [reason_id for reason_id in set(rejection_reason_ids) if reason_id in known_reasons]
+                if len(reason_ids) != len(set(rejection_reason_ids)):
+                    logger.warning(f"Ignoring unknown rejection reasons in bulk update: {rejection_reason_ids}")
+                Through = JobApplication.rejection_reasons.through
+                Through.objects.filter(jobapplication_id__in=found_ids).delete()
+                Through.objects.bulk_create([
+                    Through(jobapplication_id=application_id, rejectionreason_id=reason_id)
+                    for application_id in found_ids
+                    for reason_id in reason_ids
+                ])
+
+            notifications = []
+            for application_id, _, _, old_status, user_id, job_title, company in rows:
+                message = ApplicationStatusService.status_notification_message(new_status, job_title)
+                if old_status != new_status and user_id and message:
+                    notifications.append({
+                        'user_id': user_id,
+                        'application_id': application_id,
+                        'job_title': job_title,
+                        'company_name': company,
+                        'message': message,
+                    })
+            NotificationRepository.create_application_status_notifications(notifications)
+
+            # The UPDATE bypasses the post_save signal that keeps the rollup current
+            ApplicationStatsService.move_status(
+                [(job_id, applied_at, old_status, user_id) for _, job_id, applied_at, old_status, user_id, _, _ in rows],
+                new_status,
+            )
+
+        for application_id, _, _, old_status, _, _, _ in rows:
+            results[application_id] = {'success': True, 'status': new_status, 'changed': old_status != new_status}
+
+        logger.info(f"Bulk status update to {new_status}: {len(rows)} of {len(application_ids)} applications for employer {employer_profile.id}")
+        return results
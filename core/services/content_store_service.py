@@ -0,0 +1,147 @@
+import hashlib
+import logging
+import posixpath
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from core.models import StoredFile
+from core.media.s3 import storage_key_for
+
+logger = logging.getLogger(__name__)
+
+# Storage keys looked up per query while collecting orphans
+COLLECT_BATCH_SIZE = 500
+
+
+class ContentStoreService:
+    """
+    Service class for content-addressed CV and resume storage
+
+    An uploaded file is hashed and stored as `<upload dir>/<sha256><ext>` only
+    if no stored file has the same content yet; otherwise the row is pointed
+    at the existing object. The name of the upload is kept on the row for
+    display and downloads, so nothing of another uploader leaks through a
+    shared object. Each StoredFile counts the rows referring to it: the
+    signals in core.signals retain and release keys when a row's key changes
+    or the row is deleted, inside the row's own transaction.
+    """
+
+    @staticmethod
+    def content_hash(field_file):
+        """
+        Compute the SHA-256 of an uncommitted file
+
+        Args:
+            field_file (FieldFile): The newly assigned file
+
+        Returns:
+            str: Hex digest
+        """
+        digest = hashlib.sha256()
+        for chunk in field_file.file.chunks():
+            digest.update(chunk)
+        field_file.file.seek(0)
+        return digest.hexdigest()
+
+    @staticmethod
+    def store(field_file):
+        """
+        Store a newly assigned file once per content and point the field at it
+
+        Runs inside the transaction of the row's save: the StoredFile row is
+        locked (or created) here, so the orphan cleaner can't collect it
+        before the post_save receiver takes the row's reference.
+
+        Args:
+            field_file (FieldFile): The uncommitted file
+
+        Returns:
+            str: The storage key of the (possibly shared) object
+        """
+        sha256 = ContentStoreService.content_hash(field_file)
+        stored = StoredFile.objects.select_for_update().filter(sha256=sha256).first()
+        if stored is None:
+            size = field_file.file.size
+            extension = posixpath.splitext(field_file.name)[1].lower()
+            # save() adds the upload directory; a stale object under the name
+            # gets a suffix from the storage and is never overwritten
+            field_file.save(f'{sha256}{extension}', field_file.file, save=False)
+            try:
+                with transaction.atomic():
+                    stored = StoredFile.objects.create(
+                        sha256=sha256,
+                        name=field_file.name,
+                        storage_key=storage_key_for(field_file),
+                        size=size,
+                    )
+                return stored.storage_key
+            except IntegrityError:
+                # Stored concurrently: our copy is left for the orphan cleaner
+                stored = StoredFile.objects.select_for_update().get(sha256=sha256)
+
+        field_file.name = stored.name
+        field_file._committed = True
+        return stored.storage_key
+
+    @staticmethod
+    def retain(storage_key):
+        """
+        Count one more row referring to a stored object
+
+        Args:
+            storage_key (str): Storage key (keys of legacy files are ignored)
+        """
+        if storage_key:
+            StoredFile.objects.filter(storage_key=storage_key).update(ref_count=F('ref_count') + 1)
+
+    @staticmethod
+    def release(storage_key):
+        """
+        Count one row less referring to a stored object
+
+        Args:
+            storage_key (str): Storage key (keys of legacy files are ignored)
+        """
+        if storage_key:
+            StoredFile.objects.filter(storage_key=storage_key, ref_count__gt=0).update(ref_count=F('ref_count') - 1)
+
+    @staticmethod
+    def referenced_keys():
+        """
+        Get the storage keys of stored files that rows still refer to
+
+        Returns:
+            set: Storage keys
+        """
+        return set(StoredFile.objects.filter(ref_count__gt=0).values_list('storage_key', flat=True))
+
+    @staticmethod
+    def collect(keys):
+        """
+        Release orphaned keys for deletion
+
+        Stored files among the keys are deleted only if nothing refers to them
+        any more; their rows are locked while checking, so an upload reusing
+        the content either waits and stores a new copy or keeps the object.
+        Keys of untracked (legacy) files are returned as they are.
+
+        Args:
+            keys (list): Bucket keys the orphan cleaner wants to delete
+
+        Returns:
+            set: The keys that may be deleted
+        """
+        keys = list(keys)
+        kept = set()
+        for i in range(0, len(keys), COLLECT_BATCH_SIZE):
+            batch = keys[i:i + COLLECT_BATCH_SIZE]
+            with transaction.atomic():
+                rows = list(
+                    StoredFile.objects.select_for_update()
+                    .filter(storage_key__in=batch)
+                    .values_list('id', 'storage_key', 'ref_count')
+                )
+                kept.update(key for pk, key, ref_count in rows if ref_count > 0)
+                StoredFile.objects.filter(id__in=[pk for pk, key, ref_count in rows if ref_count <= 0]).delete()
+        if kept:
+            logger.info(f"{len(kept)} orphaned stored files are referenced again and are kept")
+        return set(keys) - kept
@@ -4,6 +4,7 @@ from core.models import EmployerProfile, JobListing, JobApplication, UserProfile
 from core.repositories.job_repository import JobRepository
 from core.repositories.application_repository import ApplicationRepository
 from core.repositories.employer_repository import EmployerRepository
+from core.repositories.notification_repository import NotificationRepository
 
 class EmployerService:
     """
@@ -23,7 +24,9 @@ class EmployerService:
             sort_option (str): Optional sort option
             
         Returns:
-            QuerySet: Filtered and sorted job listings
+            QuerySet: Filtered and sorted job listings, annotated with
+            applications_count, unread_applications_count, pending_applications_count
+            and unread_notification_count
         """
         # Get jobs from repository
         jobs_query = JobRepository.get_employer_jobs(
@@ -43,6 +46,7 @@ class EmployerService:
             applications_count=Count('applications'),
             unread_applications_count=Count('applications', filter=Q(applications__is_read=False)),
             pending_applications_count=Count('applications', filter=Q(applications__status='განხილვის_პროცესში')),
+            unread_notification_count=NotificationRepository.unread_notification_count_subquery(employer_profile),
             status_order=Case(
                 When(status='approved', then=Value(1)),
                 When(status='pending_review', then=Value(2)),
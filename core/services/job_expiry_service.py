@@ -0,0 +1,206 @@
+import logging
+from contextlib import contextmanager
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.db.models import F
+from django.utils import timezone
+from core.models import JobListing, EmployerProfile
+from core.repositories.notification_repository import NotificationRepository
+from core.services.stats_service import PlatformStatsService
+
+logger = logging.getLogger(__name__)
+
+# Jobs changed per UPDATE statement / transaction
+EXPIRY_BATCH_SIZE = 500
+
+# Key of the PostgreSQL advisory lock (any constant unique within the project)
+EXPIRY_ADVISORY_LOCK_ID = 7315001
+# Fallback lock for other databases, held in the cache
+EXPIRY_CACHE_LOCK_KEY = 'job_expiry_lock'
+EXPIRY_CACHE_LOCK_TIMEOUT = 60 * 30
+
+
+class JobExpiryLocked(Exception):
+    """Raised when another expiry run holds the lock"""
+    pass
+
+
+@contextmanager
+def _expiry_lock():
+    """
+    Make sure only one expiry run works at a time
+
+    Uses a session-level advisory lock on PostgreSQL and an atomic cache.add
+    elsewhere. Raises JobExpiryLocked if the lock is taken.
+    """
+    if connection.vendor == 'postgresql':
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT pg_try_advisory_lock(%s)", [EXPIRY_ADVISORY_LOCK_ID])
+            if not cursor.fetchone()[0]:
+                raise JobExpiryLocked('Another job expiry run is in progress')
+        try:
+            yield
+        finally:
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT pg_advisory_unlock(%s)", [EXPIRY_ADVISORY_LOCK_ID])
+    else:
+        if not cache.add(EXPIRY_CACHE_LOCK_KEY, True, timeout=EXPIRY_CACHE_LOCK_TIMEOUT):
+            raise JobExpiryLocked('Another job expiry run is in progress')
+        try:
+            yield
+        finally:
+            cache.delete(EXPIRY_CACHE_LOCK_KEY)
+
+
+def _batches(items, size):
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+class JobExpiryService:
+    """
+    Service class for moving jobs between 'approved' and 'expired' by their expiration date
+
+    Applies the same rules as JobListing.update_status_from_expiration, but
+    with set-based UPDATEs in bounded batches:
+      - approved jobs whose expires_at has passed become expired
+      - expired jobs whose expires_at is in the future again become approved
+      - jobs without expires_at and jobs in extended_review are left alone
+    """
+
+    @staticmethod
+    def _jobs_to_expire(now):
+        return JobListing.objects.filter(status='approved', expires_at__isnull=False, expires_at__lte=now)
+
+    @staticmethod
+    def _jobs_to_reactivate(now):
+        return JobListing.objects.filter(status='expired', expires_at__isnull=False, expires_at__gt=now)
+
+    @staticmethod
+    def _jobs_missing_last_extended_at():
+        return JobListing.objects.filter(status__in=['approved', 'expired'], last_extended_at__isnull=True)
+
+    @staticmethod
+    def _employers_losing_premium_plus(employer_ids, now):
+        """
+        Find employers that no longer have any active Premium+ job
+
+        Args:
+            employer_ids (set): Employers that had a Premium+ job expire
+            now (datetime): Reference time
+
+        Returns:
+            list: EmployerProfile instances
+        """
+        if not employer_ids:
+            return []
+
+        still_active = set(JobListing.objects.filter(
+            employer_id__in=employer_ids,
+            premium_level='premium_plus',
+            status='approved',
+            expires_at__gt=now,
+        ).values_list('employer_id', flat=True))
+
+        return list(EmployerProfile.objects.filter(id__in=set(employer_ids) - still_active))
+
+    @staticmethod
+    def _expire_batch(job_ids, now):
+        """
+        Expire one batch of jobs and notify their employers
+
+        The filter is re-applied inside the transaction so a job extended in
+        the meantime is not expired.
+
+        Returns:
+            list: (id, employer_id, title, premium_level) of the jobs expired
+        """
+        with transaction.atomic():
+            rows = list(
+                JobExpiryService._jobs_to_expire(now).filter(pk__in=job_ids)
+                .select_for_update().values_list('id', 'employer_id', 'title', 'premium_level')
+            )
+            if not rows:
+                return []
+
+            JobListing.objects.filter(pk__in=[row[0] for row in rows]).update(status='expired')
+
+            NotificationRepository.create_job_status_notifications([
+                {
+                    'employer_profile_id': employer_id,
+                    'job_id': job_id,
+                    'job_title': title,
+                    'message': f"Your job '{title}' has expired.",
+                }
+                for job_id, employer_id, title, _ in rows
+                if employer_id
+            ])
+        return rows
+
+    @staticmethod
+    def run(now=None, dry_run=False, batch_size=EXPIRY_BATCH_SIZE):
+        """
+        Apply the expiry rules to all jobs
+
+        Args:
+            now (datetime): Reference time (defaults to now)
+            dry_run (bool): Only report what would change
+            batch_size (int): Jobs changed per UPDATE
+
+        Returns:
+            dict: {
+                'expired': [job ids], 'reactivated': [job ids],
+                'initialized_last_extended_at': int,
+                'employers_losing_premium_plus': [EmployerProfile],
+            }
+
+        Raises:
+            JobExpiryLocked: If another run is in progress
+        """
+        now = now or timezone.now()
+
+        if dry_run:
+            expiring = list(JobExpiryService._jobs_to_expire(now).values_list('id', 'employer_id', 'premium_level'))
+            premium_employers = {employer_id for _, employer_id, level in expiring if level == 'premium_plus'}
+            return {
+                'expired': [job_id for job_id, _, _ in expiring],
+                'reactivated': list(JobExpiryService._jobs_to_reactivate(now).values_list('id', flat=True)),
+                'initialized_last_extended_at': JobExpiryService._jobs_missing_last_extended_at().count(),
+                'employers_losing_premium_plus': JobExpiryService._employers_losing_premium_plus(premium_employers, now),
+            }
+
+        with _expiry_lock():
+            expired = []
+            premium_employers = set()
+            expiring_ids = list(JobExpiryService._jobs_to_expire(now).order_by('pk').values_list('id', flat=True))
+            for batch in _batches(expiring_ids, batch_size):
+                for job_id, employer_id, _, premium_level in JobExpiryService._expire_batch(batch, now):
+                    expired.append(job_id)
+                    if premium_level == 'premium_plus':
+                        premium_employers.add(employer_id)
+
+            reactivated = []
+            reactivate_ids = list(JobExpiryService._jobs_to_reactivate(now).order_by('pk').values_list('id', flat=True))
+            for batch in _batches(reactivate_ids, batch_size):
+                with transaction.atomic():
+                    changed = list(JobExpiryService._jobs_to_reactivate(now).filter(pk__in=batch).values_list('id', flat=True))
+                    JobListing.objects.filter(pk__in=changed).update(status='approved')
+                reactivated.extend(changed)
+
+            initialized = JobExpiryService._jobs_missing_last_extended_at().update(last_extended_at=F('posted_at'))
+
+        if expired or reactivated:
+            # Bulk updates bypass the signals that keep the job counter current
+            PlatformStatsService.invalidate('total_jobs_count')
+
+        employers_losing_access = JobExpiryService._employers_losing_premium_plus(premium_employers, now)
+        for employer in employers_losing_access:
+            logger.info(f'Employer {employer.company_name} (ID: {employer.id}) has lost Premium+ access due to job expiration')
+
+        logger.info(f"Job expiry: {len(expired)} expired, {len(reactivated)} reactivated, {initialized} last_extended_at initialized")
+        return {
+            'expired': expired,
+            'reactivated': reactivated,
+            'initialized_last_extended_at': initialized,
+            'employers_losing_premium_plus': employers_losing_access,
+        }
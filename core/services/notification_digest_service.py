@@ -0,0 +1,157 @@
+import logging
+from collections import defaultdict
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.translation import gettext as _
+from core.models import EmployerProfile, EmployerNotification
+
+logger = logging.getLogger(__name__)
+
+# Digest emails handed to the mail connection at once
+NOTIFICATION_DIGEST_BATCH_SIZE = getattr(settings, 'NOTIFICATION_DIGEST_BATCH_SIZE', 100)
+
+# Notifications listed in one digest, the rest are summed up
+NOTIFICATION_DIGEST_MAX_ITEMS = 20
+
+SITE_URL = getattr(settings, 'SITE_URL', 'https://jobsight.ge')
+
+
+class NotificationDigestService:
+    """
+    Service class for the periodic email digest of unread employer notifications
+
+    Employers who enabled notification_digest get one email listing the
+    unread notifications that changed since their previous digest. All
+    digests of a run go through a single mail connection, sent in batches
+    the way send_mass_mail does, and each batch is marked as sent with one
+    UPDATE.
+    """
+
+    @staticmethod
+    def build_digest(employer_profile, notifications):
+        """
+        Build the digest email of an employer
+
+        Args:
+            employer_profile (EmployerProfile): The employer (with user_profile.user loaded)
+            notifications (list): Unread notifications to list, newest first
+
+        Returns:
+            EmailMessage: The digest
+        """
+        total_events = sum(notification.event_count for notification in notifications)
+        lines = [
+            f"{_('Hello')} {employer_profile.company_name or employer_profile.user_profile.user.first_name},",
+            '',
+            _('You have %(count)d new updates on Jobsight:') % {'count': total_events},
+            '',
+        ]
+        for notification in notifications[:NOTIFICATION_DIGEST_MAX_ITEMS]:
+            lines.append(f"- {notification.message}")
+        if len(notifications) > NOTIFICATION_DIGEST_MAX_ITEMS:
+            lines.append(_('... and %(count)d more') % {'count': len(notifications) - NOTIFICATION_DIGEST_MAX_ITEMS})
+        lines += [
+            '',
+            f"{SITE_URL}{reverse('employer_dashboard')}",
+            '',
+            _('You can turn off these emails in your company profile.'),
+        ]
+
+        return EmailMessage(
+            subject=_('Jobsight: %(count)d new updates') % {'count': total_events},
+            body='\n'.join(lines),
+            from_email=settings.DEFAULT_FROM_EMAIL,
+            to=[employer_profile.user_profile.user.email],
+        )
+
+    @staticmethod
+    def pending_digests(employer_profiles):
+        """
+        Collect the digest of each employer that has something new
+
+        Args:
+            employer_profiles (list): Employers (with notification_digest_sent_at loaded)
+
+        Returns:
+            list: (employer_profile, notifications) pairs, employers with nothing new left out
+        """
+        by_employer = defaultdict(list)
+        notifications = EmployerNotification.objects.filter(
+            employer_profile_id__in=[employer.id for employer in employer_profiles],
+            is_read=False,
+        ).order_by('-last_event_at')
+        for notification in notifications:
+            by_employer[notification.employer_profile_id].append(notification)
+
+        digests = []
+        for employer in employer_profiles:
+            since = employer.notification_digest_sent_at
+            fresh = [n for n in by_employer.get(employer.id, []) if since is None or n.last_event_at > since]
+            if fresh:
+                digests.append((employer, fresh))
+        return digests
+
+    @staticmethod
+    def send_digests(dry_run=False, batch_size=NOTIFICATION_DIGEST_BATCH_SIZE, connection=None):
+        """
+        Send the notification digests of all employers who enabled them
+
+        Args:
+            dry_run (bool): Only count the digests that would be sent
+            batch_size (int): Employers handled (and emails sent) per batch
+            connection: Mail connection to use (defaults to a new one from EMAIL_BACKEND)
+
+        Returns:
+            dict: {'sent': int, 'skipped': int, 'failed': int}
+        """
+        stats = {'sent': 0, 'skipped': 0, 'failed': 0}
+        started_at = timezone.now()
+        employers = (
+            EmployerProfile.objects.filter(
+                notification_digest=True,
+                unread_notification_count__gt=0,
+                user_profile__user__is_active=True,
+            )
+            .exclude(user_profile__user__email='')
+            .select_related('user_profile__user')
+            .order_by('id')
+        )
+
+        connection = connection or get_connection()
+        if not dry_run:
+            connection.open()
+        try:
+            last_id = 0
+            while True:
+                batch = list(employers.filter(id__gt=last_id)[:batch_size])
+                if not batch:
+                    break
+                last_id = batch[-1].id
+
+                digests = NotificationDigestService.pending_digests(batch)
+                stats['skipped'] += len(batch) - len(digests)
+                if dry_run:
+                    stats['sent'] += len(digests)
+                    continue
+
+                messages = [NotificationDigestService.build_digest(employer, items) for employer, items in digests]
+                try:
+                    connection.send_messages(messages)
+                except Exception as e:
+                    # Leave the batch unmarked, the next run sends it again
+                    logger.error(f"Failed to send {len(messages)} notification digests: {str(e)}")
+                    stats['failed'] += len(messages)
+                    continue
+
+                EmployerProfile.objects.filter(id__in=[employer.id for employer, items in digests]).update(
+                    notification_digest_sent_at=started_at
+                )
+                stats['sent'] += len(messages)
+        finally:
+            if not dry_run:
+                connection.close()
+
+        logger.info(f"Notification digests: {stats['sent']} sent, {stats['skipped']} skipped, {stats['failed']} failed")
+        return stats
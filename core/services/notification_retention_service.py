@@ -0,0 +1,141 @@
+import logging
+from datetime import timedelta
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from core.models import EmployerNotification, CandidateNotification, ArchivedNotification
+
+logger = logging.getLogger(__name__)
+
+RETENTION_ARCHIVE = 'archive'
+RETENTION_DELETE = 'delete'
+
+# Per notification type: read notifications older than `days` are archived or
+# deleted. Types left out are kept forever; unread notifications are never touched.
+NOTIFICATION_RETENTION_POLICY = getattr(settings, 'NOTIFICATION_RETENTION_POLICY', {
+    'new_application': {'days': 90, 'action': RETENTION_ARCHIVE},
+    'job_status_update': {'days': 30, 'action': RETENTION_DELETE},
+    'application_status_update': {'days': 180, 'action': RETENTION_ARCHIVE},
+    'interview_invitation': {'days': 180, 'action': RETENTION_ARCHIVE},
+})
+
+# Rows moved per transaction
+NOTIFICATION_RETENTION_BATCH_SIZE = getattr(settings, 'NOTIFICATION_RETENTION_BATCH_SIZE', 1000)
+
+# (model, archive recipient kind, recipient column, column the age is measured on)
+_SOURCES = (
+    (EmployerNotification, ArchivedNotification.RECIPIENT_EMPLOYER, 'employer_profile_id', 'last_event_at'),
+    (CandidateNotification, ArchivedNotification.RECIPIENT_CANDIDATE, 'user_id', 'created_at'),
+)
+
+
+class NotificationRetentionService:
+    """
+    Service class for keeping the live notification tables small
+
+    Read notifications past their type's retention age are copied into
+    ArchivedNotification (or just deleted) in batches of at most batch_size
+    rows, each batch in its own transaction, so a run never holds long locks
+    and can be stopped at any point. Only read rows are removed, so the
+    unread counters on the profiles stay as they are.
+    """
+
+    @staticmethod
+    def expired_notifications(model, age_field, notification_type, cutoff):
+        """
+        Get the read notifications of a type that are past the cutoff
+
+        Args:
+            model (Model): EmployerNotification or CandidateNotification
+            age_field (str): Column the age is measured on
+            notification_type (str): The notification type
+            cutoff (datetime): Rows older than this are expired
+
+        Returns:
+            QuerySet: The expired notifications
+        """
+        # created_at is indexed and never later than last_event_at
+        queryset = model.objects.filter(notification_type=notification_type, is_read=True, created_at__lt=cutoff)
+        if age_field != 'created_at':
+            queryset = queryset.filter(**{f'{age_field}__lt': cutoff})
+        return queryset
+
+    @staticmethod
+    def apply_policy(policy=None, dry_run=False, batch_size=NOTIFICATION_RETENTION_BATCH_SIZE, now=None):
+        """
+        Archive or delete the expired notifications of every type in the policy
+
+        Args:
+            policy (dict): notification type -> {'days': int, 'action': 'archive' or 'delete'}
+                (defaults to NOTIFICATION_RETENTION_POLICY)
+            dry_run (bool): Only count the expired rows
+            batch_size (int): Rows moved per transaction
+            now (datetime): Reference time (defaults to now)
+
+        Returns:
+            list: One dict per model and type with model, notification_type, action and rows
+
+        Raises:
+            ValueError: If the policy has an unknown action
+        """
+        policy = NOTIFICATION_RETENTION_POLICY if policy is None else policy
+        now = now or timezone.now()
+        for rule in policy.values():
+            if rule['action'] not in (RETENTION_ARCHIVE, RETENTION_DELETE):
+                raise ValueError(f"Unknown notification retention action: {rule['action']}")
+
+        report = []
+        for model, recipient_kind, recipient_field, age_field in _SOURCES:
+            known_types = dict(model.NOTIFICATION_TYPES)
+            for notification_type, rule in policy.items():
+                if notification_type not in known_types:
+                    continue
+
+                cutoff = now - timedelta(days=rule['days'])
+                expired = NotificationRetentionService.expired_notifications(model, age_field, notification_type, cutoff)
+                if dry_run:
+                    rows = expired.count()
+                else:
+                    rows = NotificationRetentionService._move(
+                        expired, model, recipient_kind, recipient_field, rule['action'], batch_size
+                    )
+
+                report.append({
+                    'model': model.__name__,
+                    'notification_type': notification_type,
+                    'action': rule['action'],
+                    'rows': rows,
+                })
+                if rows and not dry_run:
+                    logger.info(f"Notification retention: {rule['action']}d {rows} {model.__name__} rows of type {notification_type}")
+        return report
+
+    @staticmethod
+    def _move(expired, model, recipient_kind, recipient_field, action, batch_size):
+        fields = ['id', recipient_field, 'notification_type', 'job_title', 'message', 'created_at']
+        if model is EmployerNotification:
+            fields.append('event_count')
+
+        total = 0
+        while True:
+            with transaction.atomic():
+                rows = list(expired.order_by('id').values(*fields)[:batch_size])
+                if not rows:
+                    break
+
+                if action == RETENTION_ARCHIVE:
+                    ArchivedNotification.objects.bulk_create([
+                        ArchivedNotification(
+                            recipient_kind=recipient_kind,
+                            recipient_id=row[recipient_field],
+                            notification_type=row['notification_type'],
+                            job_title=row['job_title'] or '',
+                            message=row['message'],
+                            event_count=row.get('event_count', 1),
+                            created_at=row['created_at'],
+                        )
+                        for row in rows
+                    ])
+                model.objects.filter(id__in=[row['id'] for row in rows]).delete()
+            total += len(rows)
+        return total
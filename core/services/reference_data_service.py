@@ -0,0 +1,259 @@
+import logging
+import threading
+import time
+import uuid
+from django.conf import settings
+from django.core.cache import cache
+from core.models import (
+    RejectionReason, PricingPackage, PricingFeature, ComparisonTable, ComparisonRow,
+    PricingPackageTranslation, PricingFeatureTranslation, ComparisonTableTranslation, ComparisonRowTranslation
+)
+
+logger = logging.getLogger(__name__)
+
+# Shared cache entries live this long; the generation key makes stale ones unreachable anyway
+REFERENCE_DATA_TIMEOUT = getattr(settings, 'REFERENCE_DATA_TIMEOUT', 24 * 60 * 60)
+
+# How often a process re-reads the shared generation. Changes made by another
+# process become visible after at most this many seconds.
+REFERENCE_DATA_GENERATION_CHECK_INTERVAL = getattr(settings, 'REFERENCE_DATA_GENERATION_CHECK_INTERVAL', 5)
+
+
+# Translation model -> (FK to the translated object, translated fields)
+PRICING_TRANSLATION_SOURCES = (
+    (PricingPackageTranslation, 'package', ('name', 'description')),
+    (PricingFeatureTranslation, 'feature', ('text',)),
+    (ComparisonTableTranslation, 'table', ('title', 'subtitle')),
+    (ComparisonRowTranslation, 'row', ('feature_name', 'standard_value', 'premium_value', 'premium_plus_value')),
+)
+
+COMPARISON_VALUE_FIELDS = ('standard_value', 'premium_value', 'premium_plus_value')
+
+
+class PricingTranslationCatalog:
+    """
+    All admin-entered pricing translations, compiled into dicts
+
+    entries maps (model name, pk, field, language) to the translated text;
+    empty translations are left out, so a miss means "use the original".
+    row_features and row_values map (language, original Georgian text) to the
+    translation, for the template tags that only get the text of a row.
+    """
+
+    def __init__(self, entries, row_features, row_values):
+        self.entries = entries
+        self.row_features = row_features
+        self.row_values = row_values
+
+    @classmethod
+    def build(cls):
+        """
+        Load every pricing translation, one query per translation model
+
+        Returns:
+            PricingTranslationCatalog: The compiled catalog
+        """
+        entries = {}
+        row_features = {}
+        row_values = {}
+        for model, target, fields in PRICING_TRANSLATION_SOURCES:
+            model_name = model._meta.get_field(target).related_model._meta.model_name
+            columns = [f'{target}_id', 'language_code', *fields]
+            translations = model.objects.order_by(f'{target}_id')
+            if model is ComparisonRowTranslation:
+                columns += [f'row__{field}' for field in fields]
+                # Ordered like the table, so the first row of a duplicated text wins
+                translations = model.objects.order_by('row__display_order', 'row_id')
+            for translation in translations.values(*columns):
+                language_code = translation['language_code']
+                for field in fields:
+                    if translation[field]:
+                        entries[(model_name, translation[f'{target}_id'], field, language_code)] = translation[field]
+
+                if model is ComparisonRowTranslation:
+                    if translation['feature_name']:
+                        row_features.setdefault((language_code, translation['row__feature_name']), translation['feature_name'])
+                    for field in COMPARISON_VALUE_FIELDS:
+                        if translation[field] and translation[f'row__{field}']:
+                            row_values.setdefault((language_code, translation[f'row__{field}']), translation[field])
+        return cls(entries, row_features, row_values)
+
+    def translate(self, instance, field, language_code):
+        """
+        Get a translated field of a pricing object
+
+        Args:
+            instance (Model): PricingPackage, PricingFeature, ComparisonTable or ComparisonRow
+            field (str): The translated field
+            language_code (str): The language
+
+        Returns:
+            str: The translation, or the original value if there is none
+        """
+        return self.entries.get((instance._meta.model_name, instance.pk, field, language_code)) or getattr(instance, field)
+
+    def row_feature(self, feature_name, language_code):
+        """Translation of a comparison row feature name, or None"""
+        return self.row_features.get((language_code, feature_name))
+
+    def row_value(self, value, language_code):
+        """Translation of a comparison row value, or None"""
+        return self.row_values.get((language_code, value))
+
+
+class ReferenceDataService:
+    """
+    Service class for rarely changing lookup data (rejection reasons, pricing
+    packages, the comparison table, the pricing translations)
+
+    Every entry is cached twice: in the shared cache and in a process-local
+    dict, both under the current generation. Saving or deleting any of the
+    MODELS bumps the generation (see core.signals), which makes every cached
+    entry unreachable at once. A request that hits the local copy does no
+    query and no cache round trip.
+
+    Other processes only see a bump through the shared cache, so this needs
+    a cache backend shared by all workers and management commands (the
+    database cache in settings.CACHES; check core.W001 warns otherwise).
+    """
+
+    CACHE_KEY_PREFIX = 'reference_data'
+
+    # Models whose post_save/post_delete bump the generation
+    MODELS = (RejectionReason, PricingPackage, PricingFeature, ComparisonTable, ComparisonRow) + tuple(
+        model for model, _, _ in PRICING_TRANSLATION_SOURCES
+    )
+
+    _lock = threading.Lock()
+    _local = {}
+    _generation = None
+    _generation_checked_at = 0.0
+
+    @staticmethod
+    def _cache_key(name, generation=None):
+        if generation is None:
+            return f'{ReferenceDataService.CACHE_KEY_PREFIX}:generation'
+        return f'{ReferenceDataService.CACHE_KEY_PREFIX}:{generation}:{name}'
+
+    @staticmethod
+    def generation():
+        """
+        Get the current generation, re-read from the shared cache at most
+        every REFERENCE_DATA_GENERATION_CHECK_INTERVAL seconds
+
+        Returns:
+            str: The generation token
+        """
+        now = time.monotonic()
+        if (ReferenceDataService._generation is not None
+                and now - ReferenceDataService._generation_checked_at < REFERENCE_DATA_GENERATION_CHECK_INTERVAL):
+            return ReferenceDataService._generation
+
+        key = ReferenceDataService._cache_key(None)
+        generation = cache.get(key)
+        if generation is None:
+            # add() so concurrent processes agree on one token
+            cache.add(key, uuid.uuid4().hex, None)
+            generation = cache.get(key)
+
+        with ReferenceDataService._lock:
+            if generation != ReferenceDataService._generation:
+                ReferenceDataService._local = {}
+            ReferenceDataService._generation = generation
+            ReferenceDataService._generation_checked_at = now
+        return generation
+
+    @staticmethod
+    def bump_generation():
+        """
+        Invalidate all reference data, in this process and in the shared cache
+        """
+        generation = uuid.uuid4().hex
+        cache.set(ReferenceDataService._cache_key(None), generation, None)
+        with ReferenceDataService._lock:
+            ReferenceDataService._local = {}
+            ReferenceDataService._generation = generation
+            ReferenceDataService._generation_checked_at = time.monotonic()
+        logger.debug(f"Reference data generation bumped to {generation}")
+
+    @staticmethod
+    def _get(name, loader):
+        generation = ReferenceDataService.generation()
+        local = ReferenceDataService._local
+        if name in local:
+            return local[name]
+
+        key = ReferenceDataService._cache_key(name, generation)
+        value = cache.get(key)
+        if value is None:
+            value = loader()
+            cache.set(key, value, REFERENCE_DATA_TIMEOUT)
+
+        with ReferenceDataService._lock:
+            # Don't store a value loaded under a generation that was bumped meanwhile
+            if ReferenceDataService._generation == generation:
+                ReferenceDataService._local[name] = value
+        return value
+
+    @staticmethod
+    def rejection_reasons():
+        """
+        Get all rejection reasons
+
+        Returns:
+            tuple: RejectionReason objects in the model's ordering
+        """
+        return ReferenceDataService._get('rejection_reasons', lambda: tuple(RejectionReason.objects.all()))
+
+    @staticmethod
+    def rejection_reasons_by_id():
+        """
+        Get the rejection reasons keyed by id
+
+        Returns:
+            dict: id -> RejectionReason
+        """
+        return ReferenceDataService._get(
+            'rejection_reasons_by_id',
+            lambda: {reason.id: reason for reason in ReferenceDataService.rejection_reasons()}
+        )
+
+    @staticmethod
+    def pricing_packages():
+        """
+        Get the active pricing packages with their features prefetched
+
+        Returns:
+            tuple: PricingPackage objects ordered by display_order
+        """
+        return ReferenceDataService._get(
+            'pricing_packages',
+            lambda: tuple(
+                PricingPackage.objects.filter(is_active=True).prefetch_related('features').order_by('display_order')
+            )
+        )
+
+    @staticmethod
+    def comparison_table():
+        """
+        Get the active comparison table with its rows prefetched
+
+        Returns:
+            ComparisonTable: The table, or None if there is no active one
+        """
+        # A missing table is cached as False, None means "not cached"
+        table = ReferenceDataService._get(
+            'comparison_table',
+            lambda: ComparisonTable.objects.filter(is_active=True).prefetch_related('rows').first() or False
+        )
+        return table or None
+
+    @staticmethod
+    def pricing_translations():
+        """
+        Get the compiled pricing translation catalog
+
+        Returns:
+            PricingTranslationCatalog: The catalog
+        """
+        return ReferenceDataService._get('pricing_translations', PricingTranslationCatalog.build)
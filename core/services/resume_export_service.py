@@ -0,0 +1,203 @@
+import csv
+import io
+import logging
+import os
+import zipfile
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from django.conf import settings
+from django.utils import timezone
+from django.utils.text import get_valid_filename
+from storages.utils import clean_name
+from core.models import JobApplication
+
+logger = logging.getLogger(__name__)
+
+# Bytes read from a resume per write into the archive
+EXPORT_CHUNK_SIZE = 64 * 1024
+
+# Resumes opened ahead of the one being written (S3 GETs in flight)
+RESUME_EXPORT_CONCURRENCY = getattr(settings, 'RESUME_EXPORT_CONCURRENCY', 4)
+
+MANIFEST_NAME = 'applications.csv'
+MANIFEST_HEADER = ['application_id', 'applicant', 'email', 'applicant_type', 'status', 'applied_at', 'resume_file']
+
+
+class _ZipStream:
+    """
+    Write-only file object that collects what zipfile writes until it is drained
+
+    zipfile writes data descriptors instead of seeking back when the target
+    isn't seekable, so the archive can be sent while it is being built.
+    """
+
+    def __init__(self):
+        self._chunks = []
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def drain(self):
+        data = b''.join(self._chunks)
+        self._chunks = []
+        return data
+
+
+class _ResumeReader:
+    """
+    Open resume files as streams, straight from S3 or through the storage
+
+    S3 objects are read with a streaming GetObject instead of storage.open(),
+    which would download the whole object into memory first. The boto3
+    client is created once, in the calling thread, and shared by the workers
+    (clients are thread safe, the storage's resources are per thread).
+    """
+
+    def __init__(self, storage):
+        self.storage = storage
+        self.client = None
+        if hasattr(storage, 'bucket_name') and hasattr(storage, 'connection'):
+            self.client = storage.connection.meta.client
+
+    def open(self, name):
+        if self.client is not None:
+            key = self.storage._normalize_name(clean_name(name))
+            return self.client.get_object(Bucket=self.storage.bucket_name, Key=key)['Body']
+        return self.storage.open(name, 'rb')
+
+
+def _applicant(application):
+    if application.user_id:
+        user = application.user
+        return user.get_full_name() or user.username, user.email, 'registered'
+    return application.guest_name or '', application.guest_email or '', 'guest'
+
+
+def _zip_info(name, when):
+    return zipfile.ZipInfo(name, date_time=timezone.localtime(when).timetuple()[:6])
+
+
+def _archive_name(application, applicant_name):
+    extension = os.path.splitext(application.resume_display_name)[1].lower()
+    label = get_valid_filename(applicant_name) if applicant_name else ''
+    return f"resumes/{application.id}_{label or 'applicant'}{extension}"
+
+
+class ResumeExportService:
+    """
+    Service class for exporting the resumes of a job's applicants as one ZIP
+
+    The archive is generated chunk by chunk for a StreamingHttpResponse: at
+    most RESUME_EXPORT_CONCURRENCY resumes are opened ahead and each is copied
+    in EXPORT_CHUNK_SIZE pieces, so no whole file is held in memory. A CSV
+    manifest with the applicant data closes the archive.
+    """
+
+    @staticmethod
+    def stream_zip(applications, storage=None, concurrency=RESUME_EXPORT_CONCURRENCY):
+        """
+        Generate the ZIP archive of the given applications
+
+        Args:
+            applications (iterable): JobApplication instances (with user loaded)
+            storage (Storage): Storage holding the resumes (defaults to the resume field's storage)
+            concurrency (int): Maximum number of resumes opened at once
+
+        Yields:
+            bytes: Consecutive pieces of the archive
+        """
+        applications = list(applications)
+        reader = _ResumeReader(storage or JobApplication._meta.get_field('resume').storage)
+        output = _ZipStream()
+        archive = zipfile.ZipFile(output, mode='w', compression=zipfile.ZIP_STORED, allowZip64=True)
+
+        with_resume = [application for application in applications if application.resume.name]
+        executor = ThreadPoolExecutor(max_workers=max(1, concurrency))
+        pending = deque()
+        queued = iter(with_resume)
+
+        def queue_next():
+            application = next(queued, None)
+            if application is not None:
+                pending.append((application, executor.submit(reader.open, application.resume.name)))
+
+        try:
+            for _ in range(max(1, concurrency)):
+                queue_next()
+
+            files = {}
+            while pending:
+                application, future = pending.popleft()
+                queue_next()
+
+                name, _, _ = _applicant(application)
+                arcname = _archive_name(application, name)
+                try:
+                    stream = future.result()
+                except Exception as e:
+                    logger.warning(f"Resume of application {application.id} could not be opened: {str(e)}")
+                    continue
+
+                try:
+                    # Resumes are PDFs and Office files, compressing them again isn't worth the CPU
+                    with archive.open(_zip_info(arcname, application.applied_at), mode='w', force_zip64=True) as entry:
+                        while True:
+                            chunk = stream.read(EXPORT_CHUNK_SIZE)
+                            if not chunk:
+                                break
+                            entry.write(chunk)
+                            yield output.drain()
+                    files[application.id] = arcname
+                finally:
+                    stream.close()
+
+            manifest = []
+            for application in applications:
+                name, email, applicant_type = _applicant(application)
+                manifest.append([
+                    application.id,
+                    name,
+                    email,
+                    applicant_type,
+                    application.get_status_display(),
+                    timezone.localtime(application.applied_at).strftime('%Y-%m-%d %H:%M'),
+                    files.get(application.id, ''),
+                ])
+
+            archive.writestr(
+                _zip_info(MANIFEST_NAME, timezone.now()),
+                ResumeExportService.build_manifest(manifest),
+                compress_type=zipfile.ZIP_DEFLATED,
+            )
+            archive.close()
+            yield output.drain()
+        finally:
+            # Also runs when the client disconnects: release the streams opened ahead
+            for _, future in pending:
+                if not future.cancel():
+                    try:
+                        future.result().close()
+                    except Exception:
+                        pass
+            executor.shutdown(wait=False)
+
+    @staticmethod
+    def build_manifest(rows):
+        """
+        Render the CSV manifest of an export
+
+        Args:
+            rows (list): Manifest rows in MANIFEST_HEADER order
+
+        Returns:
+            bytes: UTF-8 CSV with a BOM, so spreadsheet apps read Georgian text correctly
+        """
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(MANIFEST_HEADER)
+        writer.writerows(rows)
+        return buffer.getvalue().encode('utf-8-sig')
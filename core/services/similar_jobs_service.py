@@ -0,0 +1,216 @@
+import logging
+from django.db import transaction
+from django.db.models import Q, Min, Count
+from django.utils import timezone
+from core.models import JobListing, SimilarJob, SimilarJobRefresh
+from core.search.similarity import SimilarityIndex, job_features
+
+logger = logging.getLogger(__name__)
+
+# Neighbours stored per job; job_detail shows the first few
+SIMILAR_JOBS_PER_JOB = 10
+
+# Fields whose changes can affect the similarity index
+SIMILARITY_FIELDS = {
+    'title', 'description', 'search_document', 'category', 'experience', 'location',
+    'status', 'expires_at', 'deleted_at',
+}
+
+
+class SimilarJobsService:
+    """
+    Service class for the precomputed "similar jobs" index
+
+    Each active job stores its top SIMILAR_JOBS_PER_JOB neighbours by TF-IDF
+    cosine similarity in SimilarJob. A job whose similarity fields change is
+    queued in SimilarJobRefresh; `rebuild_similar_jobs --pending` builds the
+    index once and refreshes every queued job, and the nightly full rebuild
+    recomputes everything.
+    """
+
+    @staticmethod
+    def similarity_state(job):
+        """
+        The loaded values of the similarity fields, to tell whether a save changed them
+
+        Args:
+            job (JobListing): The job
+
+        Returns:
+            tuple: Field values (None for fields that aren't loaded)
+        """
+        return tuple(job.__dict__.get(field) for field in sorted(SIMILARITY_FIELDS))
+
+    @staticmethod
+    def queue_refresh(job_id):
+        """
+        Queue a job for the next pending refresh (a job already queued stays queued once)
+
+        Args:
+            job_id (int): ID of the job that changed
+        """
+        SimilarJobRefresh.objects.bulk_create([SimilarJobRefresh(job_id=job_id)], ignore_conflicts=True)
+
+    @staticmethod
+    def refresh_pending(limit=None):
+        """
+        Refresh every queued job against one index build
+
+        Args:
+            limit (int): Most jobs taken from the queue (default: all)
+
+        Returns:
+            int: Number of queued jobs refreshed
+        """
+        job_ids = list(SimilarJobRefresh.objects.order_by('queued_at').values_list('job_id', flat=True)[:limit])
+        if not job_ids:
+            return 0
+
+        # Claimed before the index is built: a job queued again meanwhile is
+        # refreshed by the next run, and its change is already in this index
+        SimilarJobRefresh.objects.filter(job_id__in=job_ids).delete()
+        index = SimilarJobsService.build_index()
+        for job_id in job_ids:
+            SimilarJobsService.refresh_job(job_id, index)
+        logger.info(f"Refreshed similar jobs of {len(job_ids)} queued jobs")
+        return len(job_ids)
+
+    @staticmethod
+    def get_active_jobs():
+        """
+        Get the jobs that take part in the index (approved and not expired)
+
+        Returns:
+            QuerySet: Active job listings
+        """
+        return JobListing.objects.filter(status='approved').filter(
+            Q(expires_at__isnull=True) | Q(expires_at__gt=timezone.now())
+        )
+
+    @staticmethod
+    def build_index():
+        """
+        Vectorize every active job
+
+        Returns:
+            SimilarityIndex: Index over the active jobs
+        """
+        rows = SimilarJobsService.get_active_jobs().order_by().values_list(
+            'id', 'title', 'search_document', 'category', 'experience', 'location'
+        )
+        return SimilarityIndex({
+            job_id: job_features(title, document, category, experience, location)
+            for job_id, title, document, category, experience, location in rows.iterator(chunk_size=1000)
+        })
+
+    @staticmethod
+    def _store_neighbours(index, job_ids):
+        """
+        Replace the stored neighbours of the given jobs
+
+        Args:
+            index (SimilarityIndex): Current index
+            job_ids (iterable): Jobs to recompute (all must be in the index)
+
+        Returns:
+            int: Number of SimilarJob rows written
+        """
+        job_ids = list(job_ids)
+        entries = []
+        for job_id in job_ids:
+            for rank, (similar_id, score) in enumerate(index.top_k(job_id, SIMILAR_JOBS_PER_JOB), start=1):
+                entries.append(SimilarJob(job_id=job_id, similar_job_id=similar_id, rank=rank, score=score))
+
+        with transaction.atomic():
+            SimilarJob.objects.filter(job_id__in=job_ids).delete()
+            SimilarJob.objects.bulk_create(entries, batch_size=1000)
+        return len(entries)
+
+    @staticmethod
+    def rebuild(batch_size=500):
+        """
+        Recompute the neighbours of every active job and drop entries of inactive ones
+
+        Args:
+            batch_size (int): Jobs written per transaction
+
+        Returns:
+            tuple: (number of jobs indexed, number of SimilarJob rows written)
+        """
+        started_at = timezone.now()
+        index = SimilarJobsService.build_index()
+        job_ids = sorted(index)
+
+        written = 0
+        for start in range(0, len(job_ids), batch_size):
+            written += SimilarJobsService._store_neighbours(index, job_ids[start:start + batch_size])
+
+        SimilarJob.objects.exclude(job_id__in=SimilarJobsService.get_active_jobs().values('id')).delete()
+        # The rebuild covered every change queued before it started
+        SimilarJobRefresh.objects.filter(queued_at__lte=started_at).delete()
+        logger.info(f"Rebuilt similar jobs index: {len(job_ids)} jobs, {written} entries")
+        return len(job_ids), written
+
+    @staticmethod
+    def refresh_job(job_id, index=None):
+        """
+        Update the index after one job was approved, edited, expired or removed
+
+        Recomputes the job itself plus every job whose stored list either
+        contains it or would now take it in.
+
+        Args:
+            job_id (int): ID of the job that changed
+            index (SimilarityIndex): Current index (built if not given)
+
+        Returns:
+            int: Number of jobs whose neighbours were recomputed
+        """
+        if index is None:
+            index = SimilarJobsService.build_index()
+        affected = set(SimilarJob.objects.filter(similar_job_id=job_id).values_list('job_id', flat=True))
+
+        if job_id in index:
+            affected.add(job_id)
+            scores = index.top_k(job_id, len(index))
+            stored = {
+                row['job_id']: row
+                for row in SimilarJob.objects.filter(job_id__in=[other_id for other_id, _ in scores])
+                .values('job_id').annotate(min_score=Min('score'), entries=Count('id'))
+            }
+            for other_id, score in scores:
+                row = stored.get(other_id)
+                if row is None or row['entries'] < SIMILAR_JOBS_PER_JOB or score > row['min_score']:
+                    affected.add(other_id)
+        else:
+            SimilarJob.objects.filter(job_id=job_id).delete()
+
+        affected &= set(index)
+        SimilarJobsService._store_neighbours(index, affected)
+
+        # Jobs that dropped out of the index keep no stale pointers to it
+        if job_id not in index:
+            SimilarJob.objects.filter(similar_job_id=job_id).delete()
+
+        return len(affected)
+
+    @staticmethod
+    def get_similar_jobs(job, limit=5):
+        """
+        Get the precomputed similar jobs of a job, skipping ones that are no longer active
+
+        Args:
+            job (JobListing): The job being viewed
+            limit (int): Maximum number of jobs
+
+        Returns:
+            list: JobListing instances, most similar first
+        """
+        return list(
+            JobListing.objects.filter(
+                similar_to__job=job,
+                status='approved',
+            ).filter(
+                Q(expires_at__isnull=True) | Q(expires_at__gt=timezone.now())
+            ).select_related('employer').order_by('similar_to__rank')[:limit]
+        )
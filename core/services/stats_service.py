@@ -0,0 +1,158 @@
+import logging
+from django.core.cache import cache
+from core.models import JobListing, EmployerProfile, UserProfile
+
+logger = logging.getLogger(__name__)
+
+# Counters are rebuilt from the database at least this often, so anything the
+# signals can't see (QuerySet.update, raw SQL, a lost cache write) heals itself
+STATS_RECONCILE_INTERVAL = 60 * 60
+
+
+def _counts_as_job(job):
+    return job.status == 'approved' and job.deleted_at is None
+
+
+def _counts_as_company(company):
+    return company.deleted_at is None
+
+
+def _counts_as_candidate(profile):
+    return profile.role == 'candidate'
+
+
+class PlatformStatsService:
+    """
+    Service class for the platform statistics shown in the hero section
+    (approved jobs, companies, candidates)
+
+    The counters live in the shared cache (settings.CACHES) and are kept up
+    to date incrementally by the post_save/post_delete signals of the counted
+    models, so every worker reads the same values. Soft deletes go through
+    save() and are picked up the same way. The database cache increments with
+    a read and a write, so two saves at the same moment can lose one
+    adjustment; reconcile_platform_stats recounts them every hour.
+    """
+
+    CACHE_KEY_PREFIX = 'platform_stats'
+
+    # stat name -> (model, fields the predicate reads, predicate deciding whether an instance is counted)
+    COUNTERS = {
+        'total_jobs_count': (JobListing, ('status', 'deleted_at'), _counts_as_job),
+        'total_companies_count': (EmployerProfile, ('deleted_at',), _counts_as_company),
+        'total_candidates_count': (UserProfile, ('role',), _counts_as_candidate),
+    }
+
+    @staticmethod
+    def _cache_key(name):
+        return f'{PlatformStatsService.CACHE_KEY_PREFIX}:{name}'
+
+    @staticmethod
+    def compute_stats():
+        """
+        Count the statistics from the database
+
+        Returns:
+            dict: stat name -> count
+        """
+        return {
+            'total_jobs_count': JobListing.objects.filter(status='approved').count(),
+            'total_companies_count': EmployerProfile.objects.count(),
+            'total_candidates_count': UserProfile.objects.filter(role='candidate').count(),
+        }
+
+    @staticmethod
+    def reconcile():
+        """
+        Recount every statistic and overwrite the cached counters
+
+        Returns:
+            dict: The fresh statistics
+        """
+        stats = PlatformStatsService.compute_stats()
+        cache.set_many(
+            {PlatformStatsService._cache_key(name): value for name, value in stats.items()},
+            timeout=STATS_RECONCILE_INTERVAL,
+        )
+        return stats
+
+    @staticmethod
+    def get_stats():
+        """
+        Get the platform statistics, recounting only when the cache is cold
+
+        Returns:
+            dict: {'total_jobs_count': int, 'total_companies_count': int, 'total_candidates_count': int}
+        """
+        cached = PlatformStatsService.get_cached_stats()
+        if len(cached) != len(PlatformStatsService.COUNTERS):
+            return PlatformStatsService.reconcile()
+
+        return {name: max(value, 0) for name, value in cached.items()}
+
+    @staticmethod
+    def get_cached_stats():
+        """
+        Get whatever counters are currently cached, without touching the database
+
+        Returns:
+            dict: stat name -> count (missing counters are left out)
+        """
+        keys = {PlatformStatsService._cache_key(name): name for name in PlatformStatsService.COUNTERS}
+        return {keys[key]: value for key, value in cache.get_many(list(keys)).items()}
+
+    @staticmethod
+    def adjust(name, delta):
+        """
+        Apply a delta to one cached counter
+
+        A missing counter is left alone; it gets recounted on the next read.
+
+        Args:
+            name (str): Stat name, one of COUNTERS
+            delta (int): Amount to add (may be negative)
+        """
+        if not delta:
+            return
+        try:
+            cache.incr(PlatformStatsService._cache_key(name), delta)
+        except ValueError:
+            # Counter expired or was never populated
+            pass
+        except Exception as e:
+            logger.warning(f"Could not update platform stat {name}: {str(e)}")
+            cache.delete(PlatformStatsService._cache_key(name))
+
+    @staticmethod
+    def invalidate(name=None):
+        """
+        Drop one cached counter (or all of them) so it is recounted on the next read
+        """
+        names = [name] if name else list(PlatformStatsService.COUNTERS)
+        cache.delete_many([PlatformStatsService._cache_key(n) for n in names])
+
+    @staticmethod
+    def is_counted(name, instance):
+        """
+        Check whether an instance currently contributes to a statistic
+
+        Returns:
+            bool: True/False, or None if the fields needed are deferred on the instance
+        """
+        _, fields, predicate = PlatformStatsService.COUNTERS[name]
+        if instance.get_deferred_fields().intersection(fields):
+            return None
+        return predicate(instance)
+
+    @staticmethod
+    def counter_for(model):
+        """
+        Find the statistic a model contributes to
+
+        Returns:
+            str: Stat name, or None if the model isn't counted
+        """
+        for name, (counted_model, _, _) in PlatformStatsService.COUNTERS.items():
+            if issubclass(model, counted_model):
+                return name
+        return None
@@ -0,0 +1,150 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from botocore.exceptions import ClientError
+from django.conf import settings
+from core.models import UserProfile, JobApplication
+from core.media.s3 import PRIVATE_MEDIA_LOCATION, candidate_keys, get_s3_client, get_bucket_name
+
+logger = logging.getLogger(__name__)
+
+# Rows resolved and written per bulk_update
+STORAGE_KEY_BATCH_SIZE = getattr(settings, 'STORAGE_KEY_BATCH_SIZE', 500)
+
+# HEAD requests in flight while probing candidate keys
+STORAGE_KEY_CONCURRENCY = getattr(settings, 'STORAGE_KEY_CONCURRENCY', 8)
+
+# (model, file field, key field, upload directory)
+STORAGE_KEY_TARGETS = (
+    (UserProfile, 'cv', 'cv_storage_key', 'cvs'),
+    (JobApplication, 'resume', 'resume_storage_key', 'resumes'),
+)
+
+
+class StorageKeyService:
+    """
+    Service class for backfilling the verified storage keys of CVs and resumes
+
+    Every candidate key a legacy file name may be stored under is probed once
+    (HEAD on S3, exists() on local storage) and the first one that exists is
+    written to the row, so serving a file never has to guess or probe again.
+    Names that carry the location prefix are made relative on the way, which
+    is what fix_cv_paths used to do for CVs.
+    """
+
+    @staticmethod
+    def s3_exists(client, bucket):
+        """
+        Build an existence check for bucket keys
+
+        Args:
+            client: S3 client
+            bucket (str): The bucket
+
+        Returns:
+            callable: key -> bool, raising ClientError on anything but a 404
+        """
+        def exists(key):
+            try:
+                client.head_object(Bucket=bucket, Key=key)
+                return True
+            except ClientError as e:
+                if e.response['Error']['Code'] in ('404', 'NoSuchKey', 'NotFound'):
+                    return False
+                raise
+        return exists
+
+    @staticmethod
+    def resolve(name, upload_dir, exists, use_s3=True):
+        """
+        Find the key a stored file name really lives under
+
+        Args:
+            name (str): The name stored in the FileField
+            upload_dir (str): upload_to of the field
+            exists (callable): key -> bool
+            use_s3 (bool): Probe bucket keys (else the name itself on local storage)
+
+        Returns:
+            str: The verified key, or None if the file is missing
+        """
+        keys = candidate_keys(name, upload_dir) if use_s3 else [name]
+        for key in keys:
+            if exists(key):
+                return key
+        return None
+
+    @staticmethod
+    def backfill(dry_run=False, refresh=False, batch_size=STORAGE_KEY_BATCH_SIZE,
+                 concurrency=STORAGE_KEY_CONCURRENCY, client=None, stdout=None):
+        """
+        Verify and store the storage key of every CV and resume
+
+        Args:
+            dry_run (bool): Resolve the keys without writing them
+            refresh (bool): Re-verify rows that already have a key
+            batch_size (int): Rows per bulk_update
+            concurrency (int): Probes in flight
+            client: S3 client (defaults to the shared one)
+            stdout: Stream for a line per missing file (optional)
+
+        Returns:
+            dict: {'resolved': int, 'renamed': int, 'missing': int, 'errors': int}
+        """
+        use_s3 = getattr(settings, 'USE_S3', False)
+        stats = {'resolved': 0, 'renamed': 0, 'missing': 0, 'errors': 0}
+
+        for model, file_field, key_field, upload_dir in STORAGE_KEY_TARGETS:
+            if use_s3:
+                exists = StorageKeyService.s3_exists(client or get_s3_client(), get_bucket_name())
+            else:
+                exists = model._meta.get_field(file_field).storage.exists
+
+            def resolve(name):
+                try:
+                    return StorageKeyService.resolve(name, upload_dir, exists, use_s3)
+                except Exception as e:
+                    logger.error(f"Error resolving storage key of {name}: {str(e)}")
+                    return e
+
+            rows = model.objects.exclude(**{f'{file_field}__isnull': True}).exclude(**{file_field: ''})
+            if not refresh:
+                rows = rows.filter(**{key_field: ''})
+            rows = rows.order_by('id').values_list('id', file_field)
+
+            last_id = 0
+            with ThreadPoolExecutor(max_workers=max(1, concurrency)) as pool:
+                while True:
+                    batch = list(rows.filter(id__gt=last_id)[:batch_size])
+                    if not batch:
+                        break
+                    last_id = batch[-1][0]
+
+                    keyed, renamed = [], []
+                    for (pk, name), key in zip(batch, pool.map(resolve, [name for _, name in batch])):
+                        if isinstance(key, Exception):
+                            stats['errors'] += 1
+                            continue
+                        if key is None:
+                            stats['missing'] += 1
+                            if stdout:
+                                stdout.write(f'{model.__name__} {pk}: file not found: {name}')
+                            continue
+
+                        instance = model(id=pk, **{key_field: key})
+                        relative = key[len(PRIVATE_MEDIA_LOCATION) + 1:] if key.startswith(f'{PRIVATE_MEDIA_LOCATION}/') else None
+                        if use_s3 and relative and relative != name:
+                            setattr(instance, file_field, relative)
+                            renamed.append(instance)
+                        else:
+                            keyed.append(instance)
+                        stats['resolved'] += 1
+                    stats['renamed'] += len(renamed)
+
+                    if not dry_run:
+                        if keyed:
+                            model.objects.bulk_update(keyed, [key_field])
+                        if renamed:
+                            model.objects.bulk_update(renamed, [key_field, file_field])
+
+            logger.info(f"Storage keys of {model.__name__}.{file_field}: {stats}")
+        return stats
@@ -0,0 +1,215 @@
+import atexit
+import logging
+import threading
+import time
+from collections import defaultdict
+from django.apps import apps
+from django.conf import settings
+from django.db import connection, connections, transaction
+from django.db.models import F
+
+logger = logging.getLogger(__name__)
+
+# Pending views are written out at least this often (seconds) ...
+VIEW_COUNT_FLUSH_INTERVAL = getattr(settings, 'VIEW_COUNT_FLUSH_INTERVAL', 10)
+# ... or as soon as this many objects have pending views
+VIEW_COUNT_MAX_PENDING = getattr(settings, 'VIEW_COUNT_MAX_PENDING', 500)
+# Flush from a background thread every interval, whether or not requests come in
+VIEW_COUNT_FLUSH_THREAD = getattr(settings, 'VIEW_COUNT_FLUSH_THREAD', True)
+
+
+class ViewCounterBuffer:
+    """
+    In-process accumulator for view_count increments
+
+    Views are added to a dict under a lock. A flush swaps the dict for an empty
+    one and writes the deltas out, so views recorded while a flush runs land in
+    the next batch; if the write fails the deltas are merged back.
+
+    With flush_thread set, a daemon thread started on the first view flushes
+    every flush_interval seconds, so an idle process doesn't sit on views.
+    A process that is killed (SIGKILL, OOM) or frozen and never resumed
+    still loses the views of at most the last interval.
+    """
+
+    def __init__(self, flush_interval=VIEW_COUNT_FLUSH_INTERVAL, max_pending=VIEW_COUNT_MAX_PENDING,
+                 flush_thread=False):
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.flush_thread = flush_thread
+        self._lock = threading.Lock()
+        self._pending = defaultdict(int)
+        self._last_flush = time.monotonic()
+        self._thread = None
+        self._stopped = threading.Event()
+        # Database the pending views were counted against
+        self._database = None
+
+    def increment(self, model_label, pk, amount=1):
+        with self._lock:
+            if not self._pending:
+                self._database = connection.settings_dict['NAME']
+            self._pending[(model_label, pk)] += amount
+            if self.flush_thread and self.flush_interval > 0 and self._thread is None:
+                self._start_thread()
+
+    def _start_thread(self):
+        # Started lazily so forking servers start one per worker, after the fork
+        self._thread = threading.Thread(target=self._run, name='view-counter-flush', daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while not self._stopped.wait(self.flush_interval):
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"Error in view counter flush thread: {str(e)}")
+            finally:
+                # The thread has its own connection; don't keep it open between flushes
+                connections.close_all()
+
+    def stop(self):
+        """Stop the flush thread (pending views stay buffered)"""
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def flush_at_exit(self):
+        """
+        Flush when the process exits, if there is anything to write to the
+        database the views were counted against (a test run destroys its
+        database and switches back to the real one before exiting)
+
+        Returns:
+            int: Number of objects updated
+        """
+        with self._lock:
+            labels = {model_label for model_label, pk in self._pending}
+            database = self._database
+        if not labels or database != connection.settings_dict['NAME']:
+            return 0
+
+        try:
+            tables = set(connection.introspection.table_names())
+        except Exception as e:
+            logger.error(f"Error flushing view counts at exit: {str(e)}")
+            return 0
+        if any(apps.get_model(model_label)._meta.db_table not in tables for model_label in labels):
+            return 0
+        return self.flush()
+
+    def pending(self, model_label, pk):
+        with self._lock:
+            return self._pending.get((model_label, pk), 0)
+
+    def is_due(self):
+        with self._lock:
+            if not self._pending:
+                return False
+            return (len(self._pending) >= self.max_pending or
+                    time.monotonic() - self._last_flush >= self.flush_interval)
+
+    def flush(self):
+        """
+        Write all pending increments to the database
+
+        Returns:
+            int: Number of objects updated
+        """
+        with self._lock:
+            pending, self._pending = self._pending, defaultdict(int)
+            self._last_flush = time.monotonic()
+
+        if not pending:
+            return 0
+
+        try:
+            self._write(pending)
+        except Exception as e:
+            logger.error(f"Error flushing view counts, keeping {len(pending)} pending: {str(e)}")
+            with self._lock:
+                for key, delta in pending.items():
+                    self._pending[key] += delta
+            return 0
+
+        return len(pending)
+
+    def _write(self, pending):
+        """
+        Apply the deltas with one "view_count = view_count + delta" UPDATE per
+        model and delta (objects viewed equally often share a statement)
+        """
+        batches = defaultdict(list)
+        for (model_label, pk), delta in pending.items():
+            batches[(model_label, delta)].append(pk)
+
+        with transaction.atomic():
+            # Sorted so concurrent flushes lock rows in the same order
+            for (model_label, delta), pks in sorted(batches.items()):
+                model = apps.get_model(model_label)
+                model._base_manager.filter(pk__in=sorted(pks)).update(view_count=F('view_count') + delta)
+
+
+_buffer = ViewCounterBuffer(flush_thread=VIEW_COUNT_FLUSH_THREAD)
+
+
+class ViewCounterService:
+    """
+    Service class for counting page views of job listings and blog posts
+
+    Views are buffered in memory and written out in batches instead of
+    saving the row on every page view. The buffer is flushed by its
+    background thread every flush interval, when a request finishes and the
+    interval has passed, and when the process exits. Serverless deployments,
+    where an instance may be frozen after a response and never resumed, set
+    VIEW_COUNT_FLUSH_INTERVAL to 0 to write the views at the end of every
+    request.
+    """
+
+    @staticmethod
+    def record_view(instance):
+        """
+        Count one view of an object with a view_count field
+
+        The in-memory instance is bumped as well so the page shows the new count.
+
+        Args:
+            instance: JobListing or BlogPost instance
+        """
+        _buffer.increment(instance._meta.label, instance.pk)
+        instance.view_count += 1
+
+    @staticmethod
+    def pending_views(instance):
+        """
+        Get the number of views of an object not written to the database yet
+
+        Returns:
+            int: Pending views
+        """
+        return _buffer.pending(instance._meta.label, instance.pk)
+
+    @staticmethod
+    def flush():
+        """
+        Write all pending views to the database now
+
+        Returns:
+            int: Number of objects updated
+        """
+        return _buffer.flush()
+
+    @staticmethod
+    def flush_if_due():
+        """
+        Flush when the interval has passed or too many objects are pending
+
+        Returns:
+            int: Number of objects updated
+        """
+        if _buffer.is_due():
+            return _buffer.flush()
+        return 0
+
+
+atexit.register(_buffer.flush_at_exit)
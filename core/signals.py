@@ -1,7 +1,17 @@
-from django.db.models.signals import post_save, post_migrate
+from django.db import transaction
+from django.core.signals import request_finished
+from django.db.models.signals import pre_save, post_save, post_delete, post_init, post_migrate
 from django.dispatch import receiver
 from django.contrib.auth.models import User
-from .models import UserProfile
+from .models import UserProfile, JobListing, EmployerProfile, JobApplication
+from .models.base import bulk_soft_deleted
+from .services.stats_service import PlatformStatsService
+from .services.view_counter_service import ViewCounterService
+from .services.similar_jobs_service import SimilarJobsService, SIMILARITY_FIELDS
+from .services.application_stats_service import ApplicationStatsService
+from .services.reference_data_service import ReferenceDataService
+from .services.content_store_service import ContentStoreService
+from .search.normalization import build_search_document
 import logging
 import os
 import secrets
@@ -49,6 +59,194 @@ def save_user_profile(sender, instance, **kwargs):
     else:
         logger.warning(f"Signal: User {instance.username} has no UserProfile, this is unexpected")
 
+@receiver(post_save, sender=User)
+def refresh_applicant_search(sender, instance, created, update_fields=None, **kwargs):
+    """
+    Keep the applicant search document of a user's applications in sync with
+    their name and email (same fields as build_applicant_search_document)
+    """
+    if created:
+        return
+    if update_fields is not None and not set(update_fields) & {'first_name', 'last_name', 'email'}:
+        return
+    JobApplication.objects.filter(user=instance).update(
+        applicant_search=build_search_document(instance.first_name, instance.last_name, instance.email)
+    )
+
+def _remember_stats_state(sender, instance, **kwargs):
+    """
+    Remember whether a freshly loaded instance is counted in the platform stats,
+    so post_save can tell what changed
+    """
+    name = PlatformStatsService.counter_for(sender)
+    instance._stats_counted = PlatformStatsService.is_counted(name, instance)
+
+def _update_stats_on_save(sender, instance, created, **kwargs):
+    """
+    Adjust the cached platform stats after a save (this covers soft deletes,
+    which go through save() as well)
+    """
+    name = PlatformStatsService.counter_for(sender)
+    before = False if created else getattr(instance, '_stats_counted', None)
+    after = PlatformStatsService.is_counted(name, instance)
+    instance._stats_counted = after
+
+    if before is None or after is None:
+        # Previous state unknown - let the next read recount this stat
+        transaction.on_commit(lambda: PlatformStatsService.invalidate(name))
+        return
+
+    delta = int(after) - int(before)
+    if delta:
+        transaction.on_commit(lambda: PlatformStatsService.adjust(name, delta))
+
+def _update_stats_on_delete(sender, instance, **kwargs):
+    """Adjust the cached platform stats after a hard delete"""
+    name = PlatformStatsService.counter_for(sender)
+    counted = getattr(instance, '_stats_counted', None)
+
+    if counted is None:
+        transaction.on_commit(lambda: PlatformStatsService.invalidate(name))
+    elif counted:
+        transaction.on_commit(lambda: PlatformStatsService.adjust(name, -1))
+
+@receiver(bulk_soft_deleted)
+def update_stats_on_bulk_soft_delete(sender, count, **kwargs):
+    """Bulk soft deletes don't say which rows were counted, so recount on the next read"""
+    name = PlatformStatsService.counter_for(sender)
+    if name and count:
+        transaction.on_commit(lambda: PlatformStatsService.invalidate(name))
+
+for stats_model in (JobListing, EmployerProfile, UserProfile):
+    post_init.connect(_remember_stats_state, sender=stats_model, dispatch_uid=f'stats_init_{stats_model.__name__}')
+    post_save.connect(_update_stats_on_save, sender=stats_model, dispatch_uid=f'stats_save_{stats_model.__name__}')
+    post_delete.connect(_update_stats_on_delete, sender=stats_model, dispatch_uid=f'stats_delete_{stats_model.__name__}')
+
+@receiver(post_init, sender=JobListing)
+def remember_similarity_state(sender, instance, **kwargs):
+    """Remember the similarity fields as loaded, so a later save can tell whether they changed"""
+    instance._similarity_state = SimilarJobsService.similarity_state(instance)
+
+@receiver(post_save, sender=JobListing)
+def queue_similar_jobs_refresh(sender, instance, created, update_fields=None, **kwargs):
+    """
+    Queue the similar jobs refresh of a job that was approved, edited, expired or soft deleted
+    Only changed similarity fields queue it; the index is built by
+    `rebuild_similar_jobs --pending`, never on the write path.
+    """
+    if update_fields is not None and not SIMILARITY_FIELDS.intersection(update_fields):
+        return
+
+    state = SimilarJobsService.similarity_state(instance)
+    changed = instance.status == 'approved' if created else state != instance._similarity_state
+    instance._similarity_state = state
+    if changed:
+        SimilarJobsService.queue_refresh(instance.pk)
+
+@receiver(post_init, sender=JobApplication)
+def remember_application_rollup_state(sender, instance, **kwargs):
+    """Remember the rollup-relevant fields as loaded, so a later save can move the count"""
+    instance._rollup_status = instance.__dict__.get('status')
+    instance._rollup_job_id = instance.__dict__.get('job_id')
+
+@receiver(post_save, sender=JobApplication)
+def update_application_rollup_on_save(sender, instance, created, **kwargs):
+    """Keep the daily application rollup in step with new applications and status changes"""
+    if created:
+        ApplicationStatsService.adjust(
+            ApplicationStatsService.get_bucket(instance.job_id, instance.applied_at, instance.status, instance.user_id), 1
+        )
+    elif instance._rollup_status is not None and (
+        instance._rollup_status != instance.status or instance._rollup_job_id != instance.job_id
+    ):
+        ApplicationStatsService.adjust(
+            ApplicationStatsService.get_bucket(instance._rollup_job_id, instance.applied_at, instance._rollup_status, instance.user_id), -1
+        )
+        ApplicationStatsService.adjust(
+            ApplicationStatsService.get_bucket(instance.job_id, instance.applied_at, instance.status, instance.user_id), 1
+        )
+
+    instance._rollup_status = instance.status
+    instance._rollup_job_id = instance.job_id
+
+@receiver(post_delete, sender=JobApplication)
+def update_application_rollup_on_delete(sender, instance, **kwargs):
+    if instance._rollup_status is None:
+        return
+    ApplicationStatsService.adjust(
+        ApplicationStatsService.get_bucket(instance._rollup_job_id, instance.applied_at, instance._rollup_status, instance.user_id), -1
+    )
+
+# (model, file field, storage key field, display name field) of content-addressed files
+STORED_FILE_FIELDS = (
+    (UserProfile, 'cv', 'cv_storage_key', 'cv_file_name'),
+    (JobApplication, 'resume', 'resume_storage_key', 'resume_file_name'),
+)
+
+def _stored_file_fields(sender):
+    return next((fields for model, *fields in STORED_FILE_FIELDS if model is sender))
+
+def remember_stored_file(sender, instance, **kwargs):
+    """Remember the storage key as loaded, so a later save can move the reference"""
+    file_field, key_field, name_field = _stored_file_fields(sender)
+    instance._stored_file_key = instance.__dict__.get(key_field)
+
+def store_uploaded_file(sender, instance, update_fields=None, **kwargs):
+    """Store a newly assigned file in the content store before the row is written"""
+    file_field, key_field, name_field = _stored_file_fields(sender)
+    if update_fields is not None and file_field not in update_fields:
+        return
+    field_file = getattr(instance, file_field)
+    if field_file and not field_file._committed:
+        setattr(instance, name_field, os.path.basename(field_file.name))
+        setattr(instance, key_field, ContentStoreService.store(field_file))
+
+def move_stored_file_reference(sender, instance, created, **kwargs):
+    """
+    Count the row's reference on its new stored file and release the old one
+    Runs in the transaction of the save (the models wrap save() in atomic()),
+    so a failed write never leaves the counts changed.
+    """
+    file_field, key_field, name_field = _stored_file_fields(sender)
+    previous = '' if created else instance._stored_file_key
+    current = getattr(instance, key_field)
+    if current != previous:
+        ContentStoreService.retain(current)
+        ContentStoreService.release(previous)
+    instance._stored_file_key = current
+
+def release_stored_file(sender, instance, **kwargs):
+    """A deleted row no longer refers to its stored file"""
+    file_field, key_field, name_field = _stored_file_fields(sender)
+    ContentStoreService.release(getattr(instance, key_field))
+
+for stored_file_model, *_ in STORED_FILE_FIELDS:
+    post_init.connect(remember_stored_file, sender=stored_file_model, dispatch_uid=f'stored_file_init_{stored_file_model.__name__}')
+    pre_save.connect(store_uploaded_file, sender=stored_file_model, dispatch_uid=f'stored_file_store_{stored_file_model.__name__}')
+    post_save.connect(move_stored_file_reference, sender=stored_file_model, dispatch_uid=f'stored_file_save_{stored_file_model.__name__}')
+    post_delete.connect(release_stored_file, sender=stored_file_model, dispatch_uid=f'stored_file_delete_{stored_file_model.__name__}')
+
+def invalidate_reference_data(sender, **kwargs):
+    """
+    Any change to a reference-data model makes all cached reference data stale
+    Bumped right away for this process and again after commit, so nothing
+    another process loaded before the commit stays reachable.
+    """
+    ReferenceDataService.bump_generation()
+    transaction.on_commit(ReferenceDataService.bump_generation)
+
+for reference_model in ReferenceDataService.MODELS:
+    post_save.connect(invalidate_reference_data, sender=reference_model, dispatch_uid=f'reference_data_save_{reference_model.__name__}')
+    post_delete.connect(invalidate_reference_data, sender=reference_model, dispatch_uid=f'reference_data_delete_{reference_model.__name__}')
+
+@receiver(request_finished)
+def flush_view_counts(sender, **kwargs):
+    """Write buffered page views to the database once the flush interval has passed"""
+    try:
+        ViewCounterService.flush_if_due()
+    except Exception as e:
+        logger.error(f"Signal: Error flushing view counts: {str(e)}")
+
 def generate_secure_password(length=16):
     """Generate a secure random password"""
     alphabet = string.ascii_letters + string.digits + "!@#$%^&*()-_=+"
@@ -0,0 +1,83 @@
+document.addEventListener('DOMContentLoaded', function () {
+    // Both the desktop and the mobile card lists have a sentinel, only the
+    // visible one ever intersects the viewport
+    const sentinels = Array.from(document.querySelectorAll('[data-job-list-sentinel]'));
+    if (!sentinels.length || !('IntersectionObserver' in window)) {
+        return;
+    }
+
+    let nextUrl = sentinels[0].dataset.nextUrl;
+    let loading = false;
+
+    function setLoading(isLoading) {
+        loading = isLoading;
+        sentinels.forEach(function (sentinel) {
+            const indicator = sentinel.querySelector('[data-job-list-loading]');
+            if (indicator) {
+                indicator.classList.toggle('hidden', !isLoading);
+            }
+        });
+    }
+
+    // Append the rendered cards of each premium level to the matching section
+    function appendSections(sections) {
+        Object.keys(sections).forEach(function (level) {
+            ['desktop', 'mobile'].forEach(function (variant) {
+                const section = document.querySelector(
+                    '[data-job-cards="' + variant + '"] [data-job-section="' + level + '"]'
+                );
+                if (section) {
+                    section.insertAdjacentHTML('beforeend', sections[level][variant]);
+                }
+            });
+        });
+    }
+
+    function finish() {
+        observer.disconnect();
+        sentinels.forEach(function (sentinel) {
+            sentinel.remove();
+        });
+    }
+
+    function loadNextPage() {
+        if (loading || !nextUrl) {
+            return;
+        }
+        setLoading(true);
+
+        fetch(nextUrl, {
+            headers: { 'X-Requested-With': 'XMLHttpRequest' },
+            credentials: 'same-origin'
+        })
+            .then(function (response) {
+                if (!response.ok) {
+                    throw new Error('Failed to load jobs: ' + response.status);
+                }
+                return response.json();
+            })
+            .then(function (data) {
+                appendSections(data.sections || {});
+                nextUrl = data.has_more ? data.next_url : null;
+                setLoading(false);
+                if (!nextUrl) {
+                    finish();
+                }
+            })
+            .catch(function (error) {
+                console.error(error);
+                setLoading(false);
+                finish();
+            });
+    }
+
+    const observer = new IntersectionObserver(function (entries) {
+        if (entries.some(function (entry) { return entry.isIntersecting; })) {
+            loadNextPage();
+        }
+    }, { rootMargin: '600px 0px' });
+
+    sentinels.forEach(function (sentinel) {
+        observer.observe(sentinel);
+    });
+});
@@ -0,0 +1,40 @@
+/**
+ * Live notification badges
+ * Listens to the Server-Sent Events stream (core.realtime) and shows or hides
+ * every [data-notification-badge] element as the unread count changes.
+ */
+document.addEventListener('DOMContentLoaded', function () {
+    const streamUrl = document.body.dataset.notificationStream;
+    if (!streamUrl || !window.EventSource) {
+        return;
+    }
+
+    const badges = document.querySelectorAll('[data-notification-badge]');
+    let unreadCount = null;
+
+    function render() {
+        badges.forEach(badge => badge.classList.toggle('hidden', !(unreadCount > 0)));
+    }
+
+    const source = new EventSource(streamUrl);
+
+    // Sent on every (re)connect, so missed events can't leave the badge stale
+    source.addEventListener('unread_count', function (e) {
+        unreadCount = JSON.parse(e.data).count;
+        render();
+    });
+
+    function applyDelta(e) {
+        if (unreadCount === null) {
+            return;
+        }
+        unreadCount = Math.max(unreadCount + JSON.parse(e.data).unread_delta, 0);
+        render();
+    }
+
+    source.addEventListener('notification', function (e) {
+        applyDelta(e);
+        document.dispatchEvent(new CustomEvent('jobsight:notification', { detail: JSON.parse(e.data) }));
+    });
+    source.addEventListener('read', applyDelta);
+});
@@ -1,9 +1,6 @@
 from django import template
 from django.utils.translation import get_language, gettext as _
-from django.db.models import Q
-from core.models import (
-    PricingPackage, PricingFeature, ComparisonTable, ComparisonRow, ComparisonRowTranslation
-)
+from core.services.reference_data_service import ReferenceDataService
 
 register = template.Library()
 
@@ -105,18 +102,10 @@ def get_feature_translation(feature_name, language_code=None):
     if language_code == 'ka':
         return feature_name
     
-    try:
-        # Find a row with this feature name
-        row = ComparisonRow.objects.filter(feature_name=feature_name).first()
-        if row:
-            translation = ComparisonRowTranslation.objects.filter(
-                row=row, 
-                language_code=language_code
-            ).first()
-            if translation and translation.feature_name:
-                return translation.feature_name
-    except:
-        pass
+    # First row with this feature name, from the compiled catalog
+    translation = ReferenceDataService.pricing_translations().row_feature(feature_name, language_code)
+    if translation:
+        return translation
     
     # Fallback to gettext translation
     return _(feature_name)
@@ -130,26 +119,10 @@ def get_value_translation(value, feature_name=None, language_code=None):
     if language_code == 'ka' or not value:
         return value
     
-    try:
-        # Try to find a translation for this value
-        translations = ComparisonRowTranslation.objects.filter(
-            Q(standard_value=value) | 
-            Q(premium_value=value) | 
-            Q(premium_plus_value=value),
-            language_code=language_code
-        )
-        
-        if translations.exists():
-            for translation in translations:
-                # Check which field matches
-                if translation.row.standard_value == value:
-                    return translation.standard_value
-                elif translation.row.premium_value == value:
-                    return translation.premium_value
-                elif translation.row.premium_plus_value == value:
-                    return translation.premium_plus_value
-    except:
-        pass
+    # A row whose standard, premium or premium plus value is this text
+    translation = ReferenceDataService.pricing_translations().row_value(value, language_code)
+    if translation:
+        return translation
     
     # Fallback to gettext translation
     return _(value)
\ No newline at end of file
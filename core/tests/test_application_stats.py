@@ -0,0 +1,72 @@
+from io import StringIO
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+from django.contrib.auth.models import User
+from core.models import UserProfile, JobListing, JobApplication, ApplicationDailyStat
+from core.services.application_stats_service import ApplicationStatsService
+
+
+class ApplicationStatsServiceTest(TestCase):
+    def setUp(self):
+        user = User.objects.create_user('employer', 'employer@example.com', 'employerpass')
+        profile = UserProfile.objects.get(user=user)
+        profile.role = 'employer'
+        profile.save()
+        self.company = profile.employer_profile
+        self.candidate = User.objects.create_user('candidate', 'candidate@example.com', 'candidatepass')
+
+        self.job = JobListing.objects.create(
+            title='Developer',
+            company='Acme',
+            description='Test job description',
+            employer=self.company,
+            status='approved',
+            category='IT/პროგრამირება',
+        )
+
+    def apply(self, user=None):
+        return JobApplication.objects.create(
+            job=self.job,
+            user=user,
+            guest_name=None if user else 'Guest',
+            guest_email=None if user else 'guest@example.com',
+            cover_letter='Hello',
+        )
+
+    def test_rollup_follows_applications(self):
+        application = self.apply(self.candidate)
+        self.apply()
+        self.apply()
+
+        application.status = 'გასაუბრება'
+        application.save()
+
+        with self.assertNumQueries(1):
+            charts = ApplicationStatsService.get_employer_charts(self.company)
+
+        self.assertEqual(charts['status_counts'], {'განხილვის_პროცესში': 2, 'გასაუბრება': 1})
+        self.assertEqual(charts['source_counts'], {'registered': 1, 'guest': 2})
+        self.assertEqual(charts['top_categories'], [('IT/პროგრამირება', 3)])
+        self.assertEqual(charts['months'][-1][1], 3)
+
+        application.delete()
+        charts = ApplicationStatsService.get_employer_charts(self.company)
+        self.assertEqual(charts['status_counts'], {'განხილვის_პროცესში': 2})
+
+    def test_backfill_matches_incremental_rollup(self):
+        self.apply(self.candidate)
+        self.apply()
+        incremental = ApplicationStatsService.get_employer_charts(self.company)
+
+        ApplicationDailyStat.objects.all().delete()
+        call_command('backfill_application_rollups', stdout=StringIO())
+
+        self.assertEqual(ApplicationStatsService.get_employer_charts(self.company), incremental)
+
+    def test_employer_home_renders_charts_from_rollup(self):
+        self.apply()
+        self.client.login(username='employer', password='employerpass')
+        response = self.client.get(reverse('employer_home'))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context['source_data'], '[0, 1]')
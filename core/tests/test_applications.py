@@ -0,0 +1,217 @@
+import json
+from unittest.mock import patch
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import resolve, reverse
+from django.contrib.auth.models import User
+from core.models import UserProfile, JobListing, JobApplication, RejectionReason, CandidateNotification
+from core.repositories.application_repository import ApplicationRepository
+from core.services.application_stats_service import ApplicationStatsService
+from core.views.employer_views import application_management
+
+
+class ApplicationReadMarkingTest(TestCase):
+    def setUp(self):
+        self.employer_user = User.objects.create_user('employer', 'employer@example.com', 'employerpass')
+        profile = UserProfile.objects.get(user=self.employer_user)
+        profile.role = 'employer'
+        profile.save()
+        self.company = profile.employer_profile
+        self.candidate = User.objects.create_user('candidate', 'candidate@example.com', 'candidatepass')
+
+        self.job = JobListing.objects.create(
+            title='Developer',
+            company='Acme',
+            description='Test job description',
+            employer=self.company,
+            status='approved',
+        )
+        for i in range(10):
+            JobApplication.objects.create(
+                job=self.job,
+                guest_name=f'Guest {i}',
+                guest_email=f'guest{i}@example.com',
+                cover_letter='Hello',
+            )
+        self.client.login(username='employer', password='employerpass')
+
+    def test_job_applications_marks_read_in_one_update(self):
+        url = reverse('job_applications', args=[self.job.id])
+        self.assertIs(resolve(url).func, application_management.job_applications)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+
+        updates = [query for query in queries if query['sql'].startswith('UPDATE "core_jobapplication"')]
+        self.assertEqual(len(updates), 1)
+        self.assertFalse(JobApplication.objects.filter(is_read=False).exists())
+        # The page was rendered from the rows as they were before the UPDATE, so they still show as new
+        self.assertEqual(len(response.context['applications']), 10)
+        self.assertFalse(any(application.is_read for application in response.context['applications']))
+
+    def test_mark_applications_as_read_is_scoped(self):
+        shown = list(JobApplication.objects.order_by('id').values_list('id', flat=True)[:3])
+        self.assertEqual(ApplicationRepository.mark_applications_as_read(shown), 3)
+        self.assertEqual(JobApplication.objects.filter(is_read=True).count(), 3)
+        self.assertEqual(ApplicationRepository.mark_applications_as_read(shown), 0)
+
+    def test_mark_candidate_applications_as_viewed(self):
+        other_job = JobListing.objects.create(
+            title='Designer', company='Acme', description='Test', employer=self.company, status='approved',
+        )
+        for job in (self.job, other_job):
+            JobApplication.objects.create(job=job, user=self.candidate, cover_letter='Hello')
+
+        self.assertEqual(ApplicationRepository.mark_candidate_applications_as_viewed(self.candidate.id, self.company), 2)
+        self.assertEqual(JobApplication.objects.filter(is_viewed=True).count(), 2)
+
+
+class ApplicantListTest(TestCase):
+    def setUp(self):
+        employer_user = User.objects.create_user('employer', 'employer@example.com', 'employerpass')
+        profile = UserProfile.objects.get(user=employer_user)
+        profile.role = 'employer'
+        profile.save()
+        self.job = JobListing.objects.create(
+            title='Developer',
+            company='Acme',
+            description='Test job description',
+            employer=profile.employer_profile,
+            status='approved',
+        )
+        self.candidate = User.objects.create_user(
+            'candidate', 'nino@example.com', 'candidatepass', first_name='Nino', last_name='Beridze',
+        )
+        self.registered = JobApplication.objects.create(job=self.job, user=self.candidate, cover_letter='Hello')
+        for i in range(4):
+            JobApplication.objects.create(
+                job=self.job,
+                guest_name=f'Guest {i}',
+                guest_email=f'guest{i}@example.com',
+                cover_letter='Hello',
+                status='გასაუბრება' if i % 2 else 'განხილვის_პროცესში',
+            )
+        self.client.login(username='employer', password='employerpass')
+
+    def test_status_counts_come_from_one_query(self):
+        with self.assertNumQueries(1):
+            counts = ApplicationRepository.get_application_counts_by_status(job_id=self.job.id)
+        self.assertEqual(counts, {'განხილვის_პროცესში': 3, 'გასაუბრება': 2, 'რეზერვი': 0})
+
+    def test_search_matches_normalized_name_and_email(self):
+        search = lambda query: list(ApplicationRepository.get_applications_by_job(self.job.id, search_query=query))
+        self.assertEqual(search('nino beridze'), [self.registered])
+        self.assertEqual(search('NINO@example'), [self.registered])
+        self.assertEqual(len(search('guest')), 4)
+
+    def test_search_follows_user_renames(self):
+        self.candidate.last_name = 'Kapanadze'
+        self.candidate.save()
+        found = ApplicationRepository.get_applications_by_job(self.job.id, search_query='kapanadze')
+        self.assertEqual(list(found), [self.registered])
+
+    def test_applicant_list_pages_with_cursor(self):
+        url = reverse('job_applications', args=[self.job.id])
+        with patch('core.views.employer_views.application_management.APPLICATIONS_PAGE_SIZE', 2):
+            seen = []
+            next_url = url
+            while next_url:
+                response = self.client.get(next_url)
+                seen.extend(application.id for application in response.context['applications'])
+                next_url = response.context['next_page_url']
+
+        expected = list(JobApplication.objects.order_by('-applied_at', '-id').values_list('id', flat=True))
+        self.assertEqual(seen, expected)
+        self.assertEqual(response.context['total_applications'], 5)
+
+    def test_invalid_cursor_starts_over(self):
+        response = self.client.get(reverse('job_applications', args=[self.job.id]), {'cursor': 'bogus'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.context['applications']), 5)
+
+    def test_status_tab_and_search_filter_on_the_server(self):
+        url = reverse('job_applications', args=[self.job.id])
+        response = self.client.get(url, {'status': 'გასაუბრება'})
+        self.assertEqual(len(response.context['applications']), 2)
+        self.assertEqual(response.context['review_applications'], 3)
+
+        response = self.client.get(url, {'search': 'beridze'})
+        self.assertEqual(list(response.context['applications']), [self.registered])
+
+
+class BulkApplicationStatusTest(TestCase):
+    def setUp(self):
+        employer_user = User.objects.create_user('employer', 'employer@example.com', 'employerpass')
+        profile = UserProfile.objects.get(user=employer_user)
+        profile.role = 'employer'
+        profile.save()
+        self.company = profile.employer_profile
+        self.job = JobListing.objects.create(
+            title='Developer',
+            company='Acme',
+            description='Test job description',
+            employer=self.company,
+            status='approved',
+        )
+        self.applications = []
+        for i in range(3):
+            candidate = User.objects.create_user(f'candidate{i}', f'candidate{i}@example.com', 'pass')
+            self.applications.append(JobApplication.objects.create(job=self.job, user=candidate, cover_letter='Hello'))
+        self.guest = JobApplication.objects.create(job=self.job, guest_name='Guest', guest_email='g@example.com', cover_letter='Hi')
+        self.reasons = [RejectionReason.objects.create(name='Experience'), RejectionReason.objects.create(name='Location')]
+        self.client.login(username='employer', password='employerpass')
+
+    def post(self, payload):
+        return self.client.post(
+            reverse('bulk_update_application_status'), json.dumps(payload), content_type='application/json'
+        )
+
+    def test_bulk_update_moves_applications_and_notifies(self):
+        other_employer = User.objects.create_user('other', 'other@example.com', 'pass')
+        other_profile = UserProfile.objects.get(user=other_employer)
+        other_profile.role = 'employer'
+        other_profile.save()
+        other_job = JobListing.objects.create(
+            title='Other', company='Other', description='Test', employer=other_profile.employer_profile, status='approved',
+        )
+        foreign = JobApplication.objects.create(job=other_job, guest_name='X', cover_letter='Hi')
+
+        ids = [application.id for application in self.applications] + [self.guest.id, foreign.id]
+        response = self.post({
+            'application_ids': ids,
+            'status': 'რეზერვი',
+            'rejection_reasons': [reason.id for reason in self.reasons],
+            'feedback': 'Thanks for applying',
+        })
+        data = response.json()
+
+        self.assertFalse(data['success'])
+        self.assertFalse(data['results'][str(foreign.id)]['success'])
+        self.assertTrue(data['results'][str(self.guest.id)]['changed'])
+        self.assertEqual(JobApplication.objects.filter(job=self.job, status='რეზერვი').count(), 4)
+        self.assertEqual(JobApplication.objects.get(pk=foreign.pk).status, 'განხილვის_პროცესში')
+        self.assertEqual(JobApplication.rejection_reasons.through.objects.count(), 8)
+        self.assertEqual(CandidateNotification.objects.filter(job_title='Developer', company_name='Acme').count(), 3)
+
+        counts = ApplicationStatsService.get_employer_charts(self.company)['status_counts']
+        self.assertEqual(counts.get('რეზერვი'), 4)
+        self.assertEqual(counts.get('განხილვის_პროცესში', 0), 0)
+
+    def test_bulk_update_query_count_does_not_grow_with_applications(self):
+        ids = [application.id for application in self.applications]
+        # Create the rollup rows of both statuses first
+        self.post({'application_ids': ids, 'status': 'გასაუბრება'})
+        self.post({'application_ids': ids, 'status': 'განხილვის_პროცესში'})
+
+        with CaptureQueriesContext(connection) as small:
+            self.post({'application_ids': ids[:1], 'status': 'გასაუბრება'})
+        with CaptureQueriesContext(connection) as large:
+            self.post({'application_ids': ids, 'status': 'გასაუბრება'})
+        self.assertEqual(len(small), len(large))
+
+    def test_invalid_status_is_rejected(self):
+        response = self.post({'application_ids': [self.guest.id], 'status': 'hired'})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(JobApplication.objects.get(pk=self.guest.pk).status, 'განხილვის_პროცესში')
@@ -0,0 +1,155 @@
+import hashlib
+import shutil
+import tempfile
+from datetime import timedelta
+import boto3
+from botocore.stub import Stubber
+from django.contrib.auth.models import User
+from django.db import DatabaseError
+from django.db.models import Value
+from django.db.models.signals import post_save
+from django.db.models.functions import Concat
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from core.media.reconcile import MediaReconciler
+from core.models import UserProfile, JobListing, JobApplication, StoredFile
+from core.services.content_store_service import ContentStoreService
+
+BUCKET = 'jobsight-test'
+
+
+class ContentStoreTest(TestCase):
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        self.settings_override = override_settings(MEDIA_ROOT=self.media_root)
+        self.settings_override.enable()
+
+        self.candidate = User.objects.create_user('candidate', 'nino@example.com', 'pass')
+        self.profile = UserProfile.objects.get(user=self.candidate)
+        employer_user = User.objects.create_user('employer', 'employer@example.com', 'employerpass')
+        employer = UserProfile.objects.get(user=employer_user)
+        employer.role = 'employer'
+        employer.save()
+        self.job = JobListing.objects.create(
+            title='Developer', company='Acme', description='Test job description',
+            employer=employer.employer_profile, status='approved',
+        )
+
+    def tearDown(self):
+        self.settings_override.disable()
+        shutil.rmtree(self.media_root, ignore_errors=True)
+
+    def apply(self, content, name='nino.pdf'):
+        return JobApplication.objects.create(
+            job=self.job, user=self.candidate, cover_letter='Hi', resume=SimpleUploadedFile(name, content),
+        )
+
+    def test_identical_uploads_share_one_object(self):
+        applications = [self.apply(b'%PDF nino', name=f'cv{i}.pdf') for i in range(3)]
+        other = self.apply(b'%PDF other')
+
+        stored = StoredFile.objects.get(storage_key=applications[0].resume_storage_key)
+        self.assertEqual(stored.ref_count, 3)
+        self.assertEqual({application.resume.name for application in applications}, {stored.name})
+        self.assertNotEqual(other.resume_storage_key, stored.storage_key)
+        self.assertEqual(StoredFile.objects.count(), 2)
+
+        # Applying with the profile CV shares the CV object
+        self.profile.cv = SimpleUploadedFile('nino.pdf', b'%PDF nino')
+        self.profile.save()
+        self.assertEqual(self.profile.cv_storage_key, stored.storage_key)
+        JobApplication.objects.create(
+            job=self.job, user=self.candidate, cover_letter='Hi',
+            resume=self.profile.cv, resume_storage_key=self.profile.cv_storage_key,
+        )
+        stored.refresh_from_db()
+        self.assertEqual(stored.ref_count, 5)
+
+    def test_shared_objects_keep_each_uploaders_file_name(self):
+        first = self.apply(b'%PDF same', name='Nino_Beridze.pdf')
+        second = self.apply(b'%PDF same', name='Giorgi_CV.PDF')
+        self.assertEqual(first.resume.name, f"resumes/{hashlib.sha256(b'%PDF same').hexdigest()}.pdf")
+        self.assertEqual(second.resume.name, first.resume.name)
+        self.assertEqual(
+            [application.resume_display_name for application in JobApplication.objects.order_by('id')],
+            ['Nino_Beridze.pdf', 'Giorgi_CV.PDF'],
+        )
+
+    def test_failed_write_leaves_counts_unchanged(self):
+        key = self.apply(b'%PDF nino').resume_storage_key
+
+        def fail(sender, **kwargs):
+            raise DatabaseError('write failed')
+
+        post_save.connect(fail, sender=JobApplication, dispatch_uid='test_fail_application_save')
+        try:
+            for content in (b'%PDF nino', b'%PDF new'):
+                with self.assertRaises(DatabaseError):
+                    self.apply(content)
+        finally:
+            post_save.disconnect(sender=JobApplication, dispatch_uid='test_fail_application_save')
+
+        self.assertEqual(StoredFile.objects.get(storage_key=key).ref_count, 1)
+        self.assertEqual(StoredFile.objects.count(), 1)
+
+    def test_replacing_clearing_and_deleting_release_references(self):
+        first, second = self.apply(b'%PDF nino'), self.apply(b'%PDF nino')
+        key = first.resume_storage_key
+
+        first.resume = SimpleUploadedFile('new.pdf', b'%PDF new')
+        first.save()
+        self.assertEqual(StoredFile.objects.get(storage_key=key).ref_count, 1)
+        second.delete()
+        self.assertEqual(StoredFile.objects.get(storage_key=key).ref_count, 0)
+
+        self.profile.cv = SimpleUploadedFile('cv.pdf', b'%PDF cv')
+        self.profile.save()
+        cv_key = self.profile.cv_storage_key
+        # Uploading the same content again keeps one reference
+        self.profile.cv = SimpleUploadedFile('cv.pdf', b'%PDF cv')
+        self.profile.save()
+        self.assertEqual(StoredFile.objects.get(storage_key=cv_key).ref_count, 1)
+        self.profile.cv = None
+        self.profile.save(update_fields=['cv'])
+        self.assertEqual(StoredFile.objects.get(storage_key=cv_key).ref_count, 0)
+
+    def test_orphan_cleaner_keeps_shared_objects(self):
+        shared = self.apply(b'%PDF nino')
+        self.apply(b'%PDF nino')
+        released = self.apply(b'%PDF old')
+        released.delete()
+        # Keys on S3 carry the location; the test storage is local
+        StoredFile.objects.update(storage_key=Concat(Value('media/private/'), 'name'))
+        shared_key, released_key = (f'media/private/{application.resume.name}' for application in (shared, released))
+
+        s3_client = boto3.client('s3', region_name='us-east-1', aws_access_key_id='test', aws_secret_access_key='test')
+        stubber = Stubber(s3_client)
+        old = timezone.now() - timedelta(days=30)
+        stubber.add_response('list_objects_v2', {
+            'Contents': [{'Key': key, 'Size': 10, 'LastModified': old} for key in (shared_key, released_key)],
+            'IsTruncated': False,
+        }, {'Bucket': BUCKET, 'Prefix': 'media/private/resumes/'})
+        stubber.add_response('delete_objects', {}, {'Bucket': BUCKET, 'Delete': {
+            'Objects': [{'Key': released_key}], 'Quiet': True,
+        }})
+
+        with stubber:
+            reconciler = MediaReconciler(client=s3_client, bucket=BUCKET, concurrency=1, prefixes=['media/private/resumes/'])
+            report = reconciler.run(delete=True)
+            stubber.assert_no_pending_responses()
+
+        self.assertEqual([orphan['key'] for orphan in report['orphans']], [released_key])
+        self.assertEqual(report['totals']['deleted'], 1)
+        self.assertFalse(StoredFile.objects.filter(storage_key=released_key).exists())
+        self.assertEqual(StoredFile.objects.get(storage_key=shared_key).ref_count, 2)
+
+    def test_collect_keeps_objects_referenced_again(self):
+        revived = self.apply(b'%PDF revived')
+        revived.delete()
+        key = StoredFile.objects.get().storage_key
+        # An upload of the same content took a reference after the scan
+        StoredFile.objects.update(ref_count=1)
+
+        self.assertEqual(ContentStoreService.collect([key, 'media/private/cvs/legacy.pdf']), {'media/private/cvs/legacy.pdf'})
+        self.assertTrue(StoredFile.objects.filter(storage_key=key).exists())
@@ -0,0 +1,72 @@
+from datetime import timedelta
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from django.contrib.auth.models import User
+from core.models import UserProfile, JobListing, JobApplication, EmployerNotification
+
+
+# Session, user, profile with employer profile (shared Viewer), jobs with counts, deleted-job count, session save
+DASHBOARD_QUERY_BUDGET = 8
+
+
+class EmployerDashboardQueryTest(TestCase):
+    def setUp(self):
+        self.employer_user = User.objects.create_user('employer', 'employer@example.com', 'employerpass')
+        profile = UserProfile.objects.get(user=self.employer_user)
+        profile.role = 'employer'
+        profile.save()
+        self.company = profile.employer_profile
+        self.client.login(username='employer', password='employerpass')
+
+    def add_jobs(self, count):
+        for i in range(count):
+            job = JobListing.objects.create(
+                title=f'Job {i}',
+                company='Test Company',
+                description='Test job description',
+                employer=self.company,
+                status='approved',
+                expires_at=timezone.now() - timedelta(days=1) if i % 2 else timezone.now() + timedelta(days=10),
+            )
+            JobApplication.objects.create(job=job, guest_name='Guest', guest_email='guest@example.com', cover_letter='Hi')
+            for is_read in (False, False, True):
+                EmployerNotification.objects.create(
+                    employer_profile=self.company, job=job, notification_type='new_application',
+                    message='New application', is_read=is_read,
+                )
+
+    def count_dashboard_queries(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse('employer_dashboard'))
+        self.assertEqual(response.status_code, 200)
+        return len(queries), response
+
+    def test_query_count_does_not_grow_with_jobs(self):
+        self.add_jobs(2)
+        small, _ = self.count_dashboard_queries()
+
+        self.add_jobs(20)
+        large, response = self.count_dashboard_queries()
+
+        self.assertEqual(small, large)
+        self.assertEqual(len(response.context['all_jobs']), 22)
+        for job in response.context['all_jobs']:
+            self.assertEqual(job.unread_notification_count, 2)
+            self.assertEqual(job.applications_count, 1)
+
+    def test_fixed_query_budget(self):
+        self.add_jobs(30)
+        with self.assertNumQueries(DASHBOARD_QUERY_BUDGET):
+            self.client.get(reverse('employer_dashboard'))
+
+    def test_rendering_does_not_expire_jobs(self):
+        self.add_jobs(2)
+        _, response = self.count_dashboard_queries()
+
+        expired = [job for job in response.context['all_jobs'] if job.is_expired_status]
+        self.assertEqual(len(expired), 1)
+        self.assertEqual(expired[0].status, 'expired')
+        self.assertEqual(JobListing.objects.get(pk=expired[0].pk).status, 'approved')
@@ -0,0 +1,78 @@
+from datetime import timedelta
+from io import StringIO
+from django.core.cache import cache
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+from django.utils import timezone
+from django.contrib.auth.models import User
+from core.models import UserProfile, JobListing, EmployerNotification
+from core.services.job_expiry_service import JobExpiryService, EXPIRY_CACHE_LOCK_KEY
+
+
+class JobExpiryServiceTest(TestCase):
+    def setUp(self):
+        cache.delete(EXPIRY_CACHE_LOCK_KEY)
+        user = User.objects.create_user('employer', 'employer@example.com', 'employerpass')
+        profile = UserProfile.objects.get(user=user)
+        profile.role = 'employer'
+        profile.save()
+        self.company = profile.employer_profile
+        self.now = timezone.now()
+
+        past = self.now - timedelta(days=1)
+        future = self.now + timedelta(days=5)
+        self.jobs = {
+            'approved_past': self.create_job('approved', past),
+            'approved_future': self.create_job('approved', future),
+            'approved_no_date': self.create_job('approved', None),
+            'expired_past': self.create_job('expired', past),
+            'expired_future': self.create_job('expired', future),
+            'extended_review_past': self.create_job('extended_review', past),
+            'pending_past': self.create_job('pending_review', past),
+        }
+
+    def create_job(self, status, expires_at):
+        return JobListing.objects.create(
+            title=f'{status} job',
+            company='Acme',
+            description='Test job description',
+            employer=self.company,
+            status=status,
+            expires_at=expires_at,
+        )
+
+    def test_matches_per_row_semantics(self):
+        """The bulk run ends in the same statuses as update_status_from_expiration per job"""
+        expected = {}
+        for name, job in self.jobs.items():
+            job = JobListing.objects.get(pk=job.pk)
+            if job.status in ('approved', 'expired'):
+                job.update_status_from_expiration()
+            expected[name] = job.status
+            # Undo, so the service starts from the original state
+            JobListing.objects.filter(pk=job.pk).update(status=self.jobs[name].status)
+
+        report = JobExpiryService.run(now=timezone.now(), batch_size=2)
+
+        for name, job in self.jobs.items():
+            self.assertEqual(JobListing.objects.get(pk=job.pk).status, expected[name], name)
+        self.assertEqual(report['expired'], [self.jobs['approved_past'].pk])
+        self.assertEqual(report['reactivated'], [self.jobs['expired_future'].pk])
+
+        notification = EmployerNotification.objects.get(notification_type='job_status_update')
+        self.assertEqual(notification.job, self.jobs['approved_past'])
+        self.assertEqual(notification.job_title, 'approved job')
+
+    def test_dry_run_changes_nothing(self):
+        out = StringIO()
+        call_command('update_expired_jobs', '--dry-run', stdout=out)
+        self.assertIn('Would update 1 jobs to expired status', out.getvalue())
+        self.assertEqual(JobListing.objects.get(pk=self.jobs['approved_past'].pk).status, 'approved')
+        self.assertFalse(EmployerNotification.objects.exists())
+
+    def test_overlapping_runs_are_rejected(self):
+        cache.add(EXPIRY_CACHE_LOCK_KEY, True)
+        with self.assertRaises(CommandError):
+            call_command('update_expired_jobs', stdout=StringIO())
+        self.assertEqual(JobListing.objects.get(pk=self.jobs['approved_past'].pk).status, 'approved')
@@ -0,0 +1,109 @@
+import hashlib
+import os
+import shutil
+import tempfile
+import boto3
+from botocore.stub import Stubber, ANY
+from django.contrib.auth.models import User
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase
+from core.media.migration import MediaMigration, file_etag
+from core.models import UserProfile, StoredFile
+
+BUCKET = 'jobsight-test'
+
+
+class MediaMigrationTest(TestCase):
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        for name, content in (('cvs/a.pdf', b'%PDF a'), ('cvs/b.pdf', b'%PDF b'), ('company_logos/logo.png', b'PNG')):
+            os.makedirs(os.path.join(self.media_root, os.path.dirname(name)), exist_ok=True)
+            with open(os.path.join(self.media_root, name), 'wb') as f:
+                f.write(content)
+
+        self.candidate = User.objects.create_user('candidate', 'nino@example.com', 'pass')
+        UserProfile.objects.filter(user=self.candidate).update(cv='media/cvs/a.pdf')
+
+        self.s3_client = boto3.client('s3', region_name='us-east-1', aws_access_key_id='test', aws_secret_access_key='test')
+        self.stubber = Stubber(self.s3_client)
+        self.stubber.activate()
+
+    def tearDown(self):
+        self.stubber.deactivate()
+        shutil.rmtree(self.media_root, ignore_errors=True)
+
+    def migration(self):
+        return MediaMigration(media_root=self.media_root, client=self.s3_client, bucket=BUCKET, workers=1)
+
+    def head(self, key, content):
+        self.stubber.add_response(
+            'head_object',
+            {'ETag': f'"{hashlib.md5(content).hexdigest()}"', 'ContentLength': len(content)},
+            {'Bucket': BUCKET, 'Key': key},
+        )
+
+    def missing(self, key):
+        self.stubber.add_client_error('head_object', '404', expected_params={'Bucket': BUCKET, 'Key': key})
+
+    def test_multipart_etag(self):
+        path = os.path.join(self.media_root, 'cvs/a.pdf')
+        self.assertEqual(file_etag(path), hashlib.md5(b'%PDF a').hexdigest())
+        parts = [hashlib.md5(b'%PD').digest(), hashlib.md5(b'F a').digest()]
+        self.assertEqual(file_etag(path, chunk_size=3), f'{hashlib.md5(b"".join(parts)).hexdigest()}-2')
+
+    def test_upload_skips_identical_objects_resumes_and_rewrites_paths(self):
+        self.missing('media/private/cvs/a.pdf')
+        self.stubber.add_response('put_object', {'ETag': '"a"'}, {'Bucket': BUCKET, 'Key': 'media/private/cvs/a.pdf', 'Body': ANY, 'ContentType': 'application/pdf'})
+        self.head('media/private/cvs/b.pdf', b'%PDF b')
+        self.stubber.add_client_error('head_object', '500', expected_params={'Bucket': BUCKET, 'Key': 'media/public/company_logos/logo.png'})
+
+        migration = self.migration()
+        stats = migration.upload()
+        self.assertEqual(stats, {'uploaded': 1, 'skipped': 1, 'failed': 1, 'resumed': 0})
+        # One read per file field and of the stored files, and one bulk update, however many rows
+        with self.assertNumQueries(7):
+            self.assertEqual(migration.rewrite_paths(), 1)
+
+        profile = UserProfile.objects.get(user=self.candidate)
+        self.assertEqual((profile.cv.name, profile.cv_storage_key), ('cvs/a.pdf', 'media/private/cvs/a.pdf'))
+
+        # A second run only retries the failed file
+        self.missing('media/public/company_logos/logo.png')
+        self.stubber.add_response('put_object', {'ETag': '"l"'}, {'Bucket': BUCKET, 'Key': 'media/public/company_logos/logo.png', 'Body': ANY, 'ContentType': 'image/png'})
+        self.assertEqual(self.migration().upload(), {'uploaded': 1, 'skipped': 0, 'failed': 0, 'resumed': 2})
+        self.stubber.assert_no_pending_responses()
+
+    def test_verify_compares_size_and_etag(self):
+        self.head('media/private/cvs/a.pdf', b'%PDF a')
+        self.head('media/private/cvs/b.pdf', b'%PDF c')
+        self.missing('media/public/company_logos/logo.png')
+
+        stats = self.migration().verify()
+        self.stubber.assert_no_pending_responses()
+        self.assertEqual(stats, {'ok': 1, 'missing': 1, 'size_mismatch': 0, 'etag_mismatch': 1, 'errors': 0})
+
+    def test_uploads_after_the_migration_share_the_migrated_object(self):
+        content = b'%PDF a'
+        UserProfile.objects.filter(user=self.candidate).update(cv='cvs/a.pdf', cv_storage_key='cvs/a.pdf')
+        stored = StoredFile.objects.create(
+            sha256=hashlib.sha256(content).hexdigest(), name='cvs/a.pdf', storage_key='cvs/a.pdf', size=len(content), ref_count=1,
+        )
+        self.missing('media/private/cvs/a.pdf')
+        self.stubber.add_response('put_object', {'ETag': '"a"'}, {'Bucket': BUCKET, 'Key': 'media/private/cvs/a.pdf', 'Body': ANY, 'ContentType': 'application/pdf'})
+        self.head('media/private/cvs/b.pdf', b'%PDF b')
+        self.head('media/public/company_logos/logo.png', b'PNG')
+
+        migration = self.migration()
+        migration.upload()
+        self.assertEqual(migration.rewrite_paths(), 2)
+        stored.refresh_from_db()
+        self.assertEqual(stored.storage_key, 'media/private/cvs/a.pdf')
+
+        # The same content uploaded again points at the migrated object and counts as a reference to it
+        other = UserProfile.objects.get(user=User.objects.create_user('other', 'other@example.com', 'pass'))
+        other.cv = SimpleUploadedFile('mine.pdf', content)
+        other.save()
+        other.refresh_from_db()
+        self.assertEqual((other.cv.name, other.cv_storage_key), ('cvs/a.pdf', 'media/private/cvs/a.pdf'))
+        stored.refresh_from_db()
+        self.assertEqual(stored.ref_count, 2)
@@ -0,0 +1,106 @@
+import json
+from datetime import timedelta
+import boto3
+from botocore.stub import Stubber
+from django.contrib.auth.models import User
+from django.test import TestCase
+from django.utils import timezone
+from core.media.reconcile import MediaReconciler, media_sources
+from core.models import UserProfile, JobListing, JobApplication
+
+BUCKET = 'jobsight-test'
+
+
+class MediaReconcilerTest(TestCase):
+    def setUp(self):
+        self.now = timezone.now()
+        candidate = User.objects.create_user('candidate', 'nino@example.com', 'pass')
+        UserProfile.objects.filter(user=candidate).update(cv='cvs/a.pdf')
+        employer_user = User.objects.create_user('employer', 'employer@example.com', 'employerpass')
+        employer = UserProfile.objects.get(user=employer_user)
+        employer.role = 'employer'
+        employer.save()
+        employer.employer_profile.company_logo = 'company_logos/logo.png'
+        employer.employer_profile.save()
+        job = JobListing.objects.create(
+            title='Developer', company='Acme', description='Test job description',
+            employer=employer.employer_profile, status='approved',
+        )
+        # Applied with the profile CV: the resume points into cvs/
+        JobApplication.objects.create(job=job, user=candidate, cover_letter='Hi', resume='cvs/a.pdf')
+        JobApplication.objects.create(job=job, guest_name='Guest', cover_letter='Hi', resume='resumes/r.pdf')
+
+        self.client_s3 = boto3.client('s3', region_name='us-east-1', aws_access_key_id='test', aws_secret_access_key='test')
+        self.stubber = Stubber(self.client_s3)
+        self.stubber.activate()
+
+    def tearDown(self):
+        self.stubber.deactivate()
+
+    def obj(self, key, days_old=30):
+        return {'Key': key, 'Size': 100, 'LastModified': self.now - timedelta(days=days_old)}
+
+    def list_page(self, prefix, objects, token=None, next_token=None):
+        response = {'Contents': objects, 'IsTruncated': bool(next_token), 'KeyCount': len(objects)}
+        params = {'Bucket': BUCKET, 'Prefix': prefix}
+        if next_token:
+            response['NextContinuationToken'] = next_token
+        if token:
+            params['ContinuationToken'] = token
+        self.stubber.add_response('list_objects_v2', response, params)
+
+    def stub_listings(self, pages):
+        for prefix, *_ in media_sources():
+            prefix_pages = pages.get(prefix, [[]])
+            for i, objects in enumerate(prefix_pages):
+                token = f'{prefix}{i}' if i else None
+                next_token = f'{prefix}{i + 1}' if i + 1 < len(prefix_pages) else None
+                self.list_page(prefix, objects, token, next_token)
+
+    def test_paginated_scan_and_batched_delete(self):
+        self.stub_listings({
+            'media/private/cvs/': [
+                [self.obj('media/private/cvs/a.pdf'), self.obj('media/private/cvs/old.pdf')],
+                [self.obj('media/private/cvs/new.pdf', days_old=0)],
+            ],
+            'media/private/resumes/': [[self.obj('media/private/resumes/r.pdf'), self.obj('media/private/resumes/x.pdf')]],
+            'media/public/company_logos/': [[self.obj('media/public/company_logos/logo.png')]],
+        })
+        self.stubber.add_response(
+            'delete_objects',
+            {'Errors': [{'Key': 'media/private/resumes/x.pdf', 'Code': 'AccessDenied', 'Message': 'Access Denied'}]},
+            {'Bucket': BUCKET, 'Delete': {
+                'Objects': [{'Key': 'media/private/cvs/old.pdf'}, {'Key': 'media/private/resumes/x.pdf'}],
+                'Quiet': True,
+            }},
+        )
+
+        report = MediaReconciler(client=self.client_s3, bucket=BUCKET, concurrency=1).run(delete=True, now=self.now)
+        self.stubber.assert_no_pending_responses()
+
+        self.assertEqual([orphan['key'] for orphan in report['orphans']], ['media/private/cvs/old.pdf', 'media/private/resumes/x.pdf'])
+        self.assertEqual(report['prefixes']['media/private/cvs/'], {
+            'scanned': 3, 'scanned_bytes': 300, 'too_recent': 1, 'orphaned': 1, 'orphaned_bytes': 100, 'deleted': 1,
+        })
+        self.assertEqual(report['totals'], {'scanned': 6, 'orphaned': 2, 'orphaned_bytes': 200, 'deleted': 1})
+        self.assertEqual(report['errors'], [{'key': 'media/private/resumes/x.pdf', 'error': 'Access Denied'}])
+        json.loads(MediaReconciler.report_json(report))
+
+    def test_deletes_in_batches_of_1000(self):
+        orphans = [self.obj(f'media/public/blog_images/{i}.png') for i in range(1001)]
+        self.stub_listings({'media/public/blog_images/': [orphans]})
+        for batch in (orphans[:1000], orphans[1000:]):
+            self.stubber.add_response('delete_objects', {}, {'Bucket': BUCKET, 'Delete': {
+                'Objects': [{'Key': obj['Key']} for obj in batch], 'Quiet': True,
+            }})
+
+        report = MediaReconciler(client=self.client_s3, bucket=BUCKET, concurrency=1).run(delete=True, now=self.now)
+        self.stubber.assert_no_pending_responses()
+        self.assertEqual(report['totals']['deleted'], 1001)
+
+    def test_scan_only_deletes_nothing(self):
+        self.stub_listings({'media/private/cvs/': [[self.obj('media/private/cvs/old.pdf')]]})
+        report = MediaReconciler(client=self.client_s3, bucket=BUCKET, concurrency=1).run(now=self.now)
+        self.stubber.assert_no_pending_responses()
+        self.assertEqual(report['totals']['orphaned'], 1)
+        self.assertEqual(report['totals']['deleted'], 0)
@@ -0,0 +1,333 @@
+import asyncio
+import json
+from datetime import timedelta
+from io import StringIO
+from asgiref.sync import async_to_sync, sync_to_async
+from django.conf import settings
+from django.core import mail
+from django.core.management import call_command
+from django.db.models.signals import post_save
+from django.test import TestCase, RequestFactory
+from django.utils import timezone
+from django.contrib.auth.models import User
+from core.context_processors import employer_notifications, candidate_notifications
+from core.models import (
+    UserProfile, EmployerProfile, JobListing, JobApplication, EmployerNotification, CandidateNotification, ArchivedNotification,
+)
+from core.realtime import NotificationStream, get_broker, employer_channel
+from core.repositories.notification_repository import NotificationRepository, NOTIFICATION_COALESCE_WINDOW
+
+
+class UnreadNotificationCounterTest(TestCase):
+    def setUp(self):
+        self.employer_user = User.objects.create_user('employer', 'employer@example.com', 'employerpass')
+        profile = UserProfile.objects.get(user=self.employer_user)
+        profile.role = 'employer'
+        profile.save()
+        self.company = profile.employer_profile
+        self.candidate = User.objects.create_user('candidate', 'candidate@example.com', 'candidatepass')
+        self.job = JobListing.objects.create(
+            title='Developer', company='Acme', description='Test', employer=self.company, status='approved',
+        )
+        self.application = JobApplication.objects.create(job=self.job, user=self.candidate, cover_letter='Hello')
+
+    def employer_count(self):
+        return EmployerProfile.objects.get(pk=self.company.pk).unread_notification_count
+
+    def candidate_count(self):
+        return UserProfile.objects.get(user=self.candidate).unread_notification_count
+
+    def test_employer_counter_follows_create_and_mark_read(self):
+        first = NotificationRepository.create_new_application_notification(self.company, self.job, 'New application')
+        NotificationRepository.create_job_status_notification(self.company, self.job, 'Approved')
+        self.assertEqual(self.employer_count(), 2)
+
+        NotificationRepository.mark_notification_as_read(first.id)
+        NotificationRepository.mark_notification_as_read(first.id)
+        self.assertEqual(self.employer_count(), 1)
+
+        NotificationRepository.mark_job_notifications_as_read(self.company, self.job.id)
+        self.assertEqual(self.employer_count(), 0)
+
+    def test_candidate_counter_follows_create_and_mark_read(self):
+        NotificationRepository.create_application_status_notification(self.candidate, self.application, 'Interview')
+        NotificationRepository.create_application_status_notifications([{
+            'user_id': self.candidate.id,
+            'application_id': self.application.id,
+            'job_title': 'Developer',
+            'company_name': 'Acme',
+            'message': 'Reserve',
+        }])
+        self.assertEqual(self.candidate_count(), 2)
+
+        NotificationRepository.mark_all_candidate_notifications_as_read(self.candidate)
+        self.assertEqual(self.candidate_count(), 0)
+
+    def test_profile_save_does_not_overwrite_counter(self):
+        stale = EmployerProfile.objects.get(pk=self.company.pk)
+        NotificationRepository.create_new_application_notification(self.company, self.job, 'New application')
+        stale.company_name = 'Acme Ltd'
+        stale.save()
+        self.assertEqual(self.employer_count(), 1)
+        self.assertEqual(EmployerProfile.objects.get(pk=self.company.pk).company_name, 'Acme Ltd')
+
+    def test_profile_save_keeps_plain_save_semantics(self):
+        saves = []
+        receiver = lambda sender, update_fields=None, **kwargs: saves.append(update_fields)
+        post_save.connect(receiver, sender=UserProfile)
+        try:
+            UserProfile.objects.get(user=self.candidate).save()
+        finally:
+            post_save.disconnect(receiver, sender=UserProfile)
+        self.assertEqual(saves, [None])
+
+        # A row deleted while loaded is inserted again, as with any plain save()
+        profile = UserProfile.objects.get(user=self.candidate)
+        UserProfile.objects.filter(pk=profile.pk).delete()
+        profile.save()
+        self.assertTrue(UserProfile.objects.filter(pk=profile.pk).exists())
+
+        # An explicit update_fields still writes the counter
+        profile.unread_notification_count = 5
+        profile.save(update_fields=['unread_notification_count'])
+        self.assertEqual(self.candidate_count(), 5)
+
+    def test_context_processors_read_the_counter_without_queries(self):
+        NotificationRepository.create_new_application_notification(self.company, self.job, 'New application')
+        request = RequestFactory().get('/')
+        request.user = User.objects.select_related('userprofile__employer_profile').get(pk=self.employer_user.pk)
+        with self.assertNumQueries(0):
+            self.assertEqual(employer_notifications(request)['unread_notification_count'], 1)
+
+        request.user = User.objects.select_related('userprofile').get(pk=self.candidate.pk)
+        with self.assertNumQueries(0):
+            self.assertEqual(candidate_notifications(request)['candidate_unread_notification_count'], 0)
+
+    def test_reconcile_command_fixes_drift(self):
+        EmployerNotification.objects.create(
+            employer_profile=self.company, job=self.job, notification_type='new_application', message='Created directly',
+        )
+        self.assertEqual(self.employer_count(), 0)
+
+        out = StringIO()
+        call_command('reconcile_notification_counts', '--dry-run', stdout=out)
+        self.assertIn('stored 0, actual 1', out.getvalue())
+        self.assertEqual(self.employer_count(), 0)
+
+        call_command('reconcile_notification_counts', stdout=StringIO())
+        self.assertEqual(self.employer_count(), 1)
+
+
+class NotificationStreamTest(TestCase):
+    def setUp(self):
+        employer_user = User.objects.create_user('employer', 'employer@example.com', 'employerpass')
+        profile = UserProfile.objects.get(user=employer_user)
+        profile.role = 'employer'
+        profile.save()
+        self.company = profile.employer_profile
+        self.job = JobListing.objects.create(
+            title='Developer', company='Acme', description='Test', employer=self.company, status='approved',
+        )
+        NotificationRepository.create_new_application_notification(self.company, self.job, 'Earlier application')
+
+    def scope(self, logged_in=True):
+        headers = []
+        if logged_in:
+            self.client.login(username='employer', password='employerpass')
+            session_key = self.client.cookies[settings.SESSION_COOKIE_NAME].value
+            headers.append((b'cookie', f'{settings.SESSION_COOKIE_NAME}={session_key}'.encode()))
+        return {'type': 'http', 'path': '/notifications/stream/', 'headers': headers}
+
+    def run_stream(self, scope, during_stream=None):
+        """Run the stream until the first pushed event (if any), then disconnect"""
+        async def scenario():
+            sent, incoming = asyncio.Queue(), asyncio.Queue()
+            stream = asyncio.ensure_future(NotificationStream()(scope, incoming.get, sent.put))
+            messages = [await asyncio.wait_for(sent.get(), 5)]
+            if messages[0]['status'] == 200:
+                messages.append(await asyncio.wait_for(sent.get(), 5))
+                if during_stream:
+                    await sync_to_async(during_stream)()
+                    messages.append(await asyncio.wait_for(sent.get(), 5))
+                await incoming.put({'type': 'http.disconnect'})
+            await asyncio.wait_for(stream, 5)
+            return messages
+        return async_to_sync(scenario)()
+
+    def test_stream_sends_count_then_new_notifications(self):
+        def notify():
+            with self.captureOnCommitCallbacks(execute=True):
+                NotificationRepository.create_job_status_notification(self.company, self.job, 'Job approved')
+
+        start, opening, pushed = self.run_stream(self.scope(), notify)
+        self.assertEqual(start['status'], 200)
+        self.assertIn((b'content-type', b'text/event-stream; charset=utf-8'), start['headers'])
+        self.assertIn(b'event: unread_count\ndata: {"count": 1}', opening['body'])
+
+        event_type, data = pushed['body'].decode().strip().split('\n')
+        self.assertEqual(event_type, 'event: notification')
+        payload = json.loads(data[len('data: '):])
+        self.assertEqual((payload['message'], payload['unread_delta']), ('Job approved', 1))
+        self.assertEqual(get_broker().subscriber_count(employer_channel(self.company.id)), 0)
+
+    def test_mark_read_is_pushed_as_negative_delta(self):
+        def mark_read():
+            with self.captureOnCommitCallbacks(execute=True):
+                NotificationRepository.mark_all_notifications_as_read(self.company)
+
+        _, _, pushed = self.run_stream(self.scope(), mark_read)
+        self.assertIn(b'event: read', pushed['body'])
+        self.assertIn(b'"unread_delta": -1', pushed['body'])
+
+    def test_anonymous_stream_is_rejected(self):
+        (start,) = self.run_stream(self.scope(logged_in=False))
+        self.assertEqual(start['status'], 403)
+
+    def test_wsgi_fallback_stops_reconnects(self):
+        self.assertEqual(self.client.get('/notifications/stream/').status_code, 204)
+
+
+class NotificationCoalescingTest(TestCase):
+    def setUp(self):
+        employer_user = User.objects.create_user('employer', 'employer@example.com', 'employerpass')
+        profile = UserProfile.objects.get(user=employer_user)
+        profile.role = 'employer'
+        profile.save()
+        self.company = profile.employer_profile
+        self.job = JobListing.objects.create(
+            title='Developer', company='Acme', description='Test', employer=self.company, status='approved',
+        )
+
+    def apply(self, name):
+        return NotificationRepository.create_new_application_notification(
+            self.company, self.job, f"New application from {name} for your job 'Developer'.", actor=name,
+        )
+
+    def test_applications_collapse_into_one_unread_notification(self):
+        self.apply('Nino')
+        self.apply('Giorgi')
+        notification = self.apply('Ana')
+
+        self.assertEqual(EmployerNotification.objects.filter(job=self.job).count(), 1)
+        notification.refresh_from_db()
+        self.assertEqual((notification.event_count, notification.latest_actor), (3, 'Ana'))
+        self.assertEqual(notification.message, "3 new applications for your job 'Developer'. Latest from Ana.")
+        self.assertEqual(EmployerProfile.objects.get(pk=self.company.pk).unread_notification_count, 1)
+        self.assertEqual(NotificationRepository.get_unread_notification_count_by_job(self.company, self.job.id), 3)
+
+    def test_read_or_old_notifications_are_not_reused(self):
+        first = self.apply('Nino')
+        NotificationRepository.mark_job_notifications_as_read(self.company, self.job.id)
+        second = self.apply('Giorgi')
+        self.assertNotEqual(first.id, second.id)
+
+        EmployerNotification.objects.filter(pk=second.pk).update(
+            last_event_at=timezone.now() - NOTIFICATION_COALESCE_WINDOW - timedelta(minutes=1)
+        )
+        third = self.apply('Ana')
+        self.assertNotEqual(second.id, third.id)
+        self.assertEqual(EmployerProfile.objects.get(pk=self.company.pk).unread_notification_count, 2)
+
+    def test_status_updates_collapse_per_job(self):
+        other_job = JobListing.objects.create(
+            title='Designer', company='Acme', description='Test', employer=self.company, status='approved',
+        )
+        first = NotificationRepository.create_job_status_notification(self.company, self.job, 'Approved')
+        # Savepoint, lock, insert, update, counter, release: one of each however many entries
+        with self.assertNumQueries(6):
+            notifications = NotificationRepository.create_job_status_notifications([
+                {'employer_profile_id': self.company.id, 'job_id': self.job.id, 'job_title': 'Developer', 'message': 'Expired'},
+                {'employer_profile_id': self.company.id, 'job_id': other_job.id, 'job_title': 'Designer', 'message': 'Expired'},
+            ])
+
+        self.assertEqual(notifications[0].id, first.id)
+        first.refresh_from_db()
+        self.assertEqual((first.event_count, first.message), (2, 'Expired'))
+        self.assertEqual(EmployerNotification.objects.filter(notification_type='job_status_update').count(), 2)
+        self.assertEqual(EmployerProfile.objects.get(pk=self.company.pk).unread_notification_count, 2)
+
+        # A read status update is not reused
+        NotificationRepository.mark_job_notifications_as_read(self.company, self.job.id)
+        self.assertNotEqual(NotificationRepository.create_job_status_notification(self.company, self.job, 'Approved').id, first.id)
+
+    def test_digest_is_sent_once_per_change(self):
+        EmployerProfile.objects.filter(pk=self.company.pk).update(notification_digest=True)
+        self.apply('Nino')
+        self.apply('Giorgi')
+
+        call_command('send_notification_digests', '--dry-run', stdout=StringIO())
+        self.assertEqual(len(mail.outbox), 0)
+
+        call_command('send_notification_digests', stdout=StringIO())
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(mail.outbox[0].to, ['employer@example.com'])
+        self.assertIn("2 new applications for your job 'Developer'. Latest from Giorgi.", mail.outbox[0].body)
+
+        call_command('send_notification_digests', stdout=StringIO())
+        self.assertEqual(len(mail.outbox), 1)
+
+        self.apply('Ana')
+        call_command('send_notification_digests', stdout=StringIO())
+        self.assertEqual(len(mail.outbox), 2)
+
+    def test_digest_skips_employers_who_did_not_opt_in(self):
+        self.apply('Nino')
+        call_command('send_notification_digests', stdout=StringIO())
+        self.assertEqual(len(mail.outbox), 0)
+
+
+class NotificationRetentionTest(TestCase):
+    def setUp(self):
+        employer_user = User.objects.create_user('employer', 'employer@example.com', 'employerpass')
+        profile = UserProfile.objects.get(user=employer_user)
+        profile.role = 'employer'
+        profile.save()
+        self.company = profile.employer_profile
+        self.candidate = User.objects.create_user('candidate', 'candidate@example.com', 'candidatepass')
+        self.job = JobListing.objects.create(
+            title='Developer', company='Acme', description='Test', employer=self.company, status='approved',
+        )
+        self.application = JobApplication.objects.create(job=self.job, user=self.candidate, cover_letter='Hello')
+
+    def employer_notification(self, notification_type, days_old, is_read=True):
+        notification = EmployerNotification.objects.create(
+            employer_profile=self.company, job=self.job, notification_type=notification_type,
+            message=f'{notification_type} {days_old}', is_read=is_read,
+        )
+        when = timezone.now() - timedelta(days=days_old)
+        EmployerNotification.objects.filter(pk=notification.pk).update(created_at=when, last_event_at=when)
+        return notification
+
+    def test_old_read_notifications_are_archived_or_deleted_by_type(self):
+        archived = self.employer_notification('new_application', 120)
+        recent = self.employer_notification('new_application', 10)
+        unread = self.employer_notification('new_application', 120, is_read=False)
+        self.employer_notification('job_status_update', 60)
+        candidate_notification = CandidateNotification.objects.create(
+            user=self.candidate, application=self.application, notification_type='application_status_update',
+            message='Interview', is_read=True,
+        )
+        CandidateNotification.objects.filter(pk=candidate_notification.pk).update(created_at=timezone.now() - timedelta(days=200))
+
+        out = StringIO()
+        call_command('prune_notifications', '--dry-run', stdout=out)
+        self.assertIn('3 notification row(s) would be reclaimed', out.getvalue())
+        self.assertEqual(EmployerNotification.objects.count(), 4)
+
+        out = StringIO()
+        call_command('prune_notifications', '--batch-size', '1', stdout=out)
+        self.assertIn('EmployerNotification / job_status_update: 1 row(s) deleted', out.getvalue())
+        self.assertIn('Reclaimed 3 notification row(s)', out.getvalue())
+
+        self.assertEqual(set(EmployerNotification.objects.values_list('id', flat=True)), {recent.id, unread.id})
+        self.assertFalse(CandidateNotification.objects.exists())
+        self.assertEqual(
+            set(ArchivedNotification.objects.values_list('recipient_kind', 'recipient_id', 'message')),
+            {('employer', self.company.id, archived.message), ('candidate', self.candidate.id, 'Interview')},
+        )
+
+    def test_coalesced_notification_age_follows_latest_event(self):
+        notification = self.employer_notification('new_application', 120)
+        EmployerNotification.objects.filter(pk=notification.pk).update(last_event_at=timezone.now() - timedelta(days=5))
+        call_command('prune_notifications', stdout=StringIO())
+        self.assertTrue(EmployerNotification.objects.filter(pk=notification.pk).exists())
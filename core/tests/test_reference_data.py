@@ -0,0 +1,87 @@
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from core.checks import check_shared_cache
+from core.models import (
+    RejectionReason, PricingPackage, PricingFeature, ComparisonTable, ComparisonRow,
+    PricingPackageTranslation, ComparisonRowTranslation,
+)
+from core.services import reference_data_service
+from core.services.reference_data_service import ReferenceDataService
+from core.templatetags.pricing_tags import get_feature_translation
+
+
+class ReferenceDataServiceTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        ReferenceDataService.bump_generation()
+        self.reason = RejectionReason.objects.create(name='Experience')
+        package = PricingPackage.objects.create(package_type='standard', name='Standard', current_price=0, description='Free')
+        PricingFeature.objects.create(package=package, text='One job')
+        table = ComparisonTable.objects.create(title='Compare')
+        ComparisonRow.objects.create(table=table, feature_name='Jobs')
+
+    def test_second_read_does_no_queries(self):
+        self.assertEqual(list(ReferenceDataService.rejection_reasons()), [self.reason])
+        ReferenceDataService.rejection_reasons_by_id()
+        ReferenceDataService.pricing_packages()
+        ReferenceDataService.comparison_table()
+
+        with self.assertNumQueries(0):
+            self.assertEqual(ReferenceDataService.rejection_reasons_by_id(), {self.reason.id: self.reason})
+            packages = ReferenceDataService.pricing_packages()
+            self.assertEqual([feature.text for feature in packages[0].features.all()], ['One job'])
+            table = ReferenceDataService.comparison_table()
+            self.assertEqual([row.feature_name for row in table.rows.all()], ['Jobs'])
+
+    def test_save_and_delete_invalidate(self):
+        ReferenceDataService.rejection_reasons()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            other = RejectionReason.objects.create(name='Location')
+        self.assertEqual(set(ReferenceDataService.rejection_reasons()), {self.reason, other})
+
+        with self.captureOnCommitCallbacks(execute=True):
+            ComparisonTable.objects.all().delete()
+        self.assertIsNone(ReferenceDataService.comparison_table())
+
+    def test_bump_in_another_process_is_picked_up(self):
+        ReferenceDataService.rejection_reasons()
+        # Another process changes the shared generation; the local copy expires with the check interval
+        cache.set(ReferenceDataService._cache_key(None), 'other-process')
+        # update() sends no signal, so only the shared generation can make this visible
+        RejectionReason.objects.filter(pk=self.reason.pk).update(name='Skills')
+        self.assertEqual(ReferenceDataService.rejection_reasons()[0].name, 'Experience')
+
+        ReferenceDataService._generation_checked_at -= reference_data_service.REFERENCE_DATA_GENERATION_CHECK_INTERVAL
+        self.assertEqual(ReferenceDataService.rejection_reasons()[0].name, 'Skills')
+
+    def test_pricing_translations_come_from_the_catalog(self):
+        package = PricingPackage.objects.get()
+        row = ComparisonRow.objects.get()
+        with self.captureOnCommitCallbacks(execute=True):
+            PricingPackageTranslation.objects.create(package=package, language_code='en', name='Basic')
+            ComparisonRowTranslation.objects.create(row=row, language_code='en', feature_name='Job posts')
+
+        self.assertEqual(package.get_translated_name('en'), 'Basic')
+        with self.assertNumQueries(0):
+            self.assertEqual(package.get_translated_name('en'), 'Basic')
+            self.assertEqual(package.get_translated_description('en'), 'Free')
+            self.assertEqual(row.get_translated_feature_name('en'), 'Job posts')
+            self.assertEqual(get_feature_translation('Jobs', 'en'), 'Job posts')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            PricingPackageTranslation.objects.filter(package=package).get().delete()
+        self.assertEqual(package.get_translated_name('en'), 'Standard')
+
+    def test_pricing_page_queries_nothing_once_cached(self):
+        self.client.get('/en/pricing/')
+        with self.assertNumQueries(0):
+            response = self.client.get('/en/pricing/')
+        self.assertEqual(response.status_code, 200)
+
+
+class SharedCacheCheckTest(TestCase):
+    def test_process_local_cache_is_reported(self):
+        self.assertEqual(check_shared_cache(None), [])
+        with override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}):
+            self.assertEqual([warning.id for warning in check_shared_cache(None)], ['core.W001'])
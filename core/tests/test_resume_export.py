@@ -0,0 +1,105 @@
+import csv
+import io
+import shutil
+import tempfile
+import zipfile
+from botocore.response import StreamingBody
+from botocore.stub import Stubber
+from django.contrib.auth.models import User
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from core.models import UserProfile, JobListing, JobApplication
+from core.services.resume_export_service import ResumeExportService, MANIFEST_NAME, EXPORT_CHUNK_SIZE
+from jobsy.storage_backends import PrivateMediaStorage
+
+
+def read_manifest(archive):
+    return list(csv.DictReader(io.StringIO(archive.read(MANIFEST_NAME).decode('utf-8-sig'))))
+
+
+class ResumeExportTest(TestCase):
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        self.settings_override = override_settings(MEDIA_ROOT=self.media_root)
+        self.settings_override.enable()
+
+        employer_user = User.objects.create_user('employer', 'employer@example.com', 'employerpass')
+        profile = UserProfile.objects.get(user=employer_user)
+        profile.role = 'employer'
+        profile.save()
+        self.job = JobListing.objects.create(
+            title='Developer',
+            company='Acme',
+            description='Test job description',
+            employer=profile.employer_profile,
+            status='approved',
+        )
+        candidate = User.objects.create_user('candidate', 'nino@example.com', 'pass', first_name='Nino', last_name='Beridze')
+        self.registered = JobApplication.objects.create(
+            job=self.job,
+            user=candidate,
+            cover_letter='Hello',
+            resume=SimpleUploadedFile('nino.pdf', b'%PDF nino' * 20000),
+        )
+        self.guest = JobApplication.objects.create(
+            job=self.job,
+            guest_name='Guest Applicant',
+            guest_email='guest@example.com',
+            cover_letter='Hello',
+            status='გასაუბრება',
+            resume=SimpleUploadedFile('guest.docx', b'guest resume'),
+        )
+        self.client.login(username='employer', password='employerpass')
+
+    def tearDown(self):
+        self.settings_override.disable()
+        shutil.rmtree(self.media_root, ignore_errors=True)
+
+    def export(self, **params):
+        response = self.client.get(reverse('export_job_applications', args=[self.job.id]), params)
+        self.assertEqual(response['Content-Type'], 'application/zip')
+        return zipfile.ZipFile(io.BytesIO(b''.join(response.streaming_content)))
+
+    def test_export_contains_resumes_and_manifest(self):
+        archive = self.export()
+        self.assertEqual(archive.read(f'resumes/{self.registered.id}_Nino_Beridze.pdf'), b'%PDF nino' * 20000)
+        self.assertEqual(archive.read(f'resumes/{self.guest.id}_Guest_Applicant.docx'), b'guest resume')
+
+        rows = {int(row['application_id']): row for row in read_manifest(archive)}
+        self.assertEqual(rows[self.registered.id]['email'], 'nino@example.com')
+        self.assertEqual(rows[self.guest.id]['applicant_type'], 'guest')
+
+    def test_export_follows_status_tab(self):
+        archive = self.export(status='გასაუბრება')
+        self.assertEqual([row['application_id'] for row in read_manifest(archive)], [str(self.guest.id)])
+
+    def test_resumes_are_streamed_in_chunks(self):
+        pieces = list(ResumeExportService.stream_zip(JobApplication.objects.filter(pk=self.registered.pk)))
+        self.assertGreater(len(pieces), 2)
+        self.assertTrue(all(len(piece) <= EXPORT_CHUNK_SIZE + 1024 for piece in pieces[:-1]))
+
+    def test_missing_file_is_left_out(self):
+        self.guest.resume.storage.delete(self.guest.resume.name)
+        archive = self.export()
+        rows = {int(row['application_id']): row for row in read_manifest(archive)}
+        self.assertEqual(rows[self.guest.id]['resume_file'], '')
+        self.assertTrue(rows[self.registered.id]['resume_file'])
+
+    def test_export_from_s3(self):
+        storage = PrivateMediaStorage(bucket_name='resumes-bucket', access_key='test', secret_key='test', region_name='us-east-1')
+        client = storage.connection.meta.client
+        with Stubber(client) as stubber:
+            for application, content in ((self.registered, b'%PDF from s3'), (self.guest, b'docx from s3')):
+                stubber.add_response(
+                    'get_object',
+                    {'Body': StreamingBody(io.BytesIO(content), len(content)), 'ContentLength': len(content)},
+                    {'Bucket': 'resumes-bucket', 'Key': f'media/private/{application.resume.name}'},
+                )
+            applications = JobApplication.objects.filter(job=self.job).order_by('id')
+            data = b''.join(ResumeExportService.stream_zip(applications, storage=storage, concurrency=1))
+            stubber.assert_no_pending_responses()
+
+        archive = zipfile.ZipFile(io.BytesIO(data))
+        self.assertEqual(archive.read(f'resumes/{self.registered.id}_Nino_Beridze.pdf'), b'%PDF from s3')
+        self.assertEqual(archive.read(f'resumes/{self.guest.id}_Guest_Applicant.docx'), b'docx from s3')
@@ -0,0 +1,93 @@
+from django.test import TestCase
+from django.contrib.auth.models import User
+from core.models import UserProfile, JobListing
+from core.repositories.job_repository import JobRepository
+from core.search import normalize_search_text, tokenize_query, build_search_document, search_jobs, count_job_facets
+
+
+class SearchNormalizationTest(TestCase):
+    def test_normalize_strips_html_and_case(self):
+        """HTML, entities, case and punctuation are normalized away"""
+        text = '<p>Senior <b>Python</b>&nbsp;Developer, Café!</p>'
+        self.assertEqual(normalize_search_text(text), 'senior python developer cafe')
+
+    def test_georgian_mtavruli_folds_to_mkhedruli(self):
+        """Georgian capital letters match their lowercase forms"""
+        self.assertEqual(normalize_search_text('ᲗᲑᲘᲚᲘᲡᲘ'), 'თბილისი')
+
+    def test_georgian_tokens_are_romanized_in_document(self):
+        """The search document carries a Latin form of Georgian words"""
+        document = build_search_document('თბილისი', 'Python')
+        self.assertIn('თბილისი', document.split())
+        self.assertIn('tbilisi', document.split())
+        self.assertIn('python', document.split())
+
+    def test_tokenize_query_deduplicates(self):
+        self.assertEqual(tokenize_query('Job job, JOB 1'), ['job', '1'])
+
+
+class JobSearchTest(TestCase):
+    def setUp(self):
+        user = User.objects.create_user('employer', 'employer@example.com', 'employerpass')
+        profile = UserProfile.objects.get(user=user)
+        profile.role = 'employer'
+        profile.save()
+        self.company = profile.employer_profile
+
+        self.developer_job = JobListing.objects.create(
+            title='Python Developer',
+            company='Acme',
+            description='<p>Django and PostgreSQL</p>',
+            employer=self.company,
+            status='approved',
+            category='IT/პროგრამირება',
+            location='თბილისი',
+        )
+        self.designer_job = JobListing.objects.create(
+            title='Designer',
+            company='Acme',
+            description='<p>Figma, some Python scripting is a plus</p>',
+            employer=self.company,
+            status='approved',
+            category='დიზაინი',
+            location='აჭარა',
+        )
+
+    def test_search_document_is_maintained_on_save(self):
+        self.developer_job.title = 'Go Developer'
+        self.developer_job.save(update_fields=['title'])
+        self.developer_job.refresh_from_db()
+        self.assertIn('go', self.developer_job.search_document.split())
+
+    def test_search_matches_description_and_ranks_title_first(self):
+        results = list(search_jobs(JobListing.objects.all(), 'python').order_by('-search_rank'))
+        self.assertEqual(results, [self.developer_job, self.designer_job])
+
+    def test_latin_query_matches_georgian_location(self):
+        results = search_jobs(JobListing.objects.all(), 'Tbilisi')
+        self.assertEqual(list(results), [self.developer_job])
+
+    def test_repository_filters_use_search(self):
+        results = JobRepository.get_active_jobs({'search': 'figma'})
+        self.assertEqual(list(results), [self.designer_job])
+
+    def test_repository_search_keeps_premium_jobs_first(self):
+        self.designer_job.premium_level = 'premium'
+        self.designer_job.save()
+        results = JobRepository.get_active_jobs({'search': 'python'})
+        self.assertEqual(list(results), [self.designer_job, self.developer_job])
+
+    def test_facets_are_counted_in_one_query(self):
+        self.designer_job.premium_level = 'premium'
+        self.designer_job.considers_students = True
+        self.designer_job.save()
+
+        with self.assertNumQueries(1):
+            facets = count_job_facets(search_jobs(JobListing.objects.all(), 'python'))
+
+        self.assertEqual(facets['total'], 2)
+        self.assertEqual(facets['premium_level'], {'standard': 1, 'premium': 1})
+        self.assertEqual(facets['category']['IT/პროგრამირება'], 1)
+        self.assertEqual(facets['location']['აჭარა'], 1)
+        self.assertEqual(facets['considers_students'], 1)
+        self.assertEqual(facets['georgian_language_only'], 0)
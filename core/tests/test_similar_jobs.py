@@ -0,0 +1,70 @@
+from django.test import TestCase
+from django.urls import reverse
+from django.contrib.auth.models import User
+from core.models import UserProfile, JobListing, SimilarJob, SimilarJobRefresh
+from core.services.similar_jobs_service import SimilarJobsService
+
+
+class SimilarJobsServiceTest(TestCase):
+    def setUp(self):
+        user = User.objects.create_user('employer', 'employer@example.com', 'employerpass')
+        profile = UserProfile.objects.get(user=user)
+        profile.role = 'employer'
+        profile.save()
+        self.company = profile.employer_profile
+
+        self.backend = self.create_job('Python Backend Developer', 'Django, PostgreSQL and REST APIs', 'IT/პროგრამირება')
+        self.django = self.create_job('Django Developer', 'Python web development with Django', 'IT/პროგრამირება')
+        self.designer = self.create_job('Graphic Designer', 'Figma and branding', 'დიზაინი')
+        self.accountant = self.create_job('Accountant', 'Financial reports and taxes', 'ფინანსები')
+        SimilarJobsService.rebuild()
+
+    def create_job(self, title, description, category, status='approved'):
+        return JobListing.objects.create(
+            title=title,
+            company='Acme',
+            description=f'<p>{description}</p>',
+            employer=self.company,
+            status=status,
+            category=category,
+            location='თბილისი',
+        )
+
+    def test_most_similar_job_ranks_first(self):
+        similar = SimilarJobsService.get_similar_jobs(self.backend)
+        self.assertEqual(similar[0], self.django)
+        self.assertNotIn(self.backend, similar)
+
+    def test_new_job_is_added_incrementally(self):
+        flask = self.create_job('Python Flask Developer', 'Python REST APIs', 'IT/პროგრამირება')
+        self.assertEqual(SimilarJobsService.refresh_pending(), 1)
+        self.assertIn(self.backend, SimilarJobsService.get_similar_jobs(flask))
+        self.assertIn(flask, SimilarJobsService.get_similar_jobs(self.backend))
+
+    def test_expired_job_is_removed(self):
+        self.django.status = 'expired'
+        self.django.save(update_fields=['status'])
+        SimilarJobsService.refresh_pending()
+        self.assertFalse(SimilarJob.objects.filter(similar_job=self.django).exists())
+        self.assertFalse(SimilarJob.objects.filter(job=self.django).exists())
+
+    def test_only_changed_similarity_fields_queue_a_refresh(self):
+        self.assertFalse(SimilarJobRefresh.objects.exists())
+        job = JobListing.objects.get(pk=self.backend.pk)
+        job.view_count = 10
+        with self.assertNumQueries(1):
+            job.save()
+        self.assertFalse(SimilarJobRefresh.objects.exists())
+
+        job.title = 'Senior Python Backend Developer'
+        job.save()
+        job.description = '<p>Django and Celery</p>'
+        job.save()
+        self.assertEqual(list(SimilarJobRefresh.objects.values_list('job_id', flat=True)), [job.pk])
+
+        self.assertEqual(SimilarJobsService.refresh_pending(), 1)
+        self.assertFalse(SimilarJobRefresh.objects.exists())
+
+    def test_job_detail_shows_precomputed_similar_jobs(self):
+        response = self.client.get(reverse('job_detail', args=[self.backend.id]))
+        self.assertEqual(response.context['similar_jobs'][0], self.django)
@@ -0,0 +1,75 @@
+from io import StringIO
+from django.conf import settings
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase
+from django.contrib.auth.models import User
+from core.models import UserProfile, EmployerProfile, JobListing
+from core.services.stats_service import PlatformStatsService
+
+
+class PlatformStatsServiceTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        user = User.objects.create_user('employer', 'employer@example.com', 'employerpass')
+        profile = UserProfile.objects.get(user=user)
+        profile.role = 'employer'
+        profile.save()
+        self.company = profile.employer_profile
+        User.objects.create_user('candidate', 'candidate@example.com', 'candidatepass')
+
+    def create_job(self, status='approved'):
+        with self.captureOnCommitCallbacks(execute=True):
+            return JobListing.objects.create(
+                title='Test Job',
+                company='Test Company',
+                description='Test job description',
+                employer=self.company,
+                status=status,
+            )
+
+    def test_stats_are_cached(self):
+        self.create_job()
+        self.assertEqual(PlatformStatsService.get_stats(), {
+            'total_jobs_count': 1,
+            'total_companies_count': 1,
+            'total_candidates_count': 1,
+        })
+        # One read of the shared cache table, nothing is counted
+        with self.assertNumQueries(1) as queries:
+            PlatformStatsService.get_stats()
+        self.assertIn(settings.CACHES['default']['LOCATION'], queries.captured_queries[0]['sql'])
+
+    def test_counters_follow_saves_and_deletes(self):
+        PlatformStatsService.get_stats()
+
+        job = self.create_job(status='pending_review')
+        self.assertEqual(PlatformStatsService.get_cached_stats()['total_jobs_count'], 0)
+
+        job = JobListing.objects.get(pk=job.pk)
+        job.status = 'approved'
+        with self.captureOnCommitCallbacks(execute=True):
+            job.save()
+        self.assertEqual(PlatformStatsService.get_cached_stats()['total_jobs_count'], 1)
+
+        # Soft delete goes through save()
+        with self.captureOnCommitCallbacks(execute=True):
+            job.delete()
+        self.assertEqual(PlatformStatsService.get_cached_stats()['total_jobs_count'], 0)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.company.delete()
+        self.assertEqual(PlatformStatsService.get_cached_stats()['total_companies_count'], 0)
+
+        self.assertEqual(PlatformStatsService.get_stats(), PlatformStatsService.compute_stats())
+
+    def test_reconcile_fixes_drift(self):
+        self.create_job()
+        PlatformStatsService.get_stats()
+
+        # Bulk updates bypass the signals
+        JobListing.objects.update(status='rejected')
+        self.assertEqual(PlatformStatsService.get_stats()['total_jobs_count'], 1)
+
+        call_command('reconcile_platform_stats', stdout=StringIO())
+        self.assertEqual(PlatformStatsService.get_stats()['total_jobs_count'], 0)
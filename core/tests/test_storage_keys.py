@@ -0,0 +1,145 @@
+import hashlib
+import shutil
+import tempfile
+import boto3
+from botocore.stub import Stubber
+from django.contrib.auth.models import User
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from core.media import s3
+from core.media.presign import PresignedUrlCache, presigned_urls
+from core.media.s3 import candidate_keys
+from core.models import UserProfile, JobListing, JobApplication
+from core.services.storage_key_service import StorageKeyService
+from jobsy.storage_backends import PrivateMediaStorage
+
+
+class StorageKeyTest(TestCase):
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        self.settings_override = override_settings(MEDIA_ROOT=self.media_root)
+        self.settings_override.enable()
+
+        self.candidate = User.objects.create_user('candidate', 'nino@example.com', 'pass')
+        self.profile = UserProfile.objects.get(user=self.candidate)
+        employer_user = User.objects.create_user('employer', 'employer@example.com', 'employerpass')
+        employer = UserProfile.objects.get(user=employer_user)
+        employer.role = 'employer'
+        employer.save()
+        self.job = JobListing.objects.create(
+            title='Developer', company='Acme', description='Test job description',
+            employer=employer.employer_profile, status='approved',
+        )
+
+        self.s3_client = boto3.client('s3', region_name='us-east-1', aws_access_key_id='test', aws_secret_access_key='test')
+        self.stubber = Stubber(self.s3_client)
+        self.stubber.activate()
+        presigned_urls.clear()
+
+    def tearDown(self):
+        self.stubber.deactivate()
+        self.settings_override.disable()
+        shutil.rmtree(self.media_root, ignore_errors=True)
+
+    def test_upload_records_key_and_clearing_resets_it(self):
+        self.profile.cv = SimpleUploadedFile('nino.pdf', b'%PDF nino')
+        self.profile.save()
+        self.profile.refresh_from_db()
+        self.assertEqual(self.profile.cv_storage_key, self.profile.cv.name)
+        self.assertEqual(self.profile.cv_storage_key, f"cvs/{hashlib.sha256(b'%PDF nino').hexdigest()}.pdf")
+        self.assertEqual(self.profile.cv_display_name, 'nino.pdf')
+
+        self.profile.cv = None
+        self.profile.save(update_fields=['cv'])
+        self.profile.refresh_from_db()
+        self.assertEqual((self.profile.cv_storage_key, self.profile.cv_file_name), ('', ''))
+
+    def test_candidate_keys(self):
+        self.assertEqual(candidate_keys('media/media/private/cvs/a.pdf'), ['media/private/cvs/a.pdf', 'cvs/a.pdf'])
+        self.assertEqual(
+            candidate_keys('old/b.pdf', 'resumes'),
+            ['media/private/old/b.pdf', 'old/b.pdf', 'media/private/resumes/b.pdf'],
+        )
+
+    @override_settings(USE_S3=True, AWS_STORAGE_BUCKET_NAME='jobsight-test')
+    def test_backfill_verifies_keys_and_fixes_paths(self):
+        UserProfile.objects.filter(pk=self.profile.pk).update(cv='media/private/cvs/a.pdf')
+        application = JobApplication.objects.create(job=self.job, user=self.candidate, cover_letter='Hi', resume='resumes/b.pdf')
+        JobApplication.objects.filter(pk=application.pk).update(resume_storage_key='')
+
+        self.stubber.add_response('head_object', {}, {'Bucket': 'jobsight-test', 'Key': 'media/private/cvs/a.pdf'})
+        self.stubber.add_client_error('head_object', '404', expected_params={'Bucket': 'jobsight-test', 'Key': 'media/private/resumes/b.pdf'})
+        self.stubber.add_response('head_object', {}, {'Bucket': 'jobsight-test', 'Key': 'resumes/b.pdf'})
+
+        stats = StorageKeyService.backfill(client=self.s3_client, concurrency=1)
+        self.stubber.assert_no_pending_responses()
+
+        self.assertEqual(stats, {'resolved': 2, 'renamed': 1, 'missing': 0, 'errors': 0})
+        self.profile.refresh_from_db()
+        self.assertEqual((self.profile.cv.name, self.profile.cv_storage_key), ('cvs/a.pdf', 'media/private/cvs/a.pdf'))
+        application.refresh_from_db()
+        self.assertEqual((application.resume.name, application.resume_storage_key), ('resumes/b.pdf', 'resumes/b.pdf'))
+
+        # Verified rows are not probed again
+        self.assertEqual(StorageKeyService.backfill(client=self.s3_client, concurrency=1)['resolved'], 0)
+
+    @override_settings(USE_S3=True, AWS_STORAGE_BUCKET_NAME='jobsight-test')
+    def test_serving_signs_the_stored_key_without_probing(self):
+        UserProfile.objects.filter(pk=self.profile.pk).update(cv='cvs/a.pdf', cv_storage_key='cvs/a.pdf')
+        previous, s3._client = s3._client, self.s3_client
+        try:
+            self.client.login(username='candidate', password='pass')
+            response = self.client.get(reverse('view_cv'), {'download': 'true'})
+            again = self.client.get(reverse('view_cv'), {'download': 'true'})
+            inline = self.client.get(reverse('view_cv'))
+        finally:
+            s3._client = previous
+
+        # The stubber has no responses queued, so any request to S3 would have failed
+        self.assertEqual(response.status_code, 302)
+        self.assertIn('jobsight-test', response['Location'])
+        self.assertIn('/cvs/a.pdf?', response['Location'])
+        self.assertIn('response-content-disposition=attachment', response['Location'])
+        # Reused from the presigned URL cache, but not for a different disposition
+        self.assertEqual(again['Location'], response['Location'])
+        self.assertNotIn('response-content-disposition', inline['Location'])
+
+
+class PresignedUrlCacheTest(TestCase):
+    def setUp(self):
+        self.signed = []
+
+    def sign(self):
+        self.signed.append(len(self.signed))
+        return f'https://example.com/{len(self.signed)}'
+
+    def test_reuses_urls_until_the_safety_margin(self):
+        urls = PresignedUrlCache(safety_margin=600)
+        first = urls.get('bucket', 'cvs/a.pdf', None, 'owner', 3600, self.sign)
+        self.assertEqual(urls.get('bucket', 'cvs/a.pdf', None, 'owner', 3600, self.sign), first)
+        self.assertNotEqual(urls.get('bucket', 'cvs/a.pdf', None, 'employer', 3600, self.sign), first)
+
+        # Less than the margin left: signed again
+        key = ('bucket', 'cvs/a.pdf', None, 'owner')
+        url, expires_at = urls._entries[key]
+        urls._entries[key] = (url, expires_at - 3100)
+        self.assertNotEqual(urls.get('bucket', 'cvs/a.pdf', None, 'owner', 3600, self.sign), first)
+        self.assertEqual(len(self.signed), 3)
+
+    def test_least_recently_used_urls_are_dropped(self):
+        urls = PresignedUrlCache(max_size=2, safety_margin=0)
+        for name in ('a', 'b', 'a', 'c'):
+            urls.get('bucket', name, None, 'owner', 3600, self.sign)
+        self.assertEqual([key[1] for key in urls._entries], ['a', 'c'])
+
+    def test_private_storage_urls_are_cached(self):
+        presigned_urls.clear()
+        storage = PrivateMediaStorage(bucket_name='resumes-bucket', access_key='test', secret_key='test', region_name='us-east-1')
+        url = storage.url('resumes/b.pdf')
+        self.assertIn('media/private/resumes/b.pdf', url)
+        self.assertEqual(storage.url('resumes/b.pdf'), url)
+        self.assertEqual(len(presigned_urls._entries), 1)
+        # URLs with extra parameters are signed every time
+        self.assertIn('response-content-type', storage.url('resumes/b.pdf', parameters={'ResponseContentType': 'application/pdf'}))
+        self.assertEqual(len(presigned_urls._entries), 1)
@@ -0,0 +1,117 @@
+import threading
+from unittest.mock import patch
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.contrib.auth.models import User
+from core.models import UserProfile, JobListing
+from core.services.view_counter_service import ViewCounterBuffer, ViewCounterService
+
+
+class ViewCounterServiceTest(TestCase):
+    def setUp(self):
+        ViewCounterService.flush()
+        user = User.objects.create_user('employer', 'employer@example.com', 'employerpass')
+        profile = UserProfile.objects.get(user=user)
+        profile.role = 'employer'
+        profile.save()
+        self.job = JobListing.objects.create(
+            title='Test Job',
+            company='Test Company',
+            description='Test job description',
+            employer=profile.employer_profile,
+            status='approved',
+        )
+
+    def test_job_detail_buffers_views(self):
+        for _ in range(3):
+            self.client.get(reverse('job_detail', args=[self.job.id]))
+
+        self.job.refresh_from_db()
+        self.assertEqual(self.job.view_count, 0)
+        self.assertEqual(ViewCounterService.pending_views(self.job), 3)
+
+        with CaptureQueriesContext(connection) as queries:
+            ViewCounterService.flush()
+        updates = [query for query in queries if query['sql'].startswith('UPDATE')]
+        self.assertEqual(len(updates), 1)
+        self.job.refresh_from_db()
+        self.assertEqual(self.job.view_count, 3)
+        self.assertEqual(ViewCounterService.pending_views(self.job), 0)
+
+    def test_no_increments_lost_across_flushes(self):
+        job = JobListing.objects.get(pk=self.job.pk)
+        for _ in range(5):
+            ViewCounterService.record_view(job)
+
+        # A failing write keeps the views pending
+        with patch.object(ViewCounterBuffer, '_write', side_effect=Exception('database unavailable')):
+            self.assertEqual(ViewCounterService.flush(), 0)
+        self.assertEqual(ViewCounterService.pending_views(job), 5)
+
+        ViewCounterService.flush()
+        for _ in range(2):
+            ViewCounterService.record_view(job)
+        ViewCounterService.flush()
+        ViewCounterService.flush()
+
+        job.refresh_from_db()
+        self.assertEqual(job.view_count, 7)
+
+
+class ViewCounterBufferTest(TestCase):
+    def test_concurrent_increments_and_flushes(self):
+        """Views recorded while other threads flush all end up in exactly one batch"""
+        written = []
+        buffer = ViewCounterBuffer()
+        buffer._write = lambda pending: written.append(dict(pending))
+
+        def record():
+            for _ in range(1000):
+                buffer.increment('core.JobListing', 1)
+
+        def flush():
+            for _ in range(50):
+                buffer.flush()
+
+        threads = [threading.Thread(target=record) for _ in range(4)] + [threading.Thread(target=flush)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        buffer.flush()
+
+        self.assertEqual(sum(batch.get(('core.JobListing', 1), 0) for batch in written), 4000)
+
+    def test_flush_thread_writes_without_requests(self):
+        """An idle process writes its views out without waiting for a request"""
+        written = threading.Event()
+        buffer = ViewCounterBuffer(flush_interval=0.01, flush_thread=True)
+        buffer._write = lambda pending: written.set()
+
+        buffer.increment('core.JobListing', 1)
+        try:
+            self.assertTrue(written.wait(5))
+        finally:
+            buffer.stop()
+        self.assertEqual(buffer.pending('core.JobListing', 1), 0)
+
+    def test_exit_flush_skips_a_missing_database(self):
+        written = []
+        buffer = ViewCounterBuffer()
+        buffer._write = lambda pending: written.append(dict(pending))
+        self.assertEqual(buffer.flush_at_exit(), 0)
+
+        buffer.increment('core.JobListing', 1)
+        with patch.object(connection.introspection, 'table_names', return_value=[]):
+            self.assertEqual(buffer.flush_at_exit(), 0)
+        self.assertEqual(written, [])
+
+        # Views counted against another database (e.g. a destroyed test database) are not written
+        with patch.dict(connection.settings_dict, NAME='other'):
+            self.assertEqual(buffer.flush_at_exit(), 0)
+        self.assertEqual(written, [])
+
+        self.assertEqual(buffer.flush_at_exit(), 1)
+        self.assertEqual(written, [{('core.JobListing', 1): 1}])
@@ -0,0 +1,43 @@
+from django.contrib.auth.models import User, AnonymousUser
+from django.test import TestCase, RequestFactory
+from core.context_processors import employer_premium_status, employer_notifications, candidate_notifications
+from core.models import UserProfile, EmployerProfile
+from core.viewer import Viewer
+from core.views.auth_views import is_employer
+
+
+class ViewerTest(TestCase):
+    def setUp(self):
+        employer_user = User.objects.create_user('employer', 'employer@example.com', 'employerpass')
+        profile = UserProfile.objects.get(user=employer_user)
+        profile.role = 'employer'
+        profile.save()
+        EmployerProfile.all_objects.filter(user_profile=profile).update(has_cv_database_access=True, unread_notification_count=3)
+
+        self.request = RequestFactory().get('/')
+        self.request.user = User.objects.get(pk=employer_user.pk)
+
+    def context(self):
+        context = {}
+        for processor in (employer_premium_status, employer_notifications, candidate_notifications):
+            context.update(processor(self.request))
+        return context
+
+    def test_processors_and_checks_share_one_profile_query(self):
+        with self.assertNumQueries(0):
+            context = self.context()
+
+        with self.assertNumQueries(1):
+            self.assertTrue(context['has_premium_plus_access'])
+            self.assertEqual(context['unread_notification_count'], 3)
+            self.assertEqual(context['candidate_unread_notification_count'], 0)
+            self.assertTrue(is_employer(self.request.user))
+            self.assertEqual(self.request.user.userprofile.employer_profile.company_name, '')
+
+    def test_anonymous_viewer_never_queries(self):
+        self.request.user = AnonymousUser()
+        with self.assertNumQueries(0):
+            context = self.context()
+            self.assertFalse(context['has_premium_plus_access'])
+            self.assertEqual(context['unread_notification_count'], 0)
+            self.assertFalse(Viewer.for_request(self.request).is_employer)
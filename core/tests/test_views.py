@@ -3,7 +3,9 @@ from django.urls import reverse
 from django.contrib.auth.models import User
 from django.core.files.uploadedfile import SimpleUploadedFile
 from core.models import UserProfile, EmployerProfile, JobListing, JobApplication
+from django.utils import timezone
 from unittest.mock import patch
+import re
 
 
 class JobListViewTest(TestCase):
@@ -86,6 +88,73 @@ class JobListViewTest(TestCase):
             self.assertEqual(job.category, 'ტექნოლოგია')
 
 
+
+class JobListPaginationTest(TestCase):
+    def setUp(self):
+        self.employer_user = User.objects.create_user('employer', 'employer@example.com', 'employerpass')
+        profile = UserProfile.objects.get(user=self.employer_user)
+        profile.role = 'employer'
+        profile.save()
+        self.company = profile.employer_profile
+
+        for i in range(5):
+            JobListing.objects.create(
+                title=f'Premium Job {i+1}',
+                company='Test Company',
+                description='Test job description',
+                employer=self.company,
+                status='approved',
+                premium_level='premium_plus' if i < 2 else 'premium',
+            )
+        # Same timestamp everywhere so the pages have to be split on the id tie-breaker
+        JobListing.objects.update(posted_at=timezone.now())
+
+        self.client = Client()
+
+    @patch('core.views.job_views.JOB_LIST_PAGE_SIZE', 2)
+    def test_pages_cover_every_job_once(self):
+        """Following next_url walks the whole board without gaps or duplicates"""
+        response = self.client.get(reverse('job_list'))
+        seen = [job.id for job in response.context['jobs']]
+        self.assertEqual(len(seen), 2)
+        self.assertTrue(response.context['has_more_jobs'])
+
+        next_url = response.context['next_page_url']
+        pages = 0
+        while next_url:
+            data = self.client.get(next_url).json()
+            self.assertTrue(data['success'])
+            for level, html in data['sections'].items():
+                seen.extend(int(job_id) for job_id in re.findall(r'/jobs/(\d+)/', html['desktop']))
+            next_url = data['next_url']
+            pages += 1
+
+        self.assertEqual(pages, 2)
+        expected = list(JobListing.objects.order_by('-premium_rank', '-posted_at', '-id').values_list('id', flat=True))
+        self.assertEqual(seen, expected)
+
+    def test_premium_jobs_lead_the_first_page(self):
+        """Standard jobs sort after premium ones, even when there are more than a page of them"""
+        for i in range(30):
+            JobListing.objects.create(
+                title=f'Standard Job {i+1}',
+                company='Test Company',
+                description='Test job description',
+                employer=self.company,
+                status='approved',
+                premium_level='standard',
+            )
+
+        response = self.client.get(reverse('job_list'), {'show_filters': '1'})
+        levels = [job.premium_level for job in response.context['jobs']]
+        self.assertEqual(len(levels), 24)
+        self.assertEqual(levels[:5], ['premium_plus'] * 2 + ['premium'] * 3)
+        self.assertEqual(set(levels[5:]), {'standard'})
+
+    def test_invalid_cursor_is_rejected(self):
+        response = self.client.get(reverse('job_list_page'), {'cursor': 'not-a-cursor'})
+        self.assertEqual(response.status_code, 400)
+
 class JobDetailViewTest(TestCase):
     def setUp(self):
         # Create a test employer
@@ -12,6 +12,7 @@ from django.contrib.auth import views as django_auth_views
 
 urlpatterns = [
     path('', job_views.job_list, name='job_list'),
+    path('jobs/more/', job_views.job_list_page, name='job_list_page'),
     path('jobs/', RedirectView.as_view(url='/', permanent=True), name='jobs_redirect'),
     path('home/', main.home_redirect, name='home_redirect'),
     path('jobs/<int:job_id>/', job_views.job_detail, name='job_detail'),
@@ -47,7 +48,9 @@ urlpatterns = [
     path('employer/delete-job/<int:job_id>/', employer_views.delete_job, name='delete_job'),
     path('employer/restore-job/<int:job_id>/', employer_views.restore_job, name='restore_job'),
     path('employer/job-applications/<int:job_id>/', employer_views.job_applications, name='job_applications'),
+    path('employer/job-applications/<int:job_id>/export/', employer_views.export_job_applications, name='export_job_applications'),
     path('employer/update-application-status/<int:application_id>/', employer_views.update_application_status, name='update_application_status'),
+    path('employer/update-application-status/bulk/', employer_views.bulk_update_application_status, name='bulk_update_application_status'),
     path('employer/get-job-details/<int:job_id>/', employer_views.get_job_details, name='get_job_details'),
     
     # Notification routes
@@ -0,0 +1,98 @@
+from django.contrib.auth import get_user_model
+from django.utils.functional import cached_property
+from core.models import UserProfile
+
+
+class Viewer:
+    """
+    Lazy, request-scoped view of the logged-in user's profile
+
+    The profile and employer profile are loaded together with one
+    select_related query the first time anything asks for them, and attached
+    to the user object, so request.user.userprofile.employer_profile is free
+    for the rest of the request. One Viewer is kept per user object, which
+    makes it shared by the context processors and the is_employer checks of
+    the same request.
+    """
+
+    def __init__(self, user):
+        self.user = user
+
+    @classmethod
+    def for_user(cls, user):
+        """
+        Get the viewer of a user object, creating it on first use
+
+        Args:
+            user (User): The (possibly anonymous) user of the request
+
+        Returns:
+            Viewer: The viewer cached on the user object
+        """
+        viewer = getattr(user, '_viewer', None)
+        if viewer is None:
+            viewer = cls(user)
+            user._viewer = viewer
+        return viewer
+
+    @classmethod
+    def for_request(cls, request):
+        return cls.for_user(request.user)
+
+    @cached_property
+    def profile(self):
+        """UserProfile of the user with its employer profile, or None"""
+        user = self.user
+        if not user.is_authenticated:
+            return None
+
+        # Reuse a profile loaded with the user (e.g. select_related('userprofile'))
+        if get_user_model().userprofile.related.is_cached(user):
+            return user.userprofile
+
+        try:
+            profile = UserProfile.objects.select_related('employer_profile').get(user_id=user.pk)
+        except UserProfile.DoesNotExist:
+            return None
+        # Sets the caches on both sides
+        user.userprofile = profile
+        return profile
+
+    @property
+    def role(self):
+        return self.profile.role if self.profile else None
+
+    @property
+    def employer_profile(self):
+        """EmployerProfile of an employer, or None"""
+        if self.role != 'employer':
+            return None
+        try:
+            return self.profile.employer_profile
+        except UserProfile.employer_profile.RelatedObjectDoesNotExist:
+            return None
+
+    @property
+    def is_employer(self):
+        return self.employer_profile is not None
+
+    @property
+    def is_candidate(self):
+        return self.role == 'candidate'
+
+    @property
+    def is_admin(self):
+        return self.user.is_superuser or self.role == 'admin'
+
+    @property
+    def has_cv_database_access(self):
+        return bool(self.employer_profile and self.employer_profile.has_cv_database_access)
+
+    @property
+    def employer_unread_notification_count(self):
+        # Maintained counter, loaded with the profile (no COUNT query per render)
+        return max(self.employer_profile.unread_notification_count, 0) if self.employer_profile else 0
+
+    @property
+    def candidate_unread_notification_count(self):
+        return max(self.profile.unread_notification_count, 0) if self.is_candidate else 0
@@ -6,6 +6,7 @@ from django.views.decorators.http import require_POST
 from django.http import JsonResponse
 from django.urls import reverse
 from ..models import UserProfile, EmployerProfile
+from ..viewer import Viewer
 import logging
 import secrets
 import string
@@ -16,7 +17,7 @@ def is_admin(user):
     """
     Check if a user is an admin (superuser or has admin role)
     """
-    return user.is_superuser or (hasattr(user, 'userprofile') and user.userprofile.role == 'admin')
+    return Viewer.for_user(user).is_admin
 
 @login_required
 @user_passes_test(is_admin)
@@ -11,6 +11,7 @@ from django.conf import settings
 from ..forms import RegistrationForm, EmployerRegistrationForm
 from ..models import UserProfile, EmployerProfile
 from .email_views import send_verification_email
+from ..viewer import Viewer
 import logging
 from django.urls import reverse
 from django.utils.translation import gettext_lazy as _
@@ -20,14 +21,9 @@ logger = logging.getLogger(__name__)
 def is_employer(user):
     """
     Check if a user has employer role and associated employer profile
+    (shares the request's Viewer, so repeated checks cost no queries)
     """
-    try:
-        return (user.is_authenticated and 
-                hasattr(user, 'userprofile') and 
-                user.userprofile.role == 'employer' and
-                hasattr(user.userprofile, 'employer_profile'))
-    except:
-        return False
+    return Viewer.for_user(user).is_employer
 
 def login_view(request):
     """Handle user login with email or username"""
@@ -1,71 +1,126 @@
 from django.shortcuts import render, redirect, get_object_or_404
+from django.urls import reverse
 from django.contrib.auth.decorators import login_required, user_passes_test
 from django.contrib import messages
 from django.views.decorators.http import require_POST
-from django.http import JsonResponse
-from core.models import JobListing, JobApplication, RejectionReason
-from core.repositories.job_repository import JobRepository
+from django.http import JsonResponse, StreamingHttpResponse
+from django.utils.translation import gettext_lazy as _
+from core.models import JobListing, JobApplication
 from core.repositories.application_repository import ApplicationRepository
 from core.repositories.notification_repository import NotificationRepository
+from core.pagination import KeysetPaginator, InvalidCursor
+from core.services.resume_export_service import ResumeExportService
+from core.services.application_status_service import ApplicationStatusService
+from core.services.reference_data_service import ReferenceDataService
 from .dashboard import is_employer
 import json
 import logging
 from django.contrib.contenttypes.models import ContentType
-from django.db.models import Q
 
 logger = logging.getLogger(__name__)
 
+# Applications shown per page of the applicant list
+APPLICATIONS_PAGE_SIZE = 50
+
 @login_required
 @user_passes_test(is_employer)
 def job_applications(request, job_id):
     """
-    View applications for a specific job
+    Display the applications for a specific job, one page at a time
     """
+    # Get the job and verify ownership (deleted jobs keep their applications)
+    job = get_object_or_404(JobListing.all_objects, id=job_id)
     employer_profile = request.user.userprofile.employer_profile
-    job = get_object_or_404(JobRepository.get_jobs_by_employer(employer_profile), id=job_id)
-    
-    # Get applications for this job
-    applications = ApplicationRepository.get_applications_by_job(job)
     
-    # Get all rejection reasons
-    rejection_reasons = RejectionReason.objects.all()
+    if job.employer != employer_profile:
+        messages.error(request, "You don't have permission to view applications for this job.")
+        return redirect('employer_dashboard')
     
-    # Filter by status if provided
+    # Filter by status tab and search by name or email if provided
     status_filter = request.GET.get('status')
-    if status_filter and status_filter != 'all':
-        applications = applications.filter(status=status_filter)
-    
-    # Search by name or email if provided
-    search_query = request.GET.get('search')
-    if search_query:
-        applications = applications.filter(
-            Q(user__first_name__icontains=search_query) | 
-            Q(user__last_name__icontains=search_query) | 
-            Q(user__email__icontains=search_query) |
-            Q(guest_name__icontains=search_query) |
-            Q(guest_email__icontains=search_query)
-        )
+    if status_filter not in dict(JobApplication.STATUS_CHOICES):
+        status_filter = None
+    search_query = request.GET.get('search', '').strip()
+    applications = ApplicationRepository.get_applications_by_job(
+        job.id, status_filter=status_filter, search_query=search_query
+    )
     
-    # Mark applications as read
-    for application in applications:
-        if not application.is_read:
-            application.is_read = True
-            application.save()
+    # Newest first; a stale or tampered cursor starts over at the first page
+    paginator = KeysetPaginator(applications, ('-applied_at', '-id'), APPLICATIONS_PAGE_SIZE)
+    cursor = request.GET.get('cursor')
+    try:
+        page = paginator.get_page(cursor)
+    except InvalidCursor:
+        cursor = None
+        page = paginator.get_page()
+    
+    params = request.GET.copy()
+    params.pop('cursor', None)
+    export_url = reverse('export_job_applications', args=[job.id])
+    if params:
+        export_url = f"{export_url}?{params.urlencode()}"
+    first_page_url = None
+    if cursor:
+        first_page_url = f"{request.path}?{params.urlencode()}" if params else request.path
+    next_page_url = None
+    if page.has_next:
+        params['cursor'] = page.next_cursor
+        next_page_url = f"{request.path}?{params.urlencode()}"
+    
+    # Mark the shown applications as read in one UPDATE
+    # (the instances keep their old flag, so this render still highlights new ones)
+    applications = page.object_list
+    ApplicationRepository.mark_applications_as_read([application.id for application in applications])
+    
+    # Mark all notifications for this job as read
+    NotificationRepository.mark_job_notifications_as_read(employer_profile, job_id)
     
-    # Mark applications as viewed
-    # for application in applications:
-    #     if not application.is_viewed:
-    #         application.is_viewed = True
-    #         application.save()
-    #         logger.info(f"Marked application {application.id} as viewed for job {job_id}")
+    # Counts for the status cards, from one grouped query
+    status_counts = ApplicationRepository.get_application_counts_by_status(job_id=job.id)
     
-    return render(request, 'core/job_applications.html', {
+    context = {
         'job': job,
         'applications': applications,
-        'rejection_reasons': rejection_reasons,
-        'status_filter': status_filter,
+        'total_applications': sum(status_counts.values()),
+        'review_applications': status_counts['განხილვის_პროცესში'],
+        'interview_applications': status_counts['გასაუბრება'],
+        'reserve_applications': status_counts['რეზერვი'],
+        'status_tabs': [('all', _('All'))] + list(JobApplication.STATUS_CHOICES),
+        'active_status': status_filter or 'all',
         'search_query': search_query,
-    })
+        'next_page_url': next_page_url,
+        'first_page_url': first_page_url,
+        'export_url': export_url,
+        'is_deleted': job.deleted_at is not None,
+    }
+    
+    return render(request, 'core/employer_applications.html', context)
+
+@login_required
+@user_passes_test(is_employer)
+def export_job_applications(request, job_id):
+    """
+    Download the resumes of a job's applicants as a ZIP with a CSV manifest.
+    Honours the same status tab and search as the applicant list.
+    """
+    job = get_object_or_404(JobListing.all_objects, id=job_id)
+    employer_profile = request.user.userprofile.employer_profile
+    
+    if job.employer != employer_profile:
+        messages.error(request, "You don't have permission to view applications for this job.")
+        return redirect('employer_dashboard')
+    
+    status_filter = request.GET.get('status')
+    if status_filter not in dict(JobApplication.STATUS_CHOICES):
+        status_filter = None
+    applications = ApplicationRepository.get_applications_by_job(
+        job.id, status_filter=status_filter, search_query=request.GET.get('search', '').strip()
+    )
+    
+    logger.info(f"Employer {employer_profile.id} exporting resumes for job {job.id}")
+    response = StreamingHttpResponse(ResumeExportService.stream_zip(applications), content_type='application/zip')
+    response['Content-Disposition'] = f'attachment; filename="job-{job.id}-applications.zip"'
+    return response
 
 @login_required
 @user_passes_test(is_employer)
@@ -106,16 +161,19 @@ def update_application_status(request, application_id):
             # Add new rejection reasons
             reasons = data.get('rejection_reasons', [])
             if isinstance(reasons, list):
+                reasons_by_id = ReferenceDataService.rejection_reasons_by_id()
                 for reason_id in reasons:
                     try:
                         # Get reason by ID instead of name
-                        reason = RejectionReason.objects.get(id=reason_id)
-                        application.rejection_reasons.add(reason)
-                    except RejectionReason.DoesNotExist:
-                        logger.warning(f"Rejection reason with ID {reason_id} not found")
-                    except ValueError:
+                        reason = reasons_by_id.get(int(reason_id))
+                    except (TypeError, ValueError):
                         # Handle case where the value might not be a valid integer
                         logger.warning(f"Invalid rejection reason ID format: {reason_id}")
+                        continue
+                    if reason is None:
+                        logger.warning(f"Rejection reason with ID {reason_id} not found")
+                        continue
+                    application.rejection_reasons.add(reason)
             
             # Add feedback if provided
             feedback = data.get('feedback', '')
@@ -131,12 +189,7 @@ def update_application_status(request, application_id):
         
         # Create notification for candidate if status changed
         if old_status != new_status and application.user:
-            notification_text = ''
-            
-            if new_status == 'გასაუბრება':
-                notification_text = f"თქვენი განაცხადი ვაკანსიაზე '{application.job.title}' გადავიდა გასაუბრების ეტაპზე"
-            elif new_status == 'რეზერვი':
-                notification_text = f"თქვენი განაცხადი ვაკანსიაზე '{application.job.title}' გადავიდა რეზერვში"
+            notification_text = ApplicationStatusService.status_notification_message(new_status, application.job.title)
             
             if notification_text:
                 NotificationRepository.create_application_status_notification(
@@ -150,6 +203,56 @@ def update_application_status(request, application_id):
         logger.error(f"Error updating application status: {str(e)}")
         return JsonResponse({'success': False, 'error': str(e)}, status=500)
 
+@login_required
+@user_passes_test(is_employer)
+@require_POST
+def bulk_update_application_status(request):
+    """
+    Update the status of many job applications at once
+    
+    Expects JSON: {"application_ids": [...], "status": "...",
+    "rejection_reasons": [...], "feedback": "..."} and returns the outcome per id.
+    """
+    employer_profile = request.user.userprofile.employer_profile
+    
+    try:
+        data = json.loads(request.body)
+    except ValueError:
+        return JsonResponse({'success': False, 'error': 'Invalid JSON'}, status=400)
+    
+    application_ids = data.get('application_ids')
+    if not isinstance(application_ids, list) or not application_ids:
+        return JsonResponse({'success': False, 'error': 'application_ids must be a non-empty list'}, status=400)
+    try:
+        application_ids = [int(application_id) for application_id in application_ids]
+    except (TypeError, ValueError):
+        return JsonResponse({'success': False, 'error': 'Invalid application id'}, status=400)
+    
+    rejection_reasons = data.get('rejection_reasons')
+    if rejection_reasons is not None:
+        if not isinstance(rejection_reasons, list):
+            return JsonResponse({'success': False, 'error': 'rejection_reasons must be a list'}, status=400)
+        try:
+            rejection_reasons = [int(reason_id) for reason_id in rejection_reasons]
+        except (TypeError, ValueError):
+            return JsonResponse({'success': False, 'error': 'Invalid rejection reason id'}, status=400)
+    
+    try:
+        results = ApplicationStatusService.bulk_update_status(
+            employer_profile,
+            application_ids,
+            data.get('status'),
+            rejection_reason_ids=rejection_reasons,
+            feedback=data.get('feedback', ''),
+        )
+    except ValueError as e:
+        return JsonResponse({'success': False, 'error': str(e)}, status=400)
+    
+    return JsonResponse({
+        'success': all(result['success'] for result in results.values()),
+        'results': {str(application_id): result for application_id, result in results.items()},
+    })
+
 @login_required
 @user_passes_test(is_employer)
 def application_detail(request, application_id):
@@ -163,7 +266,7 @@ def application_detail(request, application_id):
     )
     
     # Get all rejection reasons
-    rejection_reasons = RejectionReason.objects.all()
+    rejection_reasons = ReferenceDataService.rejection_reasons()
     
     # Mark as read if not already
     if not application.is_read:
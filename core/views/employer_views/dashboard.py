@@ -1,15 +1,14 @@
 from django.shortcuts import render
 from django.contrib.auth.decorators import login_required, user_passes_test
-from django.db.models import Count, Q
-from core.models import JobApplication, RejectionReason, JobListing
+from django.db.models import Q
+from core.models import JobApplication, JobListing
 from core.services.employer_service import EmployerService
+from core.services.application_stats_service import ApplicationStatsService
+from core.services.reference_data_service import ReferenceDataService
 import json
 import logging
-import calendar
-from collections import defaultdict
 from django.utils import timezone
-from datetime import timedelta
-from core.repositories.notification_repository import NotificationRepository
+from core.viewer import Viewer
 from django.core.serializers.json import DjangoJSONEncoder
 
 logger = logging.getLogger(__name__)
@@ -17,14 +16,9 @@ logger = logging.getLogger(__name__)
 def is_employer(user):
     """
     Check if a user has employer role and associated employer profile
+    (shares the request's Viewer, so repeated checks cost no queries)
     """
-    try:
-        return (user.is_authenticated and 
-                hasattr(user, 'userprofile') and 
-                user.userprofile.role == 'employer' and
-                hasattr(user.userprofile, 'employer_profile'))
-    except:
-        return False
+    return Viewer.for_user(user).is_employer
 
 @login_required
 @user_passes_test(is_employer)
@@ -49,43 +43,14 @@ def employer_home(request):
     ).select_related('job', 'user').order_by('-applied_at')[:5]
 
     # Get all rejection reasons
-    rejection_reasons = RejectionReason.objects.all()
+    rejection_reasons = ReferenceDataService.rejection_reasons()
 
-    # Chart data - Applications over time (last 6 months)
-    now = timezone.now()
-    six_months_ago = now - timedelta(days=180)
-    applications_by_month = JobApplication.objects.filter(
-        job__employer=employer_profile,
-        applied_at__gte=six_months_ago
-    ).extra({
-        'month': "EXTRACT(MONTH FROM applied_at)",
-        'year': "EXTRACT(YEAR FROM applied_at)"
-    }).values('month', 'year').annotate(count=Count('id')).order_by('year', 'month')
-    
-    # Format data for the chart
-    months_data = defaultdict(int)
-    for item in applications_by_month:
-        month_num = int(item['month'])
-        month_name = calendar.month_abbr[month_num]
-        year = int(item['year'])
-        key = f"{month_name} {year}"
-        months_data[key] = item['count']
-    
-    # Get the last 6 months in chronological order
-    last_6_months = []
-    for i in range(5, -1, -1):
-        month_date = now - timedelta(days=30 * i)
-        month_key = f"{calendar.month_abbr[month_date.month]} {month_date.year}"
-        last_6_months.append(month_key)
+    # Chart data, read from the daily application rollup in a single query
+    charts = ApplicationStatsService.get_employer_charts(employer_profile)
     
-    # Prepare chart data
-    chart_labels = last_6_months
-    chart_data = [months_data.get(month, 0) for month in last_6_months]
-    
-    # Application status distribution
-    status_distribution = JobApplication.objects.filter(
-        job__employer=employer_profile
-    ).values('status').annotate(count=Count('id'))
+    # Applications over time (last 6 months)
+    chart_labels = [label for label, _ in charts['months']]
+    chart_data = [count for _, count in charts['months']]
     
     status_labels = []
     status_data = []
@@ -107,38 +72,19 @@ def employer_home(request):
         },
     }
     
-    # Create a dictionary to store counts by status type
-    status_counts = {status: 0 for status in status_mapping.keys()}
-    
-    # Aggregate the status counts
-    for status in status_distribution:
-        if status['status'] in status_counts:
-            status_counts[status['status']] = status['count']
-    
     # Generate the arrays in a consistent order
     for status_key, status_info in status_mapping.items():
         status_labels.append(status_info['label'])
-        status_data.append(status_counts[status_key])
+        status_data.append(charts['status_counts'].get(status_key, 0))
         status_colors.append(status_info['color'])
     
     # Job category performance
-    category_performance = JobApplication.objects.filter(
-        job__employer=employer_profile
-    ).values('job__category').annotate(count=Count('id')).order_by('-count')[:5]
-    
-    category_labels = [item['job__category'] for item in category_performance]
-    category_data = [item['count'] for item in category_performance]
+    category_labels = [category for category, _ in charts['top_categories']]
+    category_data = [count for _, count in charts['top_categories']]
     
     # Applicant sources (registered vs guest)
-    registered_count = JobApplication.objects.filter(
-        job__employer=employer_profile,
-        user__isnull=False
-    ).count()
-    
-    guest_count = JobApplication.objects.filter(
-        job__employer=employer_profile,
-        user__isnull=True
-    ).count()
+    registered_count = charts['source_counts']['registered']
+    guest_count = charts['source_counts']['guest']
     
     source_labels = ['Registered Users', 'Guest Applications']
     source_data = [registered_count, guest_count]
@@ -222,16 +168,19 @@ def employer_dashboard(request):
     # Removed the .exclude(status='expired') to show expired jobs
     
     # Process jobs to add helper attributes for template
+    # Unread notification and application counts come annotated from the service,
+    # so this loop doesn't hit the database
     all_jobs = []
     
-    # Get notification counts
-    unread_notification_count = NotificationRepository.get_unread_notification_count(employer_profile)
+    # Maintained counter, loaded with the profile by the request's Viewer
+    unread_notification_count = Viewer.for_request(request).employer_unread_notification_count
     
+    now = timezone.now()
     for job in jobs:
         # Check expiration date and add a convenience attribute
         if job.expires_at:
             # Calculate days until expiration
-            days_until_expiration = (job.expires_at - timezone.now()).days
+            days_until_expiration = (job.expires_at - now).days
             
             # Job is expired if it's past the expiration date (but don't override extended_review status)
             job.is_expired_status = days_until_expiration < 0
@@ -239,21 +188,14 @@ def employer_dashboard(request):
             # Show days remaining (minimum 0)
             job.days_until_expiration_value = max(0, days_until_expiration)
             
-            # Update the status to 'expired' if the expiration date has passed but status isn't 'expired' yet
-            # Don't change status if it's already in extended_review
+            # Display past-due jobs as expired. The status itself is updated by the
+            # update_expired_jobs command, not while rendering the dashboard
             if job.is_expired_status and job.status != 'expired' and job.status != 'extended_review':
                 job.status = 'expired'
-                job.save(update_fields=['status'])
         else:
             job.is_expired_status = False
             job.days_until_expiration_value = None
         
-        # Add unread notification count for this job
-        job.unread_notification_count = NotificationRepository.get_unread_notification_count_by_job(
-            employer_profile=employer_profile,
-            job_id=job.id
-        )
-            
         all_jobs.append(job)
     
     # Get deleted jobs count for the template
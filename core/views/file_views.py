@@ -1,13 +1,12 @@
 import logging
-import boto3
-import os
 import mimetypes
 from botocore.exceptions import ClientError
 from django.http import HttpResponseRedirect, HttpResponseNotFound, HttpResponseForbidden, HttpResponse
 from django.contrib.auth.decorators import login_required
 from django.conf import settings
 from ..models import UserProfile, JobApplication
-from django.core.files.storage import default_storage
+from ..repositories.application_repository import ApplicationRepository
+from core.media.s3 import private_key, signed_url
 from django.utils.translation import gettext_lazy as _
 
 logger = logging.getLogger(__name__)
@@ -58,12 +57,10 @@ def serve_cv_file(request, user_id=None):
                     logger.warning(f"Employer {request.user.username} attempted to access CV for user {user_id} without an application")
                     return HttpResponseForbidden(_("You don't have permission to access this CV"))
                 
-                # Update application status to "ნანახი" if currently in "განხილვის_პროცესში" state
-                for application in applications:
-                    if not application.is_viewed:
-                        application.is_viewed = True
-                        application.save(update_fields=['is_viewed'])
-                        logger.info(f"Marked application {application.id} as viewed for user {user_id}")
+                # Mark this candidate's applications to the employer as viewed in one UPDATE
+                viewed_count = ApplicationRepository.mark_candidate_applications_as_viewed(user_id, employer_profile)
+                if viewed_count:
+                    logger.info(f"Marked {viewed_count} applications as viewed for user {user_id}")
                 
                 user_profile = target_profile
             except UserProfile.DoesNotExist:
@@ -76,7 +73,7 @@ def serve_cv_file(request, user_id=None):
             return HttpResponseNotFound(_("No CV found for this user"))
         
         # Get the file name for Content-Disposition header
-        file_name = os.path.basename(user_profile.cv.name)
+        file_name = user_profile.cv_display_name
         
         # If S3 is not enabled, serve the file directly
         if not getattr(settings, 'USE_S3', False):
@@ -93,73 +90,13 @@ def serve_cv_file(request, user_id=None):
                 # For viewing, redirect to the URL
                 return HttpResponseRedirect(user_profile.cv.url)
         
-        # For S3, create a signed URL directly with boto3
+        # For S3, sign the verified key with the shared client (no existence probe)
+        file_key = private_key(user_profile.cv, user_profile.cv_storage_key)
         try:
-            s3_client = boto3.client(
-                's3',
-                region_name=settings.AWS_S3_REGION_NAME,
-                aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-                aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY
-            )
-            
-            # Get the file path - this should handle both configurations
-            if hasattr(user_profile.cv, 'storage') and hasattr(user_profile.cv.storage, 'location'):
-                # Use full path with storage location
-                file_key = f"{user_profile.cv.storage.location}/{user_profile.cv.name}"
-                
-                # Sometimes we get duplicate media/ prefixes, so clean that up
-                file_key = file_key.replace('media/media/', 'media/')
-                
-                # Log the original path and the cleaned path
-                logger.info(f"Original CV path: {user_profile.cv.name}")
-                logger.info(f"Constructed S3 key with location: {file_key}")
-                
-                # Try alternative path formats if the file name starts with cvs/
-                if user_profile.cv.name.startswith('cvs/'):
-                    # The file might be stored directly without the media/private prefix
-                    alternative_key = user_profile.cv.name
-                    logger.info(f"Trying alternative S3 key: {alternative_key}")
-                    
-                    try:
-                        # Check if the file exists with the alternative key
-                        s3_client.head_object(Bucket=settings.AWS_STORAGE_BUCKET_NAME, Key=alternative_key)
-                        logger.info(f"File exists with alternative key: {alternative_key}")
-                        file_key = alternative_key
-                    except ClientError as e:
-                        if e.response['Error']['Code'] == '404':
-                            logger.warning(f"File not found with alternative key: {alternative_key}")
-                        else:
-                            logger.error(f"Error checking alternative key: {str(e)}")
-            else:
-                # Fallback to just the name
-                file_key = user_profile.cv.name
-                logger.info(f"Using fallback S3 key (just the name): {file_key}")
-            
-            logger.info(f"Generating signed URL for S3 key: {file_key}")
-            
-            # Generate a signed URL valid for 1 hour
-            params = {
-                'Bucket': settings.AWS_STORAGE_BUCKET_NAME,
-                'Key': file_key,
-            }
-            
-            # Add ResponseContentDisposition for download
-            if is_download:
-                params['ResponseContentDisposition'] = f'attachment; filename="{file_name}"'
-            
-            signed_url = s3_client.generate_presigned_url(
-                'get_object',
-                Params=params,
-                ExpiresIn=3600  # 1 hour in seconds
-            )
-            
-            logger.info(f"Generated signed URL successfully")
-            
-            # Redirect to the signed URL
-            return HttpResponseRedirect(signed_url)
-            
+            viewer = 'owner' if user_profile.user_id == request.user.id else 'employer'
+            return HttpResponseRedirect(signed_url(file_key, file_name, download=is_download, viewer=viewer))
         except ClientError as e:
-            logger.error(f"Error generating presigned URL: {str(e)}")
+            logger.error(f"Error generating presigned URL for {file_key}: {str(e)}")
             return HttpResponseNotFound(_("Error accessing the file"))
             
     except Exception as e:
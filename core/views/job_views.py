@@ -4,8 +4,15 @@ from django.db.models import Q, Count
 from django.core.paginator import Paginator, PageNotAnInteger, EmptyPage
 from ..models import JobListing, JobApplication, SavedJob, UserProfile, EmployerProfile
 from ..forms import JobListingForm
+from ..search import search_jobs, count_job_facets
+from ..pagination import KeysetPaginator, InvalidCursor
+from ..services.stats_service import PlatformStatsService
+from ..services.view_counter_service import ViewCounterService
+from ..services.similar_jobs_service import SimilarJobsService
 from django.contrib.auth.decorators import login_required
 from django.http import JsonResponse
+from django.template.loader import render_to_string
+from django.urls import reverse
 import logging
 from django.utils import timezone
 
@@ -17,9 +24,18 @@ def remove_from_query_string(query_dict, param):
     query_dict.pop(param, None)
     return '?' + query_dict.urlencode() if query_dict else '?'
 
-def job_list(request):
+# Jobs rendered per page / per infinite-scroll request
+JOB_LIST_PAGE_SIZE = 24
+
+def _filter_job_list(request):
     """
-    Display the job listing page with filtering options
+    Build the filtered job board queryset from the request parameters
+
+    Shared by the job list page and the endpoint that loads further pages,
+    so both always see the same set of jobs.
+
+    Returns:
+        tuple: (jobs queryset, filtered, active_filters, filter_remove_urls, show_filters)
     """
     # Show approved jobs and extended_review jobs that haven't expired yet
     # Use select_related to fetch employer in the same query
@@ -28,10 +44,8 @@ def job_list(request):
         Q(status='approved') | 
         Q(status='extended_review', expires_at__gt=timezone.now())
     ).select_related('employer').order_by(
-        # Custom ordering for premium levels
-        # This will put premium_plus first, then premium, then standard
-        # Since it's in reverse alphabetical order: standard < premium < premium_plus
-        '-premium_level', '-posted_at'
+        # premium_rank is 2 for premium_plus, 1 for premium and 0 for standard
+        '-premium_rank', '-posted_at'
     )
     
     # Filter out expired jobs
@@ -45,13 +59,9 @@ def job_list(request):
     show_filters = 'show_filters' in request.GET
     
     # Apply filters based on request parameters
-    if 'search' in request.GET and request.GET['search']:
-        search_term = request.GET['search']
-        jobs = jobs.filter(
-            Q(title__icontains=search_term) | 
-            Q(company__icontains=search_term) |
-            Q(description__icontains=search_term)
-        )
+    search_term = request.GET.get('search', '')
+    if search_term:
+        jobs = search_jobs(jobs, search_term)
         filtered = True
         active_filters['საძიებო სიტყვა'] = search_term
         filter_remove_urls['საძიებო სიტყვა'] = remove_from_query_string(request.GET, 'search')
@@ -152,15 +162,35 @@ def job_list(request):
     if not filtered and not show_filters:
         jobs = jobs.filter(premium_level__in=['premium', 'premium_plus'])
     
-    # After all filters are applied, ensure premium ordering is preserved
-    # This guarantees premium jobs always appear at the top even after filtering
-    jobs = jobs.order_by('-premium_level', '-posted_at')
+    return jobs, filtered, active_filters, filter_remove_urls, show_filters
+
+def _paginate_job_list(jobs):
+    """
+    Keyset paginator over the job board ordering
+
+    Premium jobs always appear at the top, search results are ranked by
+    relevance within each premium level and -id makes the order total.
+    """
+    if 'search_rank' in jobs.query.annotations:
+        ordering = ('-premium_rank', '-search_rank', '-posted_at', '-id')
+    else:
+        ordering = ('-premium_rank', '-posted_at', '-id')
+    return KeysetPaginator(jobs, ordering, JOB_LIST_PAGE_SIZE)
+
+def job_list(request):
+    """
+    Display the job listing page with filtering options
+    Only the first page of jobs is rendered; further pages are loaded by job_list_page
+    """
+    jobs, filtered, active_filters, filter_remove_urls, show_filters = _filter_job_list(request)
     
     # Get selected job preferences
     selected_job_preferences = request.GET.getlist('job_preferences')
     
-    # No pagination - display all jobs
-    jobs_page = jobs
+    # Render a bounded first page, the rest is fetched while scrolling
+    jobs_page = _paginate_job_list(jobs).get_page()
+    next_page_params = request.GET.copy()
+    next_page_params['cursor'] = jobs_page.next_cursor or ''
     
     # Check if user is an employer
     is_employer_user = False
@@ -171,19 +201,21 @@ def job_list(request):
         except:
             pass
     
-    # Count jobs by premium level for display in template
-    # These counts will be used to show/hide sections and display job counts
-    premium_plus_count = jobs.filter(premium_level='premium_plus').count()
-    premium_count = jobs.filter(premium_level='premium').count()
-    standard_count = jobs.filter(Q(premium_level='standard') | Q(premium_level__isnull=True)).count()
+    # Count jobs per filter option (premium level, category, location, ...) in one grouped query
+    # These counts are used to show/hide sections and to label the filter modal options
+    job_facets = count_job_facets(jobs)
+    premium_level_counts = job_facets['premium_level']
+    premium_plus_count = premium_level_counts.get('premium_plus', 0)
+    premium_count = premium_level_counts.get('premium', 0)
+    standard_count = premium_level_counts.get('standard', 0) + premium_level_counts.get(None, 0)
     
-    # Get real counts for statistics
-    total_jobs_count = JobListing.objects.filter(status='approved').count()
-    total_companies_count = EmployerProfile.objects.count()
-    total_candidates_count = UserProfile.objects.filter(role='candidate').count()
+    # Hero section statistics, served from cached counters
+    platform_stats = PlatformStatsService.get_stats()
     
     context = {
-        'jobs': jobs_page,
+        'jobs': jobs_page.object_list,
+        'has_more_jobs': jobs_page.has_next,
+        'next_page_url': f"{reverse('job_list_page')}?{next_page_params.urlencode()}" if jobs_page.has_next else '',
         'is_employer': is_employer_user,
         'job_categories': JobListing.CATEGORY_CHOICES,
         'job_locations': JobListing.LOCATION_CHOICES,
@@ -197,9 +229,10 @@ def job_list(request):
         'premium_plus_count': premium_plus_count,
         'premium_count': premium_count,
         'standard_count': standard_count,
-        'total_jobs_count': total_jobs_count,
-        'total_companies_count': total_companies_count,
-        'total_candidates_count': total_candidates_count,
+        'job_facets': job_facets,
+        'total_jobs_count': platform_stats['total_jobs_count'],
+        'total_companies_count': platform_stats['total_companies_count'],
+        'total_candidates_count': platform_stats['total_candidates_count'],
     }
     
     # Return the appropriate template based on the request type
@@ -207,6 +240,49 @@ def job_list(request):
     
     return render(request, template, context)
 
+def job_list_page(request):
+    """
+    Return the next page of the job board for infinite scrolling
+
+    Takes the same filter parameters as job_list plus the cursor of the last
+    rendered page and returns the card markup for desktop and mobile, grouped
+    by premium level so the client can append each group to its section.
+    """
+    cursor = request.GET.get('cursor', '')
+    if not cursor:
+        return JsonResponse({'success': False, 'error': 'Missing cursor'}, status=400)
+    
+    jobs = _filter_job_list(request)[0]
+    try:
+        jobs_page = _paginate_job_list(jobs).get_page(cursor)
+    except InvalidCursor:
+        return JsonResponse({'success': False, 'error': 'Invalid cursor'}, status=400)
+    
+    sections = {}
+    for level in ('premium_plus', 'premium', 'standard'):
+        level_jobs = [job for job in jobs_page if (job.premium_level or 'standard') == level]
+        if not level_jobs:
+            continue
+        sections[level] = {
+            'desktop': render_to_string(f'core/components/job_list/cards/{level}_card_list.html', {'jobs': level_jobs}, request=request),
+            'mobile': render_to_string(f'core/components/mobile/job_list/cards/{level}_card_list.html', {'jobs': level_jobs}, request=request),
+        }
+    
+    next_url = ''
+    if jobs_page.has_next:
+        next_page_params = request.GET.copy()
+        next_page_params['cursor'] = jobs_page.next_cursor
+        next_url = f"{reverse('job_list_page')}?{next_page_params.urlencode()}"
+    
+    return JsonResponse({
+        'success': True,
+        'sections': sections,
+        'count': len(jobs_page),
+        'has_more': jobs_page.has_next,
+        'next_cursor': jobs_page.next_cursor,
+        'next_url': next_url,
+    })
+
 def job_detail(request, job_id):
     """
     Display details for a specific job listing
@@ -220,16 +296,11 @@ def job_detail(request, job_id):
         id=job_id
     )
     
-    # Increment view count
-    job.view_count += 1
-    job.save(update_fields=['view_count'])
+    # Count the view, written to the database in batches
+    ViewCounterService.record_view(job)
     
-    # Get similar jobs based on category and experience, only show approved
-    # Also order by premium level
-    similar_jobs = JobListing.objects.filter(
-        status='approved',
-        category=job.category
-    ).exclude(id=job_id).select_related('employer').order_by('-premium_level', '-posted_at')[:5]
+    # Precomputed nearest neighbours (title, description, category, experience, location)
+    similar_jobs = SimilarJobsService.get_similar_jobs(job, limit=5)
     
     # Check if job is saved by user
     is_saved = False
@@ -288,7 +359,9 @@ def apply_job(request, job_id):
                     job=job,
                     user=request.user,
                     cover_letter=cover_letter,
-                    resume=request.user.userprofile.cv
+                    resume=request.user.userprofile.cv,
+                    resume_storage_key=request.user.userprofile.cv_storage_key,
+                    resume_file_name=request.user.userprofile.cv_file_name,
                 )
             else:
                 # For authenticated users without CV, resume is required
@@ -312,7 +385,8 @@ def apply_job(request, job_id):
             NotificationRepository.create_new_application_notification(
                 employer_profile=job.employer,
                 job=job,
-                message=message
+                message=message,
+                actor=applicant_name
             )
             
             messages.success(request, "Your application has been submitted successfully!")
@@ -343,7 +417,8 @@ def apply_job(request, job_id):
             NotificationRepository.create_new_application_notification(
                 employer_profile=job.employer,
                 job=job,
-                message=message
+                message=message,
+                actor=guest_name
             )
             
             messages.success(request, "Your application has been submitted successfully! Consider creating an account for better job tracking.")
@@ -26,14 +26,14 @@ def home_redirect(request):
 from django.shortcuts import redirect, render
 
 # Import the pricing models
-from core.models import PricingPackage, ComparisonTable
+from core.services.reference_data_service import ReferenceDataService
 
 def pricing(request):
     """Display the pricing packages page"""
-    pricing_packages = PricingPackage.objects.filter(is_active=True).prefetch_related('features').order_by('display_order')
+    pricing_packages = ReferenceDataService.pricing_packages()
     
     # Get the active comparison table with its rows
-    comparison_table = ComparisonTable.objects.filter(is_active=True).prefetch_related('rows').first()
+    comparison_table = ReferenceDataService.comparison_table()
     
     context = {
         'pricing_packages': pricing_packages,
@@ -0,0 +1,14 @@
+from django.http import HttpResponse
+from django.views.decorators.cache import never_cache
+
+
+@never_cache
+def notification_stream(request):
+    """
+    Fallback for the notification stream when the site runs under WSGI
+
+    Under ASGI jobsy.asgi routes this path to core.realtime.NotificationStream
+    before Django sees it. A 204 tells EventSource to stop reconnecting, so
+    WSGI deployments keep the page-load badge without retry traffic.
+    """
+    return HttpResponse(status=204)
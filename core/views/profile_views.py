@@ -8,7 +8,6 @@ from ..models import UserProfile, EmployerProfile, JobApplication, SavedJob, Job
 from ..forms import UserProfileForm, EmployerProfileForm
 from django.utils.translation import gettext_lazy as _
 import logging
-import os
 import tempfile
 import traceback
 from django.conf import settings
@@ -16,12 +15,12 @@ from django.core.files.storage import default_storage
 from django.core.files.base import ContentFile
 from jobsy.storage_backends import PrivateMediaStorage, PublicMediaStorage
 import mimetypes
-import boto3
 from botocore.exceptions import ClientError
 from django.utils import timezone
 from django.contrib.auth import logout
 import uuid
 from core.repositories.employer_repository import EmployerRepository
+from core.media.s3 import private_key, signed_url
 from core.repositories.notification_repository import NotificationRepository
 
 logger = logging.getLogger(__name__)
@@ -292,36 +291,14 @@ def view_cv_employer(request, profile_id):
         # Get the CV file
         cv_file = profile.cv
         
-        # Get the file name
-        file_name = os.path.basename(cv_file.name)
+        # Get the file name the candidate uploaded
+        file_name = profile.cv_display_name
         
         # Check if using S3
         if settings.USE_S3:
             try:
-                # For S3 storage, we need to create a signed URL
-                s3 = boto3.client(
-                    's3',
-                    aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-                    aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-                    region_name=settings.AWS_S3_REGION_NAME
-                )
-                
-                # The key should be the full path in S3
-                # If the path already has media/private/ prefix, use it directly
-                if cv_file.name.startswith('media/private/'):
-                    s3_key = cv_file.name
-                else:
-                    s3_key = f"media/private/{cv_file.name}"
-                
-                # Generate a signed URL
-                url = s3.generate_presigned_url(
-                    'get_object',
-                    Params={
-                        'Bucket': settings.AWS_STORAGE_BUCKET_NAME,
-                        'Key': s3_key
-                    },
-                    ExpiresIn=3600  # URL expires in 1 hour
-                )
+                # Sign the verified key with the shared client, no existence probe
+                url = signed_url(private_key(cv_file, profile.cv_storage_key), file_name, viewer='cv_database')
                 
                 # Redirect to the signed URL
                 return redirect(url)
@@ -21,5 +21,8 @@ if [ $? -ne 0 ]; then
     python manage.py migrate
 fi
 
-# Start the application with gunicorn and specify host binding
-exec gunicorn jobsy.wsgi:application --bind=0.0.0.0:$PORT 
\ No newline at end of file
+# Create the shared cache table (no-op if it exists)
+python manage.py createcachetable
+
+# Start the ASGI application (serves the notification stream) with uvicorn workers under gunicorn
+exec gunicorn jobsy.asgi:application -k uvicorn.workers.UvicornWorker --bind=0.0.0.0:$PORT 
\ No newline at end of file
@@ -2,6 +2,8 @@
 ASGI config for jobsy project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
+The notification stream is served by core.realtime.NotificationStream
+directly; every other request goes to Django.
 
 For more information on this file, see
 https://docs.djangoproject.com/en/5.1/howto/deployment/asgi/
@@ -13,4 +15,17 @@ from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'jobsy.settings')
 
-application = get_asgi_application() 
\ No newline at end of file
+django_application = get_asgi_application()
+
+# Imported after Django is set up, the stream needs the app registry
+from django.urls import reverse  # noqa: E402
+from core.realtime import NotificationStream  # noqa: E402
+
+NOTIFICATION_STREAM_PATH = reverse('notification_stream')
+notification_stream = NotificationStream()
+
+
+async def application(scope, receive, send):
+    if scope['type'] == 'http' and scope['path'] == NOTIFICATION_STREAM_PATH:
+        return await notification_stream(scope, receive, send)
+    return await django_application(scope, receive, send)
@@ -125,6 +125,20 @@ if USE_SQLITE_FALLBACK:
     }
     log_setting("Using SQLite database (fallback mode)")
 
+# Cache - shared by every worker and management command through the database,
+# so cached counters, locks and invalidations are seen by all processes (the
+# default LocMemCache is private to one process). The table is created by
+# `python manage.py createcachetable` (see deploy.sh).
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+        'LOCATION': os.environ.get('CACHE_TABLE', 'jobsy_cache'),
+        'OPTIONS': {
+            'MAX_ENTRIES': int(os.environ.get('CACHE_MAX_ENTRIES', 10000)),
+        },
+    }
+}
+
 # Authentication
 AUTHENTICATION_BACKENDS = [
     'social_core.backends.google.GoogleOAuth2',
@@ -1,5 +1,6 @@
 from django.conf import settings
 from storages.backends.s3boto3 import S3Boto3Storage
+from storages.utils import clean_name
 import os
 
 class StaticStorage(S3Boto3Storage):
@@ -16,4 +17,18 @@ class PrivateMediaStorage(S3Boto3Storage):
     file_overwrite = False
     custom_domain = False  # Use AWS S3 domain for signed URLs
     querystring_auth = True  # Ensure authentication is enabled for private files
-    querystring_expire = 3600  # URL valid for 1 hour 
\ No newline at end of file
+    querystring_expire = 3600  # URL valid for 1 hour
+
+    def url(self, name, parameters=None, expire=None, http_method=None):
+        # Plain GET URLs (template .url accesses) come from the presigned URL
+        # cache, so a page listing many files doesn't re-sign each one
+        if parameters or http_method:
+            return super().url(name, parameters=parameters, expire=expire, http_method=http_method)
+
+        from core.media.presign import presigned_urls
+        expire = self.querystring_expire if expire is None else expire
+        key = self._normalize_name(clean_name(name))
+        return presigned_urls.get(
+            self.bucket_name, key, None, 'storage', expire,
+            lambda: super(PrivateMediaStorage, self).url(name, expire=expire),
+        )
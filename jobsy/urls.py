@@ -3,6 +3,7 @@ from django.urls import path, include
 from django.conf import settings
 from django.conf.urls.static import static
 from core.admin import historical_data_view
+from core.views.notification_views import notification_stream
 from django.contrib.sitemaps.views import sitemap
 from core.sitemap import JobListingSitemap, BlogSitemap, StaticViewSitemap
 from django_ckeditor_5.views import upload_file
@@ -31,6 +32,8 @@ urlpatterns = [
     path('i18n/', include('django.conf.urls.i18n')),  # Add this for language switching
     path('admin/', admin.site.urls),
     path('admin/historical-data/', historical_data_view, name='admin_historical_data'),
+    # Server-Sent Events for notification badges (served by jobsy.asgi, see core.realtime)
+    path('notifications/stream/', notification_stream, name='notification_stream'),
     path('auth/', include('social_django.urls', namespace='social')),
     
     # CKEditor URLs
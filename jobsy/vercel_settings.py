@@ -74,3 +74,8 @@ EMAIL_USE_TLS = os.environ.get('EMAIL_USE_TLS', 'True') == 'True'
 EMAIL_HOST_USER = os.environ.get('EMAIL_HOST_USER', '')
 EMAIL_HOST_PASSWORD = os.environ.get('EMAIL_HOST_PASSWORD', '')
 DEFAULT_FROM_EMAIL = os.environ.get('DEFAULT_FROM_EMAIL', 'noreply@jobsight.ge')
+
+# A function instance may be frozen after a response and never resumed, so
+# buffered page views are written at the end of every request
+VIEW_COUNT_FLUSH_INTERVAL = 0
+VIEW_COUNT_FLUSH_THREAD = False